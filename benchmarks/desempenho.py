@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Suíte de Benchmarks dos Métodos de Análise - Transporte Urbano
+
+Mede tempo e pico de memória de cada método público de
+``AnaliseTransporte``, ``TestesHipoteses`` e ``VisualizacoesExecutivas``
+e dos pipelines completos (``executar_analise_completa``,
+``executar_todos_testes``, ``gerar_todas_visualizacoes``) sobre conjuntos
+sintéticos de 10^3 a 10^8 linhas e de 2 a 100 aplicativos.
+
+Para cada escala (linhas x aplicativos), os dados são gerados uma vez por
+``src.gerador`` (tempos gama com médias diferentes por aplicativo, semente
+fixa: os mesmos dados em qualquer máquina) e cada repetição usa um
+``DadosTransporte`` novo sobre os mesmos vetores, de modo que caches
+internos do conjunto (densidades, estatísticas) não passam de uma
+repetição para outra. A preparação (construção das classes) fica fora da
+medição, e uma execução de aquecimento (importações adiadas, caches de
+quantis) precede as cronometradas. O tempo é a mediana das repetições; o
+pico de memória vem de uma execução adicional sob ``tracemalloc`` (inclui
+os buffers do numpy, mas não os do renderizador Agg).
+
+Os resultados são gravados em JSON e comparados com
+``baseline_desempenho.json``: o script termina com código 1 se algum caso
+presente nos dois ficar mais lento (ou usar mais memória) que a baseline
+além da tolerância.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/desempenho.py                        # escalas 'rapido'
+    python benchmarks/desempenho.py --escalas completo     # 10^3 a 10^8 linhas
+    python benchmarks/desempenho.py --linhas 1e6 --apps 2 100 --casos 'ic_|testes'
+    python benchmarks/desempenho.py --atualizar            # regrava a baseline
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.analise_transporte import AnaliseTransporte  # noqa: E402
+from src.dados import DadosTransporte  # noqa: E402
+from src.gerador import GeradorTransporte, ParametrosApp, rotulos_apps  # noqa: E402
+from src.testes_hipoteses import TestesHipoteses  # noqa: E402
+from src.visualizacoes_executivas import VisualizacoesExecutivas  # noqa: E402
+
+DIRETORIO = Path(__file__).resolve().parent
+BASELINE = DIRETORIO / 'baseline_desempenho.json'
+RESULTADOS = DIRETORIO / 'resultados_desempenho.json'
+
+# Escalas pré-definidas: (linhas, aplicativos)
+ESCALAS = {
+    'rapido': [(10**3, 2), (10**3, 10), (10**5, 2), (10**5, 10)],
+    'completo': [(10**k, apps) for k in range(3, 9) for apps in (2, 10, 100)],
+}
+
+# Folgas absolutas: evitam falsos alarmes em medidas muito pequenas
+FOLGA_TEMPO = 0.02
+FOLGA_MEMORIA_MB = 2.0
+
+
+def gerar_conjunto(linhas: int, n_apps: int, semente: int = 42) -> tuple:
+    """
+    Gera dados sintéticos (``GeradorTransporte``) agrupados por aplicativo.
+
+    Args:
+        linhas (int): Total de corridas
+        n_apps (int): Número de aplicativos
+        semente (int): Semente do gerador
+
+    Returns:
+        tuple: (apps, espera, offsets, pesquisa)
+    """
+    # Tempos gama de forma 4, sem cauda. A e B com a diferença observada nos
+    # dados reais (efeito comparável entre escalas nos testes do par de
+    # referência); médias dos demais apps sorteadas
+    rng = np.random.default_rng(semente)
+    medias = np.concatenate([[7.5, 6.8], rng.uniform(6, 9, n_apps - 2)])
+    parametros = {app: ParametrosApp(float(media), 4.0, peso_cauda=0.0)
+                  for app, media in zip(rotulos_apps(n_apps), medias)}
+    gerador = GeradorTransporte(parametros, semente)
+    conjunto = gerador.conjunto(linhas)
+    return conjunto.apps, conjunto.espera, conjunto.offsets, gerador.pesquisa(150 * n_apps)
+
+
+def _analise(conjunto, saida, pesquisa):
+    return AnaliseTransporte(conjunto, saida, pesquisa=pesquisa, verboso=False)
+
+
+def _testes(conjunto, saida, pesquisa):
+    return TestesHipoteses(conjunto, pesquisa=pesquisa)
+
+
+def _visualizacoes(conjunto, saida, pesquisa):
+    return VisualizacoesExecutivas(conjunto, saida, pesquisa=pesquisa)
+
+
+# Casos: nome -> (construtor, chamada sobre o objeto, máximo de linhas)
+CASOS = {
+    'analise.estatisticas_descritivas': (_analise, lambda a: a.estatisticas_descritivas(), None),
+    'analise.estatisticas_por_app': (_analise, lambda a: a.estatisticas_por_app(), None),
+    'analise.ic_media': (_analise, lambda a: a.ic_media(a.app_a), None),
+    'analise.ic_diferenca_medias_welch': (
+        _analise, lambda a: a.ic_diferenca_medias_welch(a.app_a, a.app_b), None),
+    'analise.ic_diferenca_bootstrap': (
+        _analise, lambda a: a.ic_diferenca_bootstrap(a.app_a, a.app_b, semente=42), 10**5),
+    'analise.ic_variancia': (_analise, lambda a: a.ic_variancia(a.app_a), None),
+    'analise.ic_razao_variancias': (
+        _analise, lambda a: a.ic_razao_variancias(a.app_a, a.app_b), None),
+    'analise.ic_proporcao_wald': (_analise, lambda a: a.ic_proporcao_wald(132, 150), None),
+    'analise.ic_diferenca_proporcoes_wald': (
+        _analise, lambda a: a.ic_diferenca_proporcoes_wald(132, 150, 120, 150), None),
+    'analise.ic_media_lote': (_analise, lambda a: a.ic_media_lote(), None),
+    'analise.ic_diferenca_medias_welch_lote': (
+        _analise, lambda a: a.ic_diferenca_medias_welch_lote(), None),
+    'analise.ic_variancia_lote': (_analise, lambda a: a.ic_variancia_lote(), None),
+    'analise.ic_razao_variancias_lote': (_analise, lambda a: a.ic_razao_variancias_lote(), None),
+    'analise.ic_proporcao_lote': (_analise, lambda a: a.ic_proporcao_lote(), None),
+    'analise.ic_diferenca_proporcoes_lote': (
+        _analise, lambda a: a.ic_diferenca_proporcoes_lote(), None),
+    'analise.calcular_sla': (_analise, lambda a: a.calcular_sla(a.app_a), None),
+    'analise.curva_sla': (_analise, lambda a: a.curva_sla(), None),
+    'analise.relatorio': (_analise, lambda a: a.relatorio(), None),
+    'analise.gerar_visualizacoes': (_analise, lambda a: a.gerar_visualizacoes(), None),
+    'testes.teste_normalidade': (_testes, lambda t: t.teste_normalidade(), None),
+    'testes.teste_homogeneidade_variancias': (
+        _testes, lambda t: t.teste_homogeneidade_variancias(), None),
+    'testes.teste_diferenca_medias': (_testes, lambda t: t.teste_diferenca_medias(), None),
+    'testes.teste_diferenca_variancias': (_testes, lambda t: t.teste_diferenca_variancias(), None),
+    'testes.teste_diferenca_proporcoes': (_testes, lambda t: t.teste_diferenca_proporcoes(), None),
+    'testes.poder_estatistico': (_testes, lambda t: t.poder_estatistico(), None),
+    'testes.planejar_amostra': (_testes, lambda t: t.planejar_amostra(semente=42), 10**4),
+    'testes.monitor_sequencial': (_testes, lambda t: t.monitor_sequencial(), None),
+    'testes.relatorio': (_testes, lambda t: t.relatorio(), None),
+    'testes.comparar_pares': (_testes, lambda t: t.comparar_pares(), None),
+    'visualizacoes.calcular_metricas_executivas': (
+        _visualizacoes, lambda v: v.calcular_metricas_executivas(), None),
+    'visualizacoes.dashboard_executivo': (_visualizacoes, lambda v: v.dashboard_executivo(), None),
+    'visualizacoes.grafico_boxplot_executivo': (
+        _visualizacoes, lambda v: v.grafico_boxplot_executivo(), None),
+    'pipeline.executar_analise_completa': (
+        _analise, lambda a: a.executar_analise_completa(), None),
+    'pipeline.executar_todos_testes': (_testes, lambda t: t.executar_todos_testes(), None),
+    'pipeline.gerar_todas_visualizacoes': (
+        _visualizacoes, lambda v: v.gerar_todas_visualizacoes(), None),
+}
+
+
+def medir_caso(caso: str, dados: tuple, saida: Path, repeticoes: int,
+               memoria: bool = True) -> dict:
+    """
+    Mede tempo (mediana) e pico de memória de um caso em uma escala.
+
+    Args:
+        caso (str): Nome do caso em ``CASOS``
+        dados (tuple): Saída de ``gerar_conjunto``
+        saida (Path): Diretório das figuras geradas
+        repeticoes (int): Execuções cronometradas
+        memoria (bool): Se False, não mede o pico de memória
+
+    Returns:
+        dict: tempo_s, tempos e pico_mb (None sem ``memoria``)
+    """
+    construtor, chamada, _ = CASOS[caso]
+    apps, espera, offsets, pesquisa = dados
+
+    def preparar():
+        return construtor(DadosTransporte(apps, espera, offsets), saida, pesquisa)
+
+    tempos, pico_mb = [], None
+    with contextlib.redirect_stdout(io.StringIO()):
+        chamada(preparar())
+        for _ in range(repeticoes):
+            objeto = preparar()
+            inicio = time.perf_counter()
+            chamada(objeto)
+            tempos.append(time.perf_counter() - inicio)
+
+        if memoria:
+            objeto = preparar()
+            tracemalloc.start()
+            try:
+                chamada(objeto)
+                pico_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            finally:
+                tracemalloc.stop()
+    return {'tempo_s': statistics.median(tempos), 'tempos': tempos, 'pico_mb': pico_mb}
+
+
+def executar_suite(escalas: list, casos: list, repeticoes: int, memoria: bool = True) -> dict:
+    """
+    Executa os casos em todas as escalas, informando o progresso.
+
+    Args:
+        escalas (list): Pares (linhas, aplicativos)
+        casos (list): Nomes dos casos
+        repeticoes (int): Execuções cronometradas por caso
+        memoria (bool): Se False, não mede o pico de memória
+
+    Returns:
+        dict: {"<caso>@<linhas>x<apps>": medida}
+    """
+    resultados = {}
+    with tempfile.TemporaryDirectory() as temporario:
+        saida = Path(temporario)
+        for linhas, n_apps in escalas:
+            dados = gerar_conjunto(linhas, n_apps)
+            print(f"\n{linhas:,} linhas x {n_apps} aplicativos")
+            for caso in casos:
+                maximo = CASOS[caso][2]
+                if maximo is not None and linhas > maximo:
+                    continue
+                medida = medir_caso(caso, dados, saida, repeticoes, memoria)
+                chave = f"{caso}@{linhas}x{n_apps}"
+                resultados[chave] = {'caso': caso, 'linhas': linhas, 'apps': n_apps, **medida}
+                pico = f"{medida['pico_mb']:>10.1f} MB" if memoria else ''
+                print(f"  {caso:<45}{medida['tempo_s'] * 1000:>12.1f} ms{pico}")
+            del dados
+    return resultados
+
+
+def comparar(resultados: dict, baseline: dict, tolerancia: float,
+             tolerancia_memoria: float) -> list:
+    """
+    Casos que pioraram em relação à baseline.
+
+    Args:
+        resultados (dict): Medidas atuais
+        baseline (dict): Medidas de referência (mesmo formato)
+        tolerancia (float): Piora relativa aceita no tempo
+        tolerancia_memoria (float): Piora relativa aceita no pico de memória
+
+    Returns:
+        list: (chave, métrica, atual, referência) das regressões
+    """
+    regressoes = []
+    for chave, medida in resultados.items():
+        referencia = baseline.get(chave)
+        if referencia is None:
+            continue
+        if medida['tempo_s'] > referencia['tempo_s'] * (1 + tolerancia) + FOLGA_TEMPO:
+            regressoes.append((chave, 'tempo_s', medida['tempo_s'], referencia['tempo_s']))
+        if medida['pico_mb'] is None or referencia['pico_mb'] is None:
+            continue
+        if medida['pico_mb'] > referencia['pico_mb'] * (1 + tolerancia_memoria) + FOLGA_MEMORIA_MB:
+            regressoes.append((chave, 'pico_mb', medida['pico_mb'], referencia['pico_mb']))
+    return regressoes
+
+
+def _metadados() -> dict:
+    return {'python': platform.python_version(), 'numpy': np.__version__,
+            'plataforma': platform.platform(), 'processador': platform.processor()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--escalas', default='rapido', choices=list(ESCALAS),
+                        help='conjunto de escalas (default: %(default)s)')
+    parser.add_argument('--linhas', type=float, nargs='+',
+                        help='linhas por escala (substitui --escalas; ex.: 1e6 1e7)')
+    parser.add_argument('--apps', type=int, nargs='+', default=[2, 10],
+                        help='aplicativos por escala, com --linhas (default: 2 10)')
+    parser.add_argument('--casos', default=None,
+                        help='expressão regular dos casos a executar (default: todos)')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--sem-memoria', action='store_true',
+                        help='não mede o pico de memória (uma execução a menos por caso)')
+    parser.add_argument('--tolerancia', type=float, default=0.25,
+                        help='piora relativa aceita no tempo (default: %(default)s)')
+    parser.add_argument('--tolerancia-memoria', type=float, default=0.10,
+                        help='piora relativa aceita no pico de memória (default: %(default)s)')
+    parser.add_argument('--saida', type=Path, default=RESULTADOS,
+                        help='JSON com os resultados (default: benchmarks/resultados_desempenho.json)')
+    parser.add_argument('--atualizar', action='store_true',
+                        help='incorpora os resultados medidos à baseline')
+    args = parser.parse_args()
+
+    if args.linhas:
+        escalas = [(int(linhas), apps) for linhas in args.linhas for apps in args.apps]
+    else:
+        escalas = ESCALAS[args.escalas]
+    casos = [caso for caso in CASOS if args.casos is None or re.search(args.casos, caso)]
+    if not casos:
+        parser.error(f"nenhum caso corresponde a {args.casos!r}")
+
+    resultados = executar_suite(escalas, casos, args.repeticoes, not args.sem_memoria)
+    documento = {'metadados': _metadados(), 'resultados': resultados}
+    args.saida.write_text(json.dumps(documento, indent=2) + '\n')
+    print(f"\nResultados gravados em {args.saida}")
+
+    baseline = json.loads(BASELINE.read_text())['resultados'] if BASELINE.exists() else {}
+    if args.atualizar:
+        baseline.update(resultados)
+        BASELINE.write_text(json.dumps({'metadados': _metadados(), 'resultados': baseline},
+                                       indent=2) + '\n')
+        print(f"Baseline gravada em {BASELINE}")
+        return 0
+
+    regressoes = comparar(resultados, baseline, args.tolerancia, args.tolerancia_memoria)
+    comparados = sum(chave in baseline for chave in resultados)
+    print(f"Comparados com a baseline: {comparados} de {len(resultados)} casos")
+    for chave, metrica, atual, referencia in regressoes:
+        print(f"  REGRESSÃO {chave}: {metrica} {atual:.4g} (baseline {referencia:.4g})")
+    return 1 if regressoes else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
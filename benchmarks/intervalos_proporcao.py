@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark do Motor de Intervalos para Proporções - Transporte Urbano
+
+Compara ``intervalos.limites_proporcao`` (todos os segmentos em uma
+chamada) com um laço Python que calcula o intervalo segmento a segmento,
+como faria ``VisualizacoesExecutivas._calcular_ic_proporcao`` aplicado a
+cada célula: quantil normal por ``scipy.stats.norm.ppf`` e, no método
+exato, ``scipy.stats.beta.ppf`` escalar.
+
+Os segmentos imitam a pesquisa por cidade x dia: tamanhos de 1 a 300
+respondentes e aprovação em torno de 90% (semente fixa), incluindo
+segmentos com 0% e 100% de aprovação. Para cada método e número de
+segmentos, o script mostra o tempo (mediana das repetições) das duas
+versões, o ganho e a maior diferença entre os limites; termina com código
+1 se alguma diferença passar de 1e-9.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/intervalos_proporcao.py
+    python benchmarks/intervalos_proporcao.py --segmentos 1000 100000 --metodos wilson
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+import argparse
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.intervalos import METODOS_PROPORCAO, limites_proporcao  # noqa: E402
+
+TOLERANCIA = 1e-9
+
+
+def gerar_segmentos(n_segmentos: int, semente: int = 42) -> tuple:
+    """
+    Contagens (x, n) de segmentos pequenos com aprovação alta.
+
+    Args:
+        n_segmentos (int): Número de segmentos
+        semente (int): Semente do gerador
+
+    Returns:
+        tuple: (x, n) como arrays int64
+    """
+    rng = np.random.default_rng(semente)
+    n = rng.integers(1, 301, n_segmentos)
+    x = rng.binomial(n, rng.uniform(0.8, 0.97, n_segmentos))
+    x[:n_segmentos // 100] = n[:n_segmentos // 100]
+    x[-(n_segmentos // 1000):] = 0
+    return x, n
+
+
+def limites_laco(x: int, n: int, confianca: float, metodo: str) -> tuple:
+    """Limites de um segmento, com as fórmulas escalares (referência do laço)."""
+    alpha = 1 - confianca
+    if metodo == 'clopper_pearson':
+        li = stats.beta.ppf(alpha / 2, x, n - x + 1) if x > 0 else 0.0
+        ls = stats.beta.ppf(1 - alpha / 2, x + 1, n - x) if x < n else 1.0
+        return li, ls
+    z = stats.norm.ppf(1 - alpha / 2)
+    if metodo == 'wald':
+        p = x / n
+        me = z * math.sqrt(p * (1 - p) / n)
+        return p - me, p + me
+    if metodo == 'wilson':
+        centro = (x + z * z / 2) / (n + z * z)
+        me = z / (n + z * z) * math.sqrt(x * (n - x) / n + z * z / 4)
+        return centro - me, centro + me
+    n_ajustado = n + z * z
+    p_ajustada = (x + z * z / 2) / n_ajustado
+    me = z * math.sqrt(p_ajustada * (1 - p_ajustada) / n_ajustado)
+    return max(p_ajustada - me, 0.0), min(p_ajustada + me, 1.0)
+
+
+def cronometrar(funcao, repeticoes: int) -> tuple:
+    """Mediana do tempo (s) de ``funcao()`` e o resultado da última execução."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos), resultado
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--segmentos', type=int, nargs='+', default=[1_000, 10_000, 50_000])
+    parser.add_argument('--metodos', nargs='+', default=list(METODOS_PROPORCAO),
+                        choices=METODOS_PROPORCAO)
+    parser.add_argument('--confianca', type=float, default=0.95)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    # Aquecimento: carrega scipy e o cache de quantis antes das medidas
+    limites_proporcao(np.array([1]), np.array([2]), args.confianca, 'clopper_pearson')
+
+    falhou = False
+    print(f"{'Método':<17}{'Segmentos':>10}{'Laço (ms)':>12}{'Lote (ms)':>12}"
+          f"{'Ganho':>9}{'Máx. dif.':>12}")
+    for metodo in args.metodos:
+        for n_segmentos in args.segmentos:
+            x, n = gerar_segmentos(n_segmentos)
+            # O laço é lento: poucas repetições bastam para a mediana
+            t_laco, laco = cronometrar(
+                lambda: np.array([limites_laco(int(xi), int(ni), args.confianca, metodo)
+                                  for xi, ni in zip(x, n)]),
+                max(1, args.repeticoes // 2))
+            t_lote, (li, ls) = cronometrar(
+                lambda: limites_proporcao(x, n, args.confianca, metodo), args.repeticoes)
+            diferenca = max(np.abs(li - laco[:, 0]).max(), np.abs(ls - laco[:, 1]).max())
+            falhou |= bool(diferenca > TOLERANCIA)
+            print(f"{metodo:<17}{n_segmentos:>10}{t_laco * 1000:>12.1f}{t_lote * 1000:>12.2f}"
+                  f"{t_laco / t_lote:>8.0f}x{diferenca:>12.1e}")
+    return 1 if falhou else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
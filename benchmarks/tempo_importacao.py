@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark do Tempo de Importação do Pacote - Transporte Urbano
+
+Mede, em interpretadores novos, o tempo de ``import src`` e da importação
+das classes principais, e verifica que nenhuma dependência pesada
+(matplotlib, seaborn, pandas, scipy.stats) é efetivamente executada nessa
+etapa. Os tempos são comparados com ``baseline_importacao.json``; o script
+termina com código 1 se algum tempo piorar além da tolerância ou se uma
+dependência pesada for carregada.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/tempo_importacao.py
+    python benchmarks/tempo_importacao.py --atualizar   # regrava a baseline
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+BASELINE = Path(__file__).resolve().parent / 'baseline_importacao.json'
+
+CENARIOS = {
+    'import_src': 'import src',
+    'classes_principais': ('from src import AnaliseTransporte, TestesHipoteses, '
+                           'VisualizacoesExecutivas'),
+}
+
+MODULOS_PESADOS = ('matplotlib', 'seaborn', 'pandas', 'scipy.stats')
+
+# Folga absoluta (s): evita falsos alarmes em tempos de poucos milissegundos
+FOLGA_ABSOLUTA = 0.02
+
+# Mede no processo filho e informa quais módulos pesados foram executados
+# (um módulo preguiçoso ainda não carregado não conta)
+_SONDA = """
+import sys, time, json
+t0 = time.perf_counter()
+{codigo}
+tempo = time.perf_counter() - t0
+carregados = [m for m in {pesados!r}
+              if m in sys.modules and type(sys.modules[m]).__name__ != '_LazyModule']
+print(json.dumps({{'tempo': tempo, 'carregados': carregados}}))
+"""
+
+
+def medir(codigo: str, repeticoes: int) -> dict:
+    """
+    Executa o código em interpretadores novos e retorna a mediana do tempo.
+
+    Args:
+        codigo (str): Instruções de importação
+        repeticoes (int): Número de interpretadores
+
+    Returns:
+        dict: tempo (s, mediana) e módulos pesados carregados
+    """
+    tempos, carregados = [], set()
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, '-c', _SONDA.format(codigo=codigo, pesados=MODULOS_PESADOS)],
+            cwd=RAIZ, capture_output=True, text=True, check=True
+        ).stdout
+        resultado = json.loads(saida.strip().splitlines()[-1])
+        tempos.append(resultado['tempo'])
+        carregados.update(resultado['carregados'])
+    return {'tempo': statistics.median(tempos), 'carregados': sorted(carregados)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeticoes', type=int, default=7)
+    parser.add_argument('--tolerancia', type=float, default=0.5,
+                        help='piora relativa aceita sobre a baseline (default: 0.5)')
+    parser.add_argument('--atualizar', action='store_true',
+                        help='regrava a baseline com os tempos medidos')
+    args = parser.parse_args()
+
+    medidas = {nome: medir(codigo, args.repeticoes) for nome, codigo in CENARIOS.items()}
+    baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+
+    falhou = False
+    print(f"{'Cenário':<22}{'Tempo (ms)':>12}{'Baseline (ms)':>15}  Status")
+    for nome, medida in medidas.items():
+        referencia = baseline.get(nome)
+        status = 'OK'
+        if medida['carregados']:
+            status = f"CARREGOU {', '.join(medida['carregados'])}"
+            falhou = True
+        elif referencia is not None and medida['tempo'] > referencia * (1 + args.tolerancia) + FOLGA_ABSOLUTA:
+            status = 'REGRESSÃO'
+            falhou = True
+        ref_txt = f"{referencia * 1000:.1f}" if referencia is not None else '-'
+        print(f"{nome:<22}{medida['tempo'] * 1000:>12.1f}{ref_txt:>15}  {status}")
+
+    if args.atualizar:
+        BASELINE.write_text(json.dumps({nome: round(m['tempo'], 4)
+                                        for nome, m in medidas.items()}, indent=2) + '\n')
+        print(f"\nBaseline gravada em {BASELINE}")
+        return 0
+    return 1 if falhou else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,9 +6,30 @@ aplicativos de transporte urbano, incluindo análise de tempo de espera,
 testes de hipóteses e visualizações executivas.
 
 Módulos:
+    _importacao: Importação sob demanda de dependências pesadas
+    dados: Carregamento compartilhado dos dados e armazém binário mapeável (.transp)
+    streaming: Estatísticas descritivas em passagem única (blocos)
+    particoes: Análise e testes fora da memória sobre shards (map-reduce)
+    pesquisa: Microdados da pesquisa agregados por app e segmento (bincount)
+    gerador: Dados sintéticos reprodutíveis (corridas e respondentes) para testes de carga
+    intervalos: Intervalos de confiança vetorizados (grupos x níveis)
+    comparacoes: Welch e teste Z entre todos os pares, com ajuste Holm/BH
+    valores_criticos: Cache LRU de quantis t, qui-quadrado, F e normal
+    bootstrap: Intervalos bootstrap (percentil e BCa) para diferenças
+    permutacao: Testes de permutação com parada sequencial
+    poder: Poder estatístico e tamanho amostral (fórmulas e simulação)
+    sequencial: Testes A/B sequenciais (mSPRT) com p-valores sempre válidos
+    sla: Curvas de SLA (ECDF) com bandas simultâneas DKW
+    densidade: KDE binado por FFT (grades compartilhadas entre figuras)
+    pontos: Camada de pontos agregada (subamostra com caudas ou faixa de densidade)
+    instrumentacao: Instrumentação por etapas (tempo, CPU, memória) e trace Chrome/Perfetto
+    renderizacao: Renderização de figuras (Agg, perfis de qualidade, paralela)
+    resultados: Resultados tipados (tabelas colunares) e exportação JSONL/Parquet/Arrow
+    cache: Cache de resultados e figuras endereçado por conteúdo (com despejo)
     analise_transporte: Análise estatística principal
     testes_hipoteses: Testes de hipóteses complementares
     visualizacoes_executivas: Geração de gráficos e dashboards
+    cli: Linha de comando unificada (``python -m src``)
 
 Autor: Diogo Da Silva Rego
 Disciplina: Inferência Estatística I - UFPB CCEN
@@ -18,12 +39,37 @@ __version__ = "1.0.0"
 __author__ = "Diogo Da Silva Rego"
 __email__ = "diogo.rego@academico.ufpb.br"
 
-from .analise_transporte import AnaliseTransporte
-from .testes_hipoteses import TestesHipoteses
-from .visualizacoes_executivas import VisualizacoesExecutivas
+import importlib
 
-__all__ = [
-    "AnaliseTransporte",
-    "TestesHipoteses", 
-    "VisualizacoesExecutivas"
-]
+# Nome exportado -> módulo que o define. Os módulos só são importados no
+# primeiro acesso (PEP 562), de modo que ``import src`` não carrega
+# matplotlib, pandas ou scipy.stats.
+_EXPORTACOES = {
+    "DadosTransporte": ".dados",
+    "estatisticas_streaming": ".streaming",
+    "resumir_particoes": ".particoes",
+    "AnaliseParticionada": ".particoes",
+    "TestesParticionados": ".particoes",
+    "carregar_pesquisa": ".pesquisa",
+    "GeradorTransporte": ".gerador",
+    "cache_criticos": ".valores_criticos",
+    "AnaliseTransporte": ".analise_transporte",
+    "TestesHipoteses": ".testes_hipoteses",
+    "VisualizacoesExecutivas": ".visualizacoes_executivas",
+    "Relatorio": ".resultados",
+    "ResultadoTeste": ".resultados",
+}
+
+__all__ = list(_EXPORTACOES)
+
+
+def __getattr__(nome: str):
+    if nome in _EXPORTACOES:
+        valor = getattr(importlib.import_module(_EXPORTACOES[nome], __name__), nome)
+        globals()[nome] = valor
+        return valor
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,7 @@
+"""Permite executar o pacote com ``python -m src`` (ver ``cli``)."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
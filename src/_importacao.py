@@ -0,0 +1,38 @@
+"""
+Importação sob demanda de dependências pesadas.
+
+``importar_sob_demanda('scipy.stats')`` devolve o módulo sem executá-lo:
+o código do módulo só roda no primeiro acesso a um atributo (por exemplo,
+``stats.norm``). Assim, importar o pacote para usar apenas parte das
+análises não paga o custo de inicialização de pandas ou scipy.stats.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def importar_sob_demanda(nome: str) -> ModuleType:
+    """
+    Retorna um módulo carregado apenas no primeiro acesso a um atributo.
+
+    Args:
+        nome (str): Nome absoluto do módulo (ex.: 'scipy.stats')
+
+    Returns:
+        ModuleType: O módulo (já carregado, se outro código o importou)
+    """
+    if nome in sys.modules:
+        return sys.modules[nome]
+    spec = importlib.util.find_spec(nome)
+    if spec is None:
+        raise ModuleNotFoundError(f"Módulo {nome!r} não encontrado", name=nome)
+    carregador = importlib.util.LazyLoader(spec.loader)
+    spec.loader = carregador
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nome] = modulo
+    carregador.exec_module(modulo)
+    return modulo
@@ -12,29 +12,430 @@ Matrícula: 20240045381
 Data: 23/09/2025
 """
 
-import pandas as pd
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from scipy.stats import t, chi2, f, norm
-from scipy.stats import gaussian_kde, probplot
 import warnings
 import os
 from pathlib import Path
+from typing import Optional, Sequence, Union
+
+if __package__ in (None, ''):
+    # Execução direta (python src/analise_transporte.py): as importações relativas
+    # exigem o pacote, então a raiz do repositório entra no path
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    import src  # noqa: F401
+    __package__ = 'src'
+
+from ._importacao import importar_sob_demanda
+from .dados import DadosTransporte, estatisticas_agrupadas
+from . import bootstrap, intervalos
+from .intervalos import NIVEIS_PADRAO
+from .cache import CacheResultados
+from .renderizacao import PERFIL_PADRAO, TarefaFigura, obter_perfil, renderizar
+from .instrumentacao import etapa, instrumentado
+from .pesquisa import FontePesquisa, obter_pesquisa
+from .resultados import Relatorio
+from .sla import GRADE_PADRAO, CurvaSLA
+from .valores_criticos import cache_criticos
+
+pd = importar_sob_demanda('pandas')
 
 warnings.filterwarnings('ignore')
 
-# Configuração para visualizações
-plt.rcParams.update({
+# Configuração para visualizações (aplicada a cada figura, sem alterar os
+# rcParams globais)
+ESTILO_ANALISE = ({
     'font.size': 10,
     'figure.figsize': (12, 8),
     'axes.grid': True,
     'grid.alpha': 0.3
-})
+},)
+
+# Tabelas de ``AnaliseTransporte.relatorio``, na ordem do relatório impresso
+SECOES = ('descritivas', 'ic_media', 'ic_diferenca_medias', 'ic_variancia',
+          'ic_razao_variancias', 'ic_proporcao', 'ic_diferenca_proporcoes', 'sla')
+
+
+class _AnaliseResumos(ABC):
+    """
+    Relatório da análise a partir das estatísticas de cada aplicativo.
+    
+    Estatísticas descritivas, intervalos em lote, curva de SLA e relatório
+    impresso dependem apenas de ``_momentos`` (vetores por aplicativo), da
+    curva ``_curva`` e da pesquisa; as classes concretas os obtêm das
+    observações (``AnaliseTransporte``) ou de resumos combináveis
+    (``particoes.AnaliseParticionada``).
+    
+    Attributes:
+        apps (list): Rótulos dos aplicativos
+        pesquisa (dict): Dados da pesquisa de satisfação
+        conjunto (DadosTransporte): Dados da chave do cache (ou None)
+        cache (CacheResultados): Cache de resultados (ou None)
+    """
+    
+    def _pares(self, apps: Optional[list] = None) -> list:
+        """Pares (referência, outro) comparados nas seções de diferenças."""
+        apps = self.apps if apps is None else apps
+        return [(apps[0], outro) for outro in apps[1:]]
+    
+    def estatisticas_descritivas(self) -> tuple:
+        """
+        Calcula estatísticas descritivas básicas para todos os aplicativos.
+        
+        Returns:
+            tuple: (stats_a, stats_b, ...) com dicionários de estatísticas,
+            na ordem de ``self.apps``
+        """
+        return tuple(self.estatisticas_por_app().values())
+    
+    def estatisticas_por_app(self) -> dict:
+        """
+        Calcula estatísticas descritivas de todos os aplicativos.
+        
+        Returns:
+            dict: {app: dicionário de estatísticas}
+        """
+        tabela = self._momentos()
+        return {app: {chave: valores[i] for chave, valores in tabela.items()}
+                for i, app in enumerate(self.apps)}
+    
+    @abstractmethod
+    def _momentos(self) -> dict:
+        """Estatísticas por app (vetores com as chaves de ``estatisticas_agrupadas``)."""
+    
+    def _indices_pares(self, apps: list) -> tuple:
+        """Índices (em ``apps``) e rótulos dos pares (referência, outro)."""
+        pares = self._pares(apps)
+        i = np.array([apps.index(x) for x, _ in pares], dtype=np.int64)
+        j = np.array([apps.index(y) for _, y in pares], dtype=np.int64)
+        return i, j, pares
+    
+    def ic_media_lote(self, niveis=NIVEIS_PADRAO) -> pd.DataFrame:
+        """
+        IC para a média de todos os aplicativos em todos os níveis de uma vez.
+        
+        Args:
+            niveis (sequence): Níveis de confiança
+            
+        Returns:
+            pd.DataFrame: Uma linha por (app, nível), colunas de ``ic_media``
+        """
+        m = self._momentos()
+        return intervalos.ic_media(m['n'], m['media'], m['dp'], niveis, self.apps)
+    
+    def ic_diferenca_medias_welch_lote(self, niveis=NIVEIS_PADRAO) -> pd.DataFrame:
+        """
+        IC de Welch para as diferenças (referência - app) em todos os níveis.
+        
+        Args:
+            niveis (sequence): Níveis de confiança
+            
+        Returns:
+            pd.DataFrame: Uma linha por (par, nível)
+        """
+        m = self._momentos()
+        i, j, pares = self._indices_pares(self.apps)
+        return intervalos.ic_diferenca_medias_welch(
+            m['n'][i], m['media'][i], m['variancia'][i],
+            m['n'][j], m['media'][j], m['variancia'][j], niveis, pares)
+    
+    def ic_variancia_lote(self, niveis=NIVEIS_PADRAO) -> pd.DataFrame:
+        """
+        IC para a variância de todos os aplicativos em todos os níveis.
+        
+        Args:
+            niveis (sequence): Níveis de confiança
+            
+        Returns:
+            pd.DataFrame: Uma linha por (app, nível)
+        """
+        m = self._momentos()
+        return intervalos.ic_variancia(m['n'], m['variancia'], niveis, self.apps)
+    
+    def ic_razao_variancias_lote(self, niveis=NIVEIS_PADRAO) -> pd.DataFrame:
+        """
+        IC para as razões de variâncias (referência / app) em todos os níveis.
+        
+        Args:
+            niveis (sequence): Níveis de confiança
+            
+        Returns:
+            pd.DataFrame: Uma linha por (par, nível)
+        """
+        m = self._momentos()
+        i, j, pares = self._indices_pares(self.apps)
+        return intervalos.ic_razao_variancias(
+            m['n'][i], m['variancia'][i], m['n'][j], m['variancia'][j], niveis, pares)
+    
+    def ic_proporcao_lote(self, niveis=NIVEIS_PADRAO) -> pd.DataFrame:
+        """
+        IC de Wald para a aprovação de todos os aplicativos da pesquisa.
+        
+        Args:
+            niveis (sequence): Níveis de confiança
+            
+        Returns:
+            pd.DataFrame: Uma linha por (app, nível)
+        """
+        apps = list(self.pesquisa)
+        x = [self.pesquisa[app]['aprovacoes'] for app in apps]
+        n = [self.pesquisa[app]['total'] for app in apps]
+        return intervalos.ic_proporcao_wald(x, n, niveis, apps)
+    
+    def ic_diferenca_proporcoes_lote(self, niveis=NIVEIS_PADRAO) -> pd.DataFrame:
+        """
+        IC de Wald para as diferenças de aprovação (referência - app).
+        
+        Args:
+            niveis (sequence): Níveis de confiança
+            
+        Returns:
+            pd.DataFrame: Uma linha por (par, nível)
+        """
+        apps = list(self.pesquisa)
+        x = np.array([self.pesquisa[app]['aprovacoes'] for app in apps])
+        n = np.array([self.pesquisa[app]['total'] for app in apps])
+        i, j, pares = self._indices_pares(apps)
+        return intervalos.ic_diferenca_proporcoes_wald(x[i], n[i], x[j], n[j],
+                                                       niveis, pares)
+    
+    def curva_sla(self, limites=GRADE_PADRAO, confianca: float = 0.95) -> tuple:
+        """
+        Curva de SLA completa de todos os aplicativos e diferenças entre pares.
+        
+        Usa os grupos já ordenados do conjunto de dados (nenhuma varredura
+        por limite) e bandas simultâneas DKW.
+        
+        Args:
+            limites (array-like): Limites em minutos (default: 0 a 60 min, passo 0,1)
+            confianca (float): Nível de confiança das bandas
+            
+        Returns:
+            tuple: (curvas, diferencas) em DataFrames longos
+        """
+        return (self._curva.tabela(limites, confianca),
+                self._curva.tabela_diferencas(self._pares(), limites, confianca))
+    
+    def relatorio(self, niveis=NIVEIS_PADRAO, limites_sla=(5, 8, 10),
+                  secoes: Optional[Sequence[str]] = None) -> Relatorio:
+        """
+        Calcula as análises, sem imprimir, como tabelas colunares.
+        
+        As tabelas seguem a ordem das seções do relatório impresso
+        (ver ``SECOES``); apenas as seções pedidas são calculadas.
+        
+        Args:
+            niveis (sequence): Níveis de confiança dos intervalos
+            limites_sla (sequence): Limites (min) da tabela de SLA
+            secoes (sequence): Seções a calcular (default: todas)
+        
+        Returns:
+            Relatorio: Tabelas da análise, prontas para exportação
+        """
+        calculos = {
+            'descritivas': lambda: pd.DataFrame({'grupo': self.apps, **self._momentos()}),
+            'ic_media': lambda: self.ic_media_lote(niveis),
+            'ic_diferenca_medias': lambda: self.ic_diferenca_medias_welch_lote(niveis),
+            'ic_variancia': lambda: self.ic_variancia_lote(niveis),
+            'ic_razao_variancias': lambda: self.ic_razao_variancias_lote(niveis),
+            'ic_proporcao': lambda: self.ic_proporcao_lote(niveis),
+            'ic_diferenca_proporcoes': lambda: self.ic_diferenca_proporcoes_lote(niveis),
+            'sla': lambda: self._curva.tabela(limites_sla)
+        }
+        secoes = SECOES if secoes is None else secoes
+        invalidas = set(secoes) - set(SECOES)
+        if invalidas:
+            raise ValueError(f"Seções inválidas: {sorted(invalidas)} (use {list(SECOES)})")
+        secoes = [secao for secao in SECOES if secao in secoes]
+        
+        if self.cache is not None:
+            chave = self.cache.chave(self.conjunto, 'AnaliseTransporte.relatorio',
+                                     niveis=list(niveis), limites_sla=list(limites_sla),
+                                     secoes=secoes, pesquisa=self.pesquisa)
+            relatorio = self.cache.obter_relatorio(chave)
+            if relatorio is not None:
+                return relatorio
+        
+        relatorio = Relatorio()
+        for secao in secoes:
+            # Seção numerada como no relatório impresso
+            with etapa(f"{SECOES.index(secao) + 1}. {secao}", 'secao'):
+                relatorio.adicionar(secao, calculos[secao]())
+        if self.cache is not None:
+            self.cache.guardar_relatorio(chave, relatorio)
+        return relatorio
+    
+    def imprimir_relatorio(self, relatorio: Relatorio) -> None:
+        """
+        Imprime o relatório formatado (renderizador de ``relatorio()``).
+        
+        Seções ausentes do relatório são omitidas.
+        
+        Args:
+            relatorio (Relatorio): Tabelas calculadas por ``relatorio()``
+        """
+        print("="*80)
+        print("ANÁLISE ESTATÍSTICA COMPLETA - TRANSPORTE URBANO")
+        print(f"Apps {' vs '.join(self.apps)} - Inferência Estatística")
+        print("="*80)
+        
+        impressoras = {
+            # 1. Estatísticas descritivas
+            'descritivas': self._imprimir_estatisticas_descritivas,
+            # 2. Intervalos de confiança para médias
+            'ic_media': self._imprimir_ic_medias,
+            # 3. Diferença de médias
+            'ic_diferenca_medias': self._imprimir_diferenca_medias,
+            # 4. Variâncias
+            'ic_variancia': self._imprimir_variancias,
+            # 5. Razão de variâncias
+            'ic_razao_variancias': self._imprimir_razao_variancias,
+            # 6. Proporções de aprovação
+            'ic_proporcao': self._imprimir_proporcoes,
+            # 7. Diferença de proporções
+            'ic_diferenca_proporcoes': self._imprimir_diferenca_proporcoes,
+            # 8. Análise de SLA
+            'sla': self._imprimir_analise_sla
+        }
+        for secao in SECOES:
+            if secao in relatorio:
+                impressoras[secao](relatorio[secao])
+    
+    def _imprimir_estatisticas_descritivas(self, tabela: pd.DataFrame) -> None:
+        """Imprime estatísticas descritivas formatadas."""
+        largura = 15 + 13 * len(tabela)
+        print("\n1. ESTATÍSTICAS DESCRITIVAS")
+        print("-" * max(50, largura))
+        print(f"{'Métrica':<15}" + "".join(f" {'App ' + app:<12}" for app in tabela['grupo']))
+        print("-" * max(50, largura))
+        
+        metricas = [
+            ('N', 'n', ''),
+            ('Média', 'media', '.3f'),
+            ('Mediana', 'mediana', '.3f'),
+            ('Desvio Padrão', 'dp', '.3f'),
+            ('Variância', 'variancia', '.3f'),
+            ('CV (%)', 'cv', '.1%'),
+            ('P90', 'p90', '.3f'),
+            ('P95', 'p95', '.3f'),
+            ('IQR', 'iqr', '.3f')
+        ]
+        
+        for nome, chave, fmt in metricas:
+            valores = []
+            for valor in tabela[chave].to_numpy():
+                if fmt == '.1%':
+                    valores.append(f"{valor*100:.1f}")
+                elif fmt:
+                    valores.append(f"{valor:{fmt}}")
+                else:
+                    valores.append(str(valor))
+            
+            print(f"{nome:<15}" + "".join(f" {valor:<12}" for valor in valores))
+    
+    def _imprimir_ic_medias(self, tabela: pd.DataFrame) -> None:
+        """Imprime intervalos de confiança para médias."""
+        print("\n\n2. INTERVALOS DE CONFIANÇA PARA MÉDIAS")
+        print("-" * 80)
+        
+        for app, ics in tabela.groupby('grupo', sort=False):
+            print(f"\nApp {app}:")
+            print(f"{'Nível':<8} {'Média':<8} {'ME':<8} {'Amplitude':<10} {'LI':<8} {'LS':<8}")
+            print("-" * 50)
+            for ic in ics.itertuples():
+                print(f"{ic.confianca*100:>5.0f}%   {ic.media:>6.3f}   {ic.margem_erro:>6.3f}   "
+                      f"{ic.amplitude:>8.3f}   {ic.li:>6.3f}   {ic.ls:>6.3f}")
+    
+    def _imprimir_diferenca_medias(self, tabela: pd.DataFrame) -> None:
+        """Imprime análise de diferença de médias."""
+        for (app_x, app_y), ics in tabela.groupby('grupo', sort=False):
+            print(f"\n\n3. DIFERENÇA DE MÉDIAS ({app_x} - {app_y}) - TESTE DE WELCH")
+            print("-" * 80)
+            print(f"{'Nível':<8} {'Diferença':<10} {'ME':<8} {'Amplitude':<10} {'LI':<8} {'LS':<8} {'Significativo':<12}")
+            print("-" * 80)
+            
+            for ic_diff in ics.itertuples():
+                significativo = "Não" if ic_diff.li <= 0 <= ic_diff.ls else "Sim"
+                print(f"{ic_diff.confianca*100:>5.0f}%   {ic_diff.diferenca:>8.3f}   {ic_diff.margem_erro:>6.3f}   "
+                      f"{ic_diff.amplitude:>8.3f}   {ic_diff.li:>6.3f}   {ic_diff.ls:>6.3f}   {significativo:<12}")
+    
+    def _imprimir_variancias(self, tabela: pd.DataFrame) -> None:
+        """Imprime intervalos de confiança para variâncias."""
+        print("\n\n4. INTERVALOS DE CONFIANÇA PARA VARIÂNCIAS (95%)")
+        print("-" * 60)
+        print(f"{'App':<5} {'Variância':<12} {'LI':<10} {'LS':<10}")
+        print("-" * 60)
+        
+        for ic_var in tabela[np.isclose(tabela['confianca'], 0.95)].itertuples():
+            print(f"{ic_var.grupo:<5} {ic_var.variancia:>10.3f}   {ic_var.li:>8.3f}   {ic_var.ls:>8.3f}")
+    
+    def _imprimir_razao_variancias(self, tabela: pd.DataFrame) -> None:
+        """Imprime análise de razão de variâncias."""
+        for (app_x, app_y), ics in tabela.groupby('grupo', sort=False):
+            print(f"\n\n5. RAZÃO DE VARIÂNCIAS ({app_x}/{app_y})")
+            print("-" * 70)
+            print(f"{'Nível':<8} {'Razão':<8} {'LI':<8} {'LS':<8} {'Iguais':<12}")
+            print("-" * 70)
+            
+            for ic_razao in ics.itertuples():
+                iguais = "Sim" if ic_razao.li <= 1 <= ic_razao.ls else "Não"
+                print(f"{ic_razao.confianca*100:>5.0f}%   {ic_razao.razao:>6.3f}   {ic_razao.li:>6.3f}   "
+                      f"{ic_razao.ls:>6.3f}   {iguais:<12}")
+    
+    def _imprimir_proporcoes(self, tabela: pd.DataFrame) -> None:
+        """Imprime intervalos de confiança para proporções."""
+        print("\n\n6. PROPORÇÕES DE APROVAÇÃO (PESQUISA DE OPINIÃO)")
+        print("-" * 80)
+        
+        for app, ics in tabela.groupby('grupo', sort=False):
+            x, n = ics['x'].iloc[0], ics['n'].iloc[0]
+            print(f"\nApp {app} ({x}/{n} = {x/n:.3f}):")
+            print(f"{'Nível':<8} {'Proporção':<10} {'ME':<8} {'Amplitude':<10} {'LI':<8} {'LS':<8}")
+            print("-" * 60)
+            
+            for ic_prop in ics.itertuples():
+                print(f"{ic_prop.confianca*100:>5.0f}%   {ic_prop.proporcao:>8.3f}   {ic_prop.margem_erro:>6.3f}   "
+                      f"{ic_prop.amplitude:>8.3f}   {ic_prop.li:>6.3f}   {ic_prop.ls:>6.3f}")
+    
+    def _imprimir_diferenca_proporcoes(self, tabela: pd.DataFrame) -> None:
+        """Imprime análise de diferença de proporções."""
+        for (app_x, app_y), ics in tabela.groupby('grupo', sort=False):
+            print(f"\n\n7. DIFERENÇA DE PROPORÇÕES ({app_x} - {app_y})")
+            print("-" * 80)
+            print(f"{'Nível':<8} {'Diferença':<10} {'ME':<8} {'Amplitude':<10} {'LI':<8} {'LS':<8} {'Significativo':<12}")
+            print("-" * 80)
+            
+            for ic_diff_prop in ics.itertuples():
+                significativo = "Não" if ic_diff_prop.li <= 0 <= ic_diff_prop.ls else "Sim"
+                print(f"{ic_diff_prop.confianca*100:>5.0f}%   {ic_diff_prop.diferenca:>8.3f}   {ic_diff_prop.margem_erro:>6.3f}   "
+                      f"{ic_diff_prop.amplitude:>8.3f}   {ic_diff_prop.li:>6.3f}   {ic_diff_prop.ls:>6.3f}   {significativo:<12}")
+    
+    def _imprimir_analise_sla(self, tabela: pd.DataFrame) -> None:
+        """Imprime análise de SLA."""
+        print("\n\n8. ANÁLISE DE SLA (SERVICE LEVEL AGREEMENT)")
+        print("-" * 60)
+        limites_sla = tabela['limite'].unique()
+        pares = self._pares()
+        # Com um único par, mantém o cabeçalho "Diferença"; senão, um por par
+        rotulos_dif = (['Diferença'] if len(pares) == 1
+                       else [f'Dif. {x}-{y}' for x, y in pares])
+        print(f"{'Limite (min)':<12}" + "".join(f" {'App ' + app + ' (%)':<12}" for app in self.apps)
+              + "".join(f" {rotulo:<12}" for rotulo in rotulos_dif))
+        print("-" * 60)
+        
+        sla_apps = tabela['sla'].to_numpy().reshape(len(self.apps), -1) * 100
+        for k, limite in enumerate(limites_sla):
+            sla = {app: sla_apps[i, k] for i, app in enumerate(self.apps)}
+            linha = f"{limite:<12g}" + "".join(f" {sla[app]:>10.1f}  " for app in self.apps)
+            linha += "".join(f" {sla[x] - sla[y]:>+10.1f}  " for x, y in pares)
+            print(linha.rstrip())
 
 
-class AnaliseTransporte:
+class AnaliseTransporte(_AnaliseResumos):
     """
     Classe principal para análise estatística de aplicativos de transporte.
     
@@ -45,71 +446,83 @@ class AnaliseTransporte:
     - Análise de SLA
     - Geração de visualizações
     
+    Qualquer número de aplicativos é suportado: as comparações entre
+    grupos são feitas entre o aplicativo de referência (o primeiro) e
+    cada um dos demais. Tabelas e relatório impresso vêm de
+    ``_AnaliseResumos``; aqui ficam as partes que usam as observações
+    (intervalos escalares, bootstrap e figuras).
+    
     Attributes:
         dados (pd.DataFrame): DataFrame com os dados de tempo de espera
+        apps (list): Rótulos dos aplicativos
+        grupos (dict): Dados de cada aplicativo {app: np.array}
         app_a (np.array): Dados do aplicativo A
         app_b (np.array): Dados do aplicativo B
         pesquisa (dict): Dados da pesquisa de satisfação
     """
     
-    def __init__(self, dados_path: str, output_dir: str = "outputs"):
+    def __init__(self, dados_path: Union[str, DadosTransporte],
+                 output_dir: str = "outputs", pesquisa: FontePesquisa = None,
+                 verboso: bool = True, cache: Optional[CacheResultados] = None):
         """
         Inicializa a análise com os dados de transporte.
         
         Args:
-            dados_path (str): Caminho para o arquivo CSV com os dados
+            dados_path (str | DadosTransporte): Caminho para o arquivo CSV com
+                os dados ou conjunto de dados já carregado
             output_dir (str): Diretório para salvar outputs
+            pesquisa (dict | str | PesquisaAgregada): Aprovações e totais por
+                aplicativo ({app: {'aprovacoes': x, 'total': n}}), microdados
+                agregados ou caminho do CSV de respondentes; default: pesquisa A/B
+            verboso (bool): Se True, informa os dados carregados
+            cache (CacheResultados): Cache de resultados e figuras
+                (opcional); sem cache, tudo é recalculado
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
-        # Carregar e processar dados
-        self.dados = pd.read_csv(dados_path)
-        self.dados.columns = ['app', 'espera_min']
+        # Carregar dados (CSV interpretado uma única vez e mantido em cache)
+        self.conjunto = DadosTransporte.obter(dados_path)
         
-        # Separar dados por aplicativo
-        self.app_a = self.dados[self.dados['app'] == 'A']['espera_min'].values
-        self.app_b = self.dados[self.dados['app'] == 'B']['espera_min'].values
+        # Separar dados por aplicativo (visões sem cópia)
+        self.apps = self.conjunto.apps
+        self.grupos = self.conjunto.grupos
+        self.app_a = self.conjunto.grupo('A')
+        self.app_b = self.conjunto.grupo('B')
+        self._curva = CurvaSLA.de_conjunto(self.conjunto)
+        self._momentos_cache = None
+        self.cache = cache
         
         # Dados da pesquisa de opinião (conforme especificação do problema)
-        self.pesquisa = {
-            'A': {'aprovacoes': 132, 'total': 150},
-            'B': {'aprovacoes': 120, 'total': 150}
-        }
+        self.pesquisa = obter_pesquisa(pesquisa)
         
-        self._log_dados_carregados()
+        if verboso:
+            self._log_dados_carregados()
+    
+    @property
+    def dados(self) -> pd.DataFrame:
+        """DataFrame (app, espera_min), construído apenas quando usado."""
+        return self.conjunto.dados
     
     def _log_dados_carregados(self) -> None:
         """Log das informações dos dados carregados."""
         print(f"Dados carregados:")
-        print(f"App A: {len(self.app_a)} observações")
-        print(f"App B: {len(self.app_b)} observações")
-        print(f"Total: {len(self.dados)} observações")
-        print(f"Pesquisa: {sum(self.pesquisa[app]['total'] for app in ['A', 'B'])} usuários\n")
+        for app, dados in self.grupos.items():
+            print(f"App {app}: {len(dados)} observações")
+        print(f"Total: {len(self.conjunto)} observações")
+        print(f"Pesquisa: {sum(p['total'] for p in self.pesquisa.values())} usuários\n")
     
-    def estatisticas_descritivas(self) -> tuple:
+    def estatisticas_por_app(self) -> dict:
         """
-        Calcula estatísticas descritivas básicas para ambos os aplicativos.
+        Calcula estatísticas descritivas de todos os aplicativos.
+        
+        Todos os grupos são resumidos a partir de uma única ordenação
+        dos dados (ver ``estatisticas_agrupadas``).
         
         Returns:
-            tuple: (stats_a, stats_b) com dicionários de estatísticas
-        """
-        def calcular_stats(dados: np.array) -> dict:
-            return {
-                'n': len(dados),
-                'media': np.mean(dados),
-                'mediana': np.median(dados),
-                'dp': np.std(dados, ddof=1),
-                'variancia': np.var(dados, ddof=1),
-                'cv': np.std(dados, ddof=1) / np.mean(dados),
-                'p90': np.percentile(dados, 90),
-                'p95': np.percentile(dados, 95),
-                'iqr': np.percentile(dados, 75) - np.percentile(dados, 25),
-                'min': np.min(dados),
-                'max': np.max(dados)
-            }
-        
-        return calcular_stats(self.app_a), calcular_stats(self.app_b)
+            dict: {app: dicionário de estatísticas}
+        """
+        return self.conjunto.estatisticas_grupos()
     
     def ic_media(self, dados: np.array, confianca: float = 0.95) -> dict:
         """
@@ -128,7 +541,7 @@ class AnaliseTransporte:
         se = dp / np.sqrt(n)
         
         alpha = 1 - confianca
-        t_crit = t.ppf(1 - alpha/2, df=n-1)
+        t_crit = cache_criticos.t(1 - alpha/2, n-1)
         me = t_crit * se
         
         return {
@@ -169,7 +582,7 @@ class AnaliseTransporte:
         df = (s1**2/n1 + s2**2/n2)**2 / ((s1**2/n1)**2/(n1-1) + (s2**2/n2)**2/(n2-1))
         
         alpha = 1 - confianca
-        t_crit = t.ppf(1 - alpha/2, df=df)
+        t_crit = cache_criticos.t(1 - alpha/2, df)
         me = t_crit * se
         
         return {
@@ -183,6 +596,37 @@ class AnaliseTransporte:
             'ls': diff + me
         }
     
+    def ic_diferenca_bootstrap(self, x: np.array, y: np.array,
+                               estatistica: str = 'media', confianca: float = 0.95,
+                               metodo: str = 'bca', n_reamostras: int = 10_000,
+                               limite_sla: float = 8.0, memoria_mb: float = 256,
+                               n_jobs: int = 1, semente: Optional[int] = None) -> dict:
+        """
+        Calcula IC bootstrap para diferença de média, mediana, P90 ou SLA.
+
+        Alternativa ao IC de Welch que não depende de normalidade, adequada
+        aos tempos de espera assimétricos.
+
+        Args:
+            x (np.array): Dados do primeiro grupo
+            y (np.array): Dados do segundo grupo
+            estatistica (str): 'media', 'mediana', 'p90' ou 'sla'
+            confianca (float): Nível de confiança
+            metodo (str): 'percentil' ou 'bca'
+            n_reamostras (int): Número de reamostras bootstrap
+            limite_sla (float): Limite em minutos usado quando estatistica='sla'
+            memoria_mb (float): Orçamento de memória por lote de reamostras (MB)
+            n_jobs (int): Número de processos
+            semente (int): Semente para reprodutibilidade
+
+        Returns:
+            dict: Resultados do IC para a diferença
+        """
+        return bootstrap.ic_bootstrap_diferenca(
+            x, y, estatistica=estatistica, confianca=confianca, metodo=metodo,
+            n_reamostras=n_reamostras, limite_sla=limite_sla,
+            memoria_mb=memoria_mb, n_jobs=n_jobs, semente=semente)
+    
     def ic_variancia(self, dados: np.array, confianca: float = 0.95) -> dict:
         """
         Calcula IC para variância usando distribuição qui-quadrado.
@@ -198,8 +642,8 @@ class AnaliseTransporte:
         s2 = np.var(dados, ddof=1)
         
         alpha = 1 - confianca
-        chi2_inf = chi2.ppf(alpha/2, df=n-1)
-        chi2_sup = chi2.ppf(1 - alpha/2, df=n-1)
+        chi2_inf = cache_criticos.chi2(alpha/2, n-1)
+        chi2_sup = cache_criticos.chi2(1 - alpha/2, n-1)
         
         li = (n-1) * s2 / chi2_sup
         ls = (n-1) * s2 / chi2_inf
@@ -231,8 +675,8 @@ class AnaliseTransporte:
         razao = s1_2 / s2_2
         
         alpha = 1 - confianca
-        f_inf = f.ppf(alpha/2, dfn=n1-1, dfd=n2-1)
-        f_sup = f.ppf(1 - alpha/2, dfn=n1-1, dfd=n2-1)
+        f_inf = cache_criticos.f(alpha/2, n1-1, n2-1)
+        f_sup = cache_criticos.f(1 - alpha/2, n1-1, n2-1)
         
         li = razao / f_sup
         ls = razao / f_inf
@@ -260,7 +704,7 @@ class AnaliseTransporte:
         """
         p = x / n
         alpha = 1 - confianca
-        z_crit = norm.ppf(1 - alpha/2)
+        z_crit = cache_criticos.norm(1 - alpha/2)
         se = np.sqrt(p * (1-p) / n)
         me = z_crit * se
         
@@ -293,7 +737,7 @@ class AnaliseTransporte:
         diff = p1 - p2
         
         alpha = 1 - confianca
-        z_crit = norm.ppf(1 - alpha/2)
+        z_crit = cache_criticos.norm(1 - alpha/2)
         se = np.sqrt(p1*(1-p1)/n1 + p2*(1-p2)/n2)
         me = z_crit * se
         
@@ -308,22 +752,71 @@ class AnaliseTransporte:
             'ls': diff + me
         }
     
+    def _momentos(self) -> dict:
+        """Estatísticas por app (vetores), calculadas uma única vez."""
+        if self._momentos_cache is None:
+            self._momentos_cache = estatisticas_agrupadas(self.conjunto.espera,
+                                                          self.conjunto.offsets)
+        return self._momentos_cache
+    
     def calcular_sla(self, dados: np.array, limite: float = 5) -> float:
         """
         Calcula SLA (Service Level Agreement) - % de atendimentos dentro do limite.
         
+        Para um vetor de limites, os dados são ordenados uma única vez e
+        todos os limites são respondidos por busca binária.
+        
         Args:
             dados (np.array): Dados de tempo de espera
-            limite (float): Limite de tempo em minutos
+            limite (float | array-like): Limite(s) de tempo em minutos
             
         Returns:
-            float: Proporção de atendimentos dentro do limite
+            float | np.ndarray: Proporção de atendimentos dentro do(s) limite(s)
+        """
+        if np.ndim(limite) == 0:
+            return np.mean(dados <= limite)
+        return CurvaSLA.de_amostras({'dados': dados}).sla(limite, 'dados')
+    
+    def tarefas_figuras(self) -> list:
+        """
+        Figuras da análise como tarefas independentes de renderização.
+        
+        Returns:
+            list: [TarefaFigura do painel de visualizações]
         """
-        return np.mean(dados <= limite)
+        return [TarefaFigura('visualizacoes_transporte', self._desenhar_visualizacoes,
+                             (15, 12), ESTILO_ANALISE,
+                             preparar=self.conjunto.densidade.avaliar)]
     
-    def gerar_visualizacoes(self) -> None:
-        """Gera visualizações dos dados e salva no diretório de output."""
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+    def chaves_figuras(self, tarefas: list, perfil: str = PERFIL_PADRAO) -> list:
+        """Chaves de cache das figuras (dados, pesquisa, tarefa e perfil)."""
+        perfil = obter_perfil(perfil)
+        return [self.cache.chave_figura(self.conjunto, tarefa, perfil, pesquisa=self.pesquisa)
+                for tarefa in tarefas]
+    
+    def gerar_visualizacoes(self, perfil: str = PERFIL_PADRAO) -> Path:
+        """
+        Gera visualizações dos dados e salva no diretório de output.
+        
+        Args:
+            perfil (str): Perfil de qualidade ('rascunho', 'tela',
+                'impressao' ou 'vetorial')
+        
+        Returns:
+            Path: Caminho do arquivo gerado
+        """
+        tarefas = self.tarefas_figuras()
+        chaves = self.chaves_figuras(tarefas, perfil) if self.cache is not None else None
+        output_path, = renderizar(tarefas, self.output_dir, perfil,
+                                  cache=self.cache, chaves=chaves)
+        print(f"Visualizações salvas em: {output_path}")
+        return output_path
+    
+    def _desenhar_visualizacoes(self, fig) -> None:
+        """Desenha o painel 2x2 (boxplot, histogramas, densidades, Q-Q)."""
+        from scipy.stats import probplot
+        
+        axes = fig.subplots(2, 2)
         
         # Boxplot
         self.dados.boxplot(column='espera_min', by='app', ax=axes[0,0])
@@ -332,215 +825,48 @@ class AnaliseTransporte:
         axes[0,0].set_ylabel('Tempo de Espera (min)')
         
         # Histogramas
-        axes[0,1].hist(self.app_a, alpha=0.7, label='App A', bins=15, density=True)
-        axes[0,1].hist(self.app_b, alpha=0.7, label='App B', bins=15, density=True)
+        for app, dados in self.grupos.items():
+            axes[0,1].hist(dados, alpha=0.7, label=f'App {app}', bins=15, density=True)
         axes[0,1].set_title('Distribuição dos Tempos de Espera')
         axes[0,1].set_xlabel('Tempo de Espera (min)')
         axes[0,1].set_ylabel('Densidade')
         axes[0,1].legend()
         
         # Curvas de densidade
-        x_range = np.linspace(min(min(self.app_a), min(self.app_b)), 
-                             max(max(self.app_a), max(self.app_b)), 100)
-        kde_a = gaussian_kde(self.app_a)
-        kde_b = gaussian_kde(self.app_b)
-        
-        axes[1,0].plot(x_range, kde_a(x_range), label='App A', linewidth=2)
-        axes[1,0].plot(x_range, kde_b(x_range), label='App B', linewidth=2)
-        axes[1,0].fill_between(x_range, kde_a(x_range), alpha=0.3)
-        axes[1,0].fill_between(x_range, kde_b(x_range), alpha=0.3)
+        # Grade padrão: a mesma das demais figuras (KDE calculado uma vez)
+        x_range = self.conjunto.densidade.grade_padrao()
+        densidades = self.conjunto.densidade.por_app(x_range)
+        for app, densidade in densidades.items():
+            axes[1,0].plot(x_range, densidade, label=f'App {app}', linewidth=2)
+            axes[1,0].fill_between(x_range, densidade, alpha=0.3)
         axes[1,0].set_title('Curvas de Densidade')
         axes[1,0].set_xlabel('Tempo de Espera (min)')
         axes[1,0].set_ylabel('Densidade')
         axes[1,0].legend()
         
-        # Q-Q plot para normalidade
-        probplot(self.app_a, dist="norm", plot=axes[1,1])
-        axes[1,1].set_title('Q-Q Plot - App A (Teste de Normalidade)')
+        # Q-Q plot para normalidade (aplicativo de referência)
+        referencia = self.apps[0]
+        probplot(self.grupos[referencia], dist="norm", plot=axes[1,1])
+        axes[1,1].set_title(f'Q-Q Plot - App {referencia} (Teste de Normalidade)')
         
-        plt.tight_layout()
-        output_path = self.output_dir / 'visualizacoes_transporte.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"Visualizações salvas em: {output_path}")
+        fig.tight_layout()
     
+    @instrumentado(categoria='pipeline')
     def executar_analise_completa(self) -> tuple:
         """
         Executa análise estatística completa e gera relatório.
         
         Returns:
-            tuple: (stats_a, stats_b) com estatísticas descritivas
+            tuple: (stats_a, stats_b, ...) com estatísticas descritivas
         """
-        print("="*80)
-        print("ANÁLISE ESTATÍSTICA COMPLETA - TRANSPORTE URBANO")
-        print("Apps A vs B - Inferência Estatística")
-        print("="*80)
-        
-        # 1. Estatísticas descritivas
-        stats_a, stats_b = self.estatisticas_descritivas()
-        self._imprimir_estatisticas_descritivas(stats_a, stats_b)
-        
-        # 2. Intervalos de confiança para médias
-        self._imprimir_ic_medias()
-        
-        # 3. Diferença de médias
-        self._imprimir_diferenca_medias()
-        
-        # 4. Variâncias
-        self._imprimir_variancias()
-        
-        # 5. Razão de variâncias
-        self._imprimir_razao_variancias()
-        
-        # 6. Proporções de aprovação
-        self._imprimir_proporcoes()
-        
-        # 7. Diferença de proporções
-        self._imprimir_diferenca_proporcoes()
-        
-        # 8. Análise de SLA
-        self._imprimir_analise_sla()
+        relatorio = self.relatorio()
+        with etapa('imprimir_relatorio', 'saida'):
+            self.imprimir_relatorio(relatorio)
         
         # Gerar visualizações
         self.gerar_visualizacoes()
         
-        return stats_a, stats_b
-    
-    def _imprimir_estatisticas_descritivas(self, stats_a: dict, stats_b: dict) -> None:
-        """Imprime estatísticas descritivas formatadas."""
-        print("\n1. ESTATÍSTICAS DESCRITIVAS")
-        print("-" * 50)
-        print(f"{'Métrica':<15} {'App A':<12} {'App B':<12}")
-        print("-" * 50)
-        
-        metricas = [
-            ('N', 'n', ''),
-            ('Média', 'media', '.3f'),
-            ('Mediana', 'mediana', '.3f'),
-            ('Desvio Padrão', 'dp', '.3f'),
-            ('Variância', 'variancia', '.3f'),
-            ('CV (%)', 'cv', '.1%'),
-            ('P90', 'p90', '.3f'),
-            ('P95', 'p95', '.3f'),
-            ('IQR', 'iqr', '.3f')
-        ]
-        
-        for nome, chave, fmt in metricas:
-            if fmt == '.1%':
-                val_a = f"{stats_a[chave]*100:.1f}"
-                val_b = f"{stats_b[chave]*100:.1f}"
-            elif fmt:
-                val_a = f"{stats_a[chave]:{fmt}}"
-                val_b = f"{stats_b[chave]:{fmt}}"
-            else:
-                val_a = str(stats_a[chave])
-                val_b = str(stats_b[chave])
-            
-            print(f"{nome:<15} {val_a:<12} {val_b:<12}")
-    
-    def _imprimir_ic_medias(self) -> None:
-        """Imprime intervalos de confiança para médias."""
-        print("\n\n2. INTERVALOS DE CONFIANÇA PARA MÉDIAS")
-        print("-" * 80)
-        niveis = [0.90, 0.95, 0.99]
-        
-        for app, dados in [('A', self.app_a), ('B', self.app_b)]:
-            print(f"\nApp {app}:")
-            print(f"{'Nível':<8} {'Média':<8} {'ME':<8} {'Amplitude':<10} {'LI':<8} {'LS':<8}")
-            print("-" * 50)
-            for nivel in niveis:
-                ic = self.ic_media(dados, nivel)
-                print(f"{nivel*100:>5.0f}%   {ic['media']:>6.3f}   {ic['margem_erro']:>6.3f}   "
-                      f"{ic['amplitude']:>8.3f}   {ic['li']:>6.3f}   {ic['ls']:>6.3f}")
-    
-    def _imprimir_diferenca_medias(self) -> None:
-        """Imprime análise de diferença de médias."""
-        print("\n\n3. DIFERENÇA DE MÉDIAS (A - B) - TESTE DE WELCH")
-        print("-" * 80)
-        print(f"{'Nível':<8} {'Diferença':<10} {'ME':<8} {'Amplitude':<10} {'LI':<8} {'LS':<8} {'Significativo':<12}")
-        print("-" * 80)
-        
-        niveis = [0.90, 0.95, 0.99]
-        for nivel in niveis:
-            ic_diff = self.ic_diferenca_medias_welch(self.app_a, self.app_b, nivel)
-            significativo = "Não" if ic_diff['li'] <= 0 <= ic_diff['ls'] else "Sim"
-            print(f"{nivel*100:>5.0f}%   {ic_diff['diferenca']:>8.3f}   {ic_diff['margem_erro']:>6.3f}   "
-                  f"{ic_diff['amplitude']:>8.3f}   {ic_diff['li']:>6.3f}   {ic_diff['ls']:>6.3f}   {significativo:<12}")
-    
-    def _imprimir_variancias(self) -> None:
-        """Imprime intervalos de confiança para variâncias."""
-        print("\n\n4. INTERVALOS DE CONFIANÇA PARA VARIÂNCIAS (95%)")
-        print("-" * 60)
-        print(f"{'App':<5} {'Variância':<12} {'LI':<10} {'LS':<10}")
-        print("-" * 60)
-        
-        for app, dados in [('A', self.app_a), ('B', self.app_b)]:
-            ic_var = self.ic_variancia(dados, 0.95)
-            print(f"{app:<5} {ic_var['variancia']:>10.3f}   {ic_var['li']:>8.3f}   {ic_var['ls']:>8.3f}")
-    
-    def _imprimir_razao_variancias(self) -> None:
-        """Imprime análise de razão de variâncias."""
-        print("\n\n5. RAZÃO DE VARIÂNCIAS (A/B)")
-        print("-" * 70)
-        print(f"{'Nível':<8} {'Razão':<8} {'LI':<8} {'LS':<8} {'Iguais':<12}")
-        print("-" * 70)
-        
-        niveis = [0.90, 0.95, 0.99]
-        for nivel in niveis:
-            ic_razao = self.ic_razao_variancias(self.app_a, self.app_b, nivel)
-            iguais = "Sim" if ic_razao['li'] <= 1 <= ic_razao['ls'] else "Não"
-            print(f"{nivel*100:>5.0f}%   {ic_razao['razao']:>6.3f}   {ic_razao['li']:>6.3f}   "
-                  f"{ic_razao['ls']:>6.3f}   {iguais:<12}")
-    
-    def _imprimir_proporcoes(self) -> None:
-        """Imprime intervalos de confiança para proporções."""
-        print("\n\n6. PROPORÇÕES DE APROVAÇÃO (PESQUISA DE OPINIÃO)")
-        print("-" * 80)
-        
-        niveis = [0.90, 0.95, 0.99]
-        for app in ['A', 'B']:
-            x = self.pesquisa[app]['aprovacoes']
-            n = self.pesquisa[app]['total']
-            print(f"\nApp {app} ({x}/{n} = {x/n:.3f}):")
-            print(f"{'Nível':<8} {'Proporção':<10} {'ME':<8} {'Amplitude':<10} {'LI':<8} {'LS':<8}")
-            print("-" * 60)
-            
-            for nivel in niveis:
-                ic_prop = self.ic_proporcao_wald(x, n, nivel)
-                print(f"{nivel*100:>5.0f}%   {ic_prop['proporcao']:>8.3f}   {ic_prop['margem_erro']:>6.3f}   "
-                      f"{ic_prop['amplitude']:>8.3f}   {ic_prop['li']:>6.3f}   {ic_prop['ls']:>6.3f}")
-    
-    def _imprimir_diferenca_proporcoes(self) -> None:
-        """Imprime análise de diferença de proporções."""
-        print("\n\n7. DIFERENÇA DE PROPORÇÕES (A - B)")
-        print("-" * 80)
-        print(f"{'Nível':<8} {'Diferença':<10} {'ME':<8} {'Amplitude':<10} {'LI':<8} {'LS':<8} {'Significativo':<12}")
-        print("-" * 80)
-        
-        x1, n1 = self.pesquisa['A']['aprovacoes'], self.pesquisa['A']['total']
-        x2, n2 = self.pesquisa['B']['aprovacoes'], self.pesquisa['B']['total']
-        
-        niveis = [0.90, 0.95, 0.99]
-        for nivel in niveis:
-            ic_diff_prop = self.ic_diferenca_proporcoes_wald(x1, n1, x2, n2, nivel)
-            significativo = "Não" if ic_diff_prop['li'] <= 0 <= ic_diff_prop['ls'] else "Sim"
-            print(f"{nivel*100:>5.0f}%   {ic_diff_prop['diferenca']:>8.3f}   {ic_diff_prop['margem_erro']:>6.3f}   "
-                  f"{ic_diff_prop['amplitude']:>8.3f}   {ic_diff_prop['li']:>6.3f}   {ic_diff_prop['ls']:>6.3f}   {significativo:<12}")
-    
-    def _imprimir_analise_sla(self) -> None:
-        """Imprime análise de SLA."""
-        print("\n\n8. ANÁLISE DE SLA (SERVICE LEVEL AGREEMENT)")
-        print("-" * 60)
-        limites_sla = [5, 8, 10]
-        print(f"{'Limite (min)':<12} {'App A (%)':<12} {'App B (%)':<12} {'Diferença':<12}")
-        print("-" * 60)
-        
-        for limite in limites_sla:
-            sla_a = self.calcular_sla(self.app_a, limite) * 100
-            sla_b = self.calcular_sla(self.app_b, limite) * 100
-            diff_sla = sla_a - sla_b
-            print(f"{limite:<12} {sla_a:>10.1f}   {sla_b:>10.1f}   {diff_sla:>+10.1f}")
+        return tuple(self.estatisticas_por_app().values())
 
 
 def main():
@@ -558,7 +884,7 @@ def main():
     try:
         # Executar análise
         analise = AnaliseTransporte(dados_path, output_dir)
-        stats_a, stats_b = analise.executar_analise_completa()
+        estatisticas = analise.executar_analise_completa()
         
         print("\n" + "="*80)
         print("ANÁLISE CONCLUÍDA COM SUCESSO!")
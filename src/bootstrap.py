@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Intervalos Bootstrap para Diferenças entre Aplicativos - Transporte Urbano
+
+Os tempos de espera são assimétricos, e os intervalos t/Welch de
+``AnaliseTransporte`` só tratam da média. Este módulo calcula intervalos
+bootstrap (percentil e BCa) para a diferença (x - y) de média, mediana,
+P90 e SLA entre dois aplicativos.
+
+As reamostras são sorteadas em lotes de matrizes de índices cujo tamanho
+respeita um orçamento de memória, e os lotes podem ser distribuídos em um
+pool de processos. Cada lote recebe seu próprio fluxo aleatório gerado por
+``SeedSequence.spawn``, de modo que, para uma mesma semente, número de
+reamostras e orçamento de memória, o resultado é idêntico com qualquer
+número de processos.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from ._importacao import importar_sob_demanda
+
+stats = importar_sob_demanda('scipy.stats')
+
+# Estatísticas suportadas: (nome, quantil associado, quando houver)
+ESTATISTICAS = {'media': None, 'mediana': 0.5, 'p90': 0.9, 'sla': None}
+
+# Bytes por elemento reamostrado: índice int64 + valor float64 + cópia de trabalho
+_BYTES_POR_ELEMENTO = 24
+
+# Dados compartilhados com os processos do pool (definidos no inicializador)
+_x_compartilhado = None
+_y_compartilhado = None
+
+
+def _estatistica_linhas(amostras: np.ndarray, estatistica: str,
+                        limite_sla: float) -> np.ndarray:
+    """Calcula a estatística em cada linha de uma matriz de reamostras."""
+    if estatistica == 'media':
+        return amostras.mean(axis=1)
+    if estatistica == 'sla':
+        return (amostras <= limite_sla).mean(axis=1)
+    return np.quantile(amostras, ESTATISTICAS[estatistica], axis=1)
+
+
+def _estatistica(dados: np.ndarray, estatistica: str, limite_sla: float) -> float:
+    """Calcula a estatística na amostra original."""
+    return float(_estatistica_linhas(dados[None, :], estatistica, limite_sla)[0])
+
+
+def _jackknife(dados: np.ndarray, estatistica: str, limite_sla: float) -> np.ndarray:
+    """
+    Estatísticas deixando uma observação de fora, em O(n) (sem laço).
+
+    Para média e SLA usa as somas; para quantis, usa a amostra ordenada:
+    retirar o j-ésimo menor valor desloca em uma posição os elementos
+    acima dele, então o quantil de cada subamostra sai por indexação.
+    """
+    n = dados.size
+    if estatistica == 'media':
+        return (dados.sum() - dados) / (n - 1)
+    if estatistica == 'sla':
+        dentro = dados <= limite_sla
+        return (dentro.sum() - dentro) / (n - 1)
+
+    ordenados = np.sort(dados)
+    posicao = (n - 2) * ESTATISTICAS[estatistica]
+    baixo = int(np.floor(posicao))
+    alto = min(baixo + 1, n - 2)
+    fracao = posicao - baixo
+    retirado = np.arange(n)
+    v_baixo = np.where(baixo < retirado, ordenados[baixo], ordenados[baixo + 1])
+    v_alto = np.where(alto < retirado, ordenados[alto], ordenados[alto + 1])
+    return v_baixo + fracao * (v_alto - v_baixo)
+
+
+def _inicializar_trabalhador(x: np.ndarray, y: np.ndarray) -> None:
+    """Recebe os dados uma única vez por processo do pool."""
+    global _x_compartilhado, _y_compartilhado
+    _x_compartilhado, _y_compartilhado = x, y
+
+
+def _reamostrar_lote(tarefa: tuple) -> np.ndarray:
+    """Diferenças bootstrap de um lote, com o fluxo aleatório do próprio lote."""
+    estatistica, limite_sla, tamanho, semente_lote = tarefa
+    x, y = _x_compartilhado, _y_compartilhado
+    rng = np.random.default_rng(semente_lote)
+    idx_x = rng.integers(0, x.size, size=(tamanho, x.size))
+    est_x = _estatistica_linhas(x[idx_x], estatistica, limite_sla)
+    del idx_x
+    idx_y = rng.integers(0, y.size, size=(tamanho, y.size))
+    est_y = _estatistica_linhas(y[idx_y], estatistica, limite_sla)
+    return est_x - est_y
+
+
+def distribuicao_bootstrap(x: np.ndarray, y: np.ndarray, estatistica: str = 'media',
+                           n_reamostras: int = 10_000, limite_sla: float = 8.0,
+                           memoria_mb: float = 256, n_jobs: int = 1,
+                           semente: Optional[int] = None) -> np.ndarray:
+    """
+    Gera a distribuição bootstrap da diferença estatística(x) - estatística(y).
+
+    Args:
+        x, y (np.ndarray): Amostras dos dois aplicativos
+        estatistica (str): 'media', 'mediana', 'p90' ou 'sla'
+        n_reamostras (int): Número de reamostras bootstrap
+        limite_sla (float): Limite em minutos usado quando estatistica='sla'
+        memoria_mb (float): Orçamento de memória por lote (MB)
+        n_jobs (int): Número de processos (1 = sem pool)
+        semente (int): Semente da SeedSequence raiz
+
+    Returns:
+        np.ndarray: Diferenças bootstrap (n_reamostras,)
+    """
+    if estatistica not in ESTATISTICAS:
+        raise ValueError(f"Estatística inválida: {estatistica!r} "
+                         f"(use uma de {sorted(ESTATISTICAS)})")
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    bytes_por_reamostra = _BYTES_POR_ELEMENTO * max(x.size, y.size)
+    tamanho_lote = int(max(1, min(n_reamostras, memoria_mb * 2**20 // bytes_por_reamostra)))
+    tamanhos = [tamanho_lote] * (n_reamostras // tamanho_lote)
+    if n_reamostras % tamanho_lote:
+        tamanhos.append(n_reamostras % tamanho_lote)
+
+    sementes = np.random.SeedSequence(semente).spawn(len(tamanhos))
+    tarefas = [(estatistica, limite_sla, tamanho, s) for tamanho, s in zip(tamanhos, sementes)]
+
+    if n_jobs == 1 or len(tarefas) == 1:
+        _inicializar_trabalhador(x, y)
+        lotes = [_reamostrar_lote(tarefa) for tarefa in tarefas]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_inicializar_trabalhador,
+                                 initargs=(x, y)) as pool:
+            lotes = list(pool.map(_reamostrar_lote, tarefas))
+    return np.concatenate(lotes)
+
+
+def ic_bootstrap_diferenca(x: np.ndarray, y: np.ndarray, estatistica: str = 'media',
+                           confianca: float = 0.95, metodo: str = 'bca',
+                           n_reamostras: int = 10_000, limite_sla: float = 8.0,
+                           memoria_mb: float = 256, n_jobs: int = 1,
+                           semente: Optional[int] = None) -> dict:
+    """
+    IC bootstrap (percentil ou BCa) para a diferença entre dois aplicativos.
+
+    Args:
+        x, y (np.ndarray): Amostras dos dois aplicativos
+        estatistica (str): 'media', 'mediana', 'p90' ou 'sla'
+        confianca (float): Nível de confiança
+        metodo (str): 'percentil' ou 'bca'
+        n_reamostras (int): Número de reamostras bootstrap
+        limite_sla (float): Limite em minutos usado quando estatistica='sla'
+        memoria_mb (float): Orçamento de memória por lote (MB)
+        n_jobs (int): Número de processos (1 = sem pool)
+        semente (int): Semente para reprodutibilidade
+
+    Returns:
+        dict: Resultados do IC para a diferença
+    """
+    if metodo not in ('percentil', 'bca'):
+        raise ValueError(f"Método inválido: {metodo!r} (use 'percentil' ou 'bca')")
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    diff = _estatistica(x, estatistica, limite_sla) - _estatistica(y, estatistica, limite_sla)
+    boot = distribuicao_bootstrap(x, y, estatistica, n_reamostras, limite_sla,
+                                  memoria_mb, n_jobs, semente)
+
+    alpha = 1 - confianca
+    probs = np.array([alpha / 2, 1 - alpha / 2])
+    if metodo == 'bca':
+        # Correção de viés (z0) e aceleração (a) pelo jackknife da diferença,
+        # retirando uma observação de cada amostra por vez: em y, a
+        # estatística entra com sinal negativo (diferença = s(x) - s(y))
+        z0 = stats.norm.ppf(np.mean(boot < diff) + 0.5 * np.mean(boot == diff))
+        est_x = _estatistica(x, estatistica, limite_sla)
+        est_y = _estatistica(y, estatistica, limite_sla)
+        num = den = 0.0
+        for amostra, theta in ((x, _jackknife(x, estatistica, limite_sla) - est_y),
+                               (y, est_x - _jackknife(y, estatistica, limite_sla))):
+            u = (amostra.size - 1) * (theta.mean() - theta)
+            num += np.sum(u ** 3) / amostra.size ** 3
+            den += np.sum(u ** 2) / amostra.size ** 2
+        a = num / (6 * den ** 1.5) if den > 0 else 0.0
+        z = stats.norm.ppf(probs)
+        probs = stats.norm.cdf(z0 + (z0 + z) / (1 - a * (z0 + z)))
+        if not np.all(np.isfinite(probs)):
+            # Distribuição degenerada (ex.: SLA constante): recai no percentil
+            probs = np.array([alpha / 2, 1 - alpha / 2])
+
+    li, ls = np.quantile(boot, probs)
+
+    return {
+        'confianca': confianca,
+        'estatistica': estatistica,
+        'metodo': metodo,
+        'n_reamostras': n_reamostras,
+        'diferenca': diff,
+        'se': float(np.std(boot, ddof=1)),
+        'vies': float(np.mean(boot) - diff),
+        'amplitude': float(ls - li),
+        'li': float(li),
+        'ls': float(ls)
+    }
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Cache de Resultados e Artefatos Endereçado por Conteúdo - Transporte Urbano
+
+Cada resultado (um ``Relatorio``) ou artefato (uma figura renderizada) é
+guardado sob uma chave que é o hash de tudo o que o determina:
+
+- o conteúdo do conjunto de dados (hash do CSV ou dos vetores);
+- o método que o produziu (ex.: 'AnaliseTransporte.relatorio');
+- os parâmetros (níveis, seções, pesquisa, perfil de qualidade, ...);
+- a versão do código (hash dos fontes do pacote).
+
+Assim, uma reexecução com os mesmos dados e parâmetros reaproveita o que já
+foi calculado, e qualquer alteração (no CSV, nos parâmetros ou no código)
+invalida apenas as entradas afetadas, sem apagar nada manualmente.
+
+As entradas ficam em um único diretório, uma por arquivo (``<chave>.pkl``
+para resultados, ``<chave>.<formato>`` para figuras), gravadas de forma
+atômica. A política de despejo remove entradas mais antigas que
+``max_idade_dias`` e, se o total passar de ``max_mb``, as menos usadas
+recentemente (o acesso atualiza a data de modificação). Com
+``forcar=True`` nenhuma entrada é lida, mas todas são regravadas.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+import filecmp
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from .dados import hash_vetores
+from .resultados import Relatorio
+
+
+@lru_cache(maxsize=1)
+def versao_codigo() -> str:
+    """
+    Hash dos fontes do pacote (qualquer alteração de código invalida o cache).
+
+    Returns:
+        str: Hash hexadecimal
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for caminho in sorted(Path(__file__).parent.glob('*.py')):
+        h.update(caminho.name.encode())
+        h.update(caminho.read_bytes())
+    return h.hexdigest()
+
+
+def hash_conjunto(conjunto) -> str:
+    """
+    Identificador do conteúdo de um ``DadosTransporte``.
+
+    Usa o hash do CSV de origem quando disponível; senão, o dos vetores.
+
+    Args:
+        conjunto (DadosTransporte): Conjunto de dados
+
+    Returns:
+        str: Hash hexadecimal
+    """
+    if conjunto.hash_conteudo is not None:
+        return conjunto.hash_conteudo
+    return hash_vetores(conjunto.apps, conjunto.offsets, conjunto.espera)
+
+
+def _serializar(valor):
+    """Conversão de tipos numpy/Path para a serialização da chave."""
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    return str(valor)
+
+
+class CacheResultados:
+    """
+    Cache em disco de relatórios e figuras, com despejo por idade e tamanho.
+
+    Attributes:
+        diretorio (Path): Diretório das entradas
+        max_bytes (int): Tamanho máximo total
+        max_idade (float): Idade máxima de uma entrada, em segundos
+        forcar (bool): Se True, ignora as entradas existentes (e as regrava)
+        acertos, falhas (int): Contadores de consultas
+    """
+
+    def __init__(self, diretorio: Union[str, Path] = 'outputs/.cache',
+                 max_mb: float = 256, max_idade_dias: float = 30,
+                 forcar: bool = False):
+        """
+        Args:
+            diretorio (str | Path): Diretório das entradas
+            max_mb (float): Tamanho máximo total, em MB
+            max_idade_dias (float): Idade máxima de uma entrada, em dias
+            forcar (bool): Se True, recalcula tudo e regrava as entradas
+        """
+        self.diretorio = Path(diretorio)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.max_idade = max_idade_dias * 86400
+        self.forcar = forcar
+        self.acertos = 0
+        self.falhas = 0
+
+    def chave(self, conjunto, metodo: str, **parametros) -> str:
+        """
+        Chave de uma entrada: hash de (dados, método, parâmetros, código).
+
+        Args:
+            conjunto (DadosTransporte): Conjunto de dados de entrada
+            metodo (str): Nome do método que produz o resultado
+            **parametros: Parâmetros que afetam o resultado
+
+        Returns:
+            str: Chave hexadecimal
+        """
+        conteudo = json.dumps([hash_conjunto(conjunto), metodo, parametros, versao_codigo()],
+                              sort_keys=True, default=_serializar)
+        return hashlib.blake2b(conteudo.encode(), digest_size=16).hexdigest()
+
+    def chave_figura(self, conjunto, tarefa, perfil, **parametros) -> str:
+        """
+        Chave de uma figura: dados, tarefa (nome, tamanho, estilo), perfil.
+
+        Args:
+            conjunto (DadosTransporte): Conjunto de dados desenhado
+            tarefa (TarefaFigura): Figura
+            perfil (PerfilQualidade): Perfil de qualidade
+            **parametros: Demais parâmetros que afetam o desenho
+
+        Returns:
+            str: Chave hexadecimal
+        """
+        return self.chave(conjunto, 'figura', nome=tarefa.nome, tamanho=tarefa.tamanho,
+                          estilo=tarefa.estilo, opcoes=tarefa.opcoes,
+                          perfil=tuple(perfil), **parametros)
+
+    def _caminho(self, chave: str, extensao: str) -> Path:
+        return self.diretorio / f"{chave}.{extensao}"
+
+    def _consultar(self, caminho: Path) -> bool:
+        """Registra a consulta e marca a entrada como usada agora."""
+        if self.forcar or not caminho.exists():
+            self.falhas += 1
+            return False
+        os.utime(caminho)
+        self.acertos += 1
+        return True
+
+    def _gravar_atomico(self, destino: Path, escrever) -> None:
+        """Grava em arquivo temporário e renomeia (leitores nunca veem parciais)."""
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(dir=self.diretorio, suffix='.tmp')
+        try:
+            with os.fdopen(descritor, 'wb') as arquivo:
+                escrever(arquivo)
+            os.replace(temporario, destino)
+        except BaseException:
+            os.unlink(temporario)
+            raise
+        self.despejar()
+
+    def obter_relatorio(self, chave: str) -> Optional[Relatorio]:
+        """
+        Relatório guardado sob a chave, ou None.
+
+        Args:
+            chave (str): Chave da entrada
+
+        Returns:
+            Relatorio | None: Relatório em cache
+        """
+        caminho = self._caminho(chave, 'pkl')
+        if not self._consultar(caminho):
+            return None
+        with open(caminho, 'rb') as arquivo:
+            return Relatorio(pickle.load(arquivo))
+
+    def guardar_relatorio(self, chave: str, relatorio: Relatorio) -> None:
+        """
+        Guarda um relatório (tabelas exatas, inclusive rótulos de pares).
+
+        Args:
+            chave (str): Chave da entrada
+            relatorio (Relatorio): Relatório calculado
+        """
+        self._gravar_atomico(self._caminho(chave, 'pkl'),
+                             lambda arquivo: pickle.dump(relatorio.tabelas, arquivo,
+                                                         protocol=pickle.HIGHEST_PROTOCOL))
+
+    def restaurar_arquivo(self, chave: str, destino: Union[str, Path]) -> bool:
+        """
+        Copia um artefato em cache para ``destino``, se existir.
+
+        O arquivo de destino só é reescrito se diferir do artefato.
+
+        Args:
+            chave (str): Chave da entrada
+            destino (str | Path): Caminho do arquivo de saída
+
+        Returns:
+            bool: True se o artefato estava em cache
+        """
+        destino = Path(destino)
+        caminho = self._caminho(chave, destino.suffix.lstrip('.'))
+        if not self._consultar(caminho):
+            return False
+        if not (destino.exists() and filecmp.cmp(caminho, destino, shallow=True)):
+            shutil.copyfile(caminho, destino)
+        return True
+
+    def guardar_arquivo(self, chave: str, origem: Union[str, Path]) -> None:
+        """
+        Guarda uma cópia de um artefato gerado.
+
+        Args:
+            chave (str): Chave da entrada
+            origem (str | Path): Arquivo gerado
+        """
+        origem = Path(origem)
+        with open(origem, 'rb') as arquivo_origem:
+            self._gravar_atomico(self._caminho(chave, origem.suffix.lstrip('.')),
+                                 lambda arquivo: shutil.copyfileobj(arquivo_origem, arquivo))
+
+    def despejar(self) -> int:
+        """
+        Aplica a política de despejo (idade máxima e tamanho total).
+
+        Returns:
+            int: Número de entradas removidas
+        """
+        if not self.diretorio.exists():
+            return 0
+        agora = time.time()
+        entradas = []
+        for caminho in self.diretorio.iterdir():
+            if caminho.suffix == '.tmp':
+                continue
+            estado = caminho.stat()
+            entradas.append((estado.st_mtime, estado.st_size, caminho))
+
+        removidas = 0
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        # Mais antigas (menos usadas) primeiro
+        for mtime, tamanho, caminho in sorted(entradas):
+            if agora - mtime <= self.max_idade and total <= self.max_bytes:
+                break
+            caminho.unlink(missing_ok=True)
+            total -= tamanho
+            removidas += 1
+        return removidas
+
+    def limpar(self) -> None:
+        """Remove todas as entradas."""
+        if self.diretorio.exists():
+            shutil.rmtree(self.diretorio)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Interface de Linha de Comando Unificada - Transporte Urbano
+
+Um único ponto de entrada executa as etapas pedidas sobre um conjunto de
+dados carregado uma só vez e compartilhado (mesmos vetores, sem cópia)
+entre ``AnaliseTransporte``, ``TestesHipoteses`` e
+``VisualizacoesExecutivas``:
+
+    python -m src [etapas ...] [--data CSV|.transp] [--output DIR]
+                  [--format text|json|parquet|arrow] [--no-plots]
+                  [--jobs N] [--profile PERFIL]
+                  [--cache-dir DIR] [--no-cache] [--force]
+                  [--trace ARQUIVO] [--trace-memory]
+
+Etapas: ``describe`` (estatísticas descritivas), ``intervals`` (intervalos
+de confiança), ``sla``, ``tests`` (testes de hipóteses), ``plots``
+(figuras) e ``all`` (todas; padrão).
+
+Com ``--format text`` os resultados são impressos como nos relatórios de
+cada módulo. Com ``json`` o relatório sai em JSON Lines na saída padrão
+(uma linha por resultado, com a coluna ``analise``), e com ``parquet`` ou
+``arrow`` é gravado em ``<output>/resultados/``. Os caminhos das figuras
+geradas entram no relatório como a tabela ``figuras``.
+
+Resultados e figuras ficam em um cache endereçado por conteúdo
+(``<output>/.cache`` por padrão): etapas cujos dados, parâmetros e código
+não mudaram são reaproveitadas. ``--force`` recalcula tudo (regravando o
+cache) e ``--no-cache`` desativa o cache.
+
+Com ``--trace`` cada etapa (carregamento, seções, testes, KDE e figuras) é
+medida (tempo, CPU e pico de RSS; pico alocado com ``--trace-memory``) e
+gravada no formato Chrome Trace / Perfetto, com uma tabela de resumo ao
+final (ver ``instrumentacao``).
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .renderizacao import PERFIL_PADRAO, PERFIS
+
+ETAPAS = ('describe', 'intervals', 'sla', 'tests', 'plots')
+
+# Seções de ``AnaliseTransporte.relatorio`` calculadas por etapa
+SECOES_ETAPA = {
+    'describe': ('descritivas',),
+    'intervals': ('ic_media', 'ic_diferenca_medias', 'ic_variancia',
+                  'ic_razao_variancias', 'ic_proporcao', 'ic_diferenca_proporcoes'),
+    'sla': ('sla',),
+}
+
+FORMATOS_SAIDA = ('text', 'json', 'parquet', 'arrow')
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Parser dos argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description='Análise estatística comparativa de aplicativos de transporte urbano.'
+    )
+    # Validadas em ``main``: com nargs='*', ``choices`` rejeita a lista vazia
+    parser.add_argument('etapas', nargs='*', metavar='etapa',
+                        help=f"etapas a executar: {', '.join(ETAPAS)} ou all (default: all)")
+    parser.add_argument('--data', default='data/transp_dados.csv',
+                        help='CSV com as colunas app e espera_min ou armazém .transp '
+                             '(default: %(default)s)')
+    parser.add_argument('--survey', default=None, metavar='ARQUIVO',
+                        help='CSV de respondentes (app, aprova) com a pesquisa de satisfação '
+                             '(default: pesquisa A/B da especificação)')
+    parser.add_argument('--output', default='outputs',
+                        help='diretório de saída (default: %(default)s)')
+    parser.add_argument('--format', default='text', choices=FORMATOS_SAIDA,
+                        help='formato dos resultados (default: %(default)s)')
+    parser.add_argument('--no-plots', action='store_true',
+                        help='não gera figuras, mesmo com a etapa all')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='processos para renderizar as figuras (default: %(default)s)')
+    parser.add_argument('--profile', default=PERFIL_PADRAO, choices=list(PERFIS),
+                        help='perfil de qualidade das figuras (default: %(default)s)')
+    parser.add_argument('--cache-dir', default=None,
+                        help='diretório do cache de resultados (default: <output>/.cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='não usa o cache de resultados')
+    parser.add_argument('--force', action='store_true',
+                        help='recalcula todas as etapas, ignorando o cache')
+    parser.add_argument('--trace', default=None, metavar='ARQUIVO',
+                        help='mede cada etapa e grava o trace (Chrome/Perfetto) em ARQUIVO')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='com --trace, mede também o pico alocado (tracemalloc; mais lento)')
+    return parser
+
+
+def _resolver_etapas(etapas: Sequence[str], sem_graficos: bool) -> list:
+    """Expande 'all' (ou nenhuma etapa), remove repetições e mantém a ordem."""
+    pedidas = set(ETAPAS) if not etapas or 'all' in etapas else set(etapas)
+    if sem_graficos:
+        pedidas.discard('plots')
+    return [etapa for etapa in ETAPAS if etapa in pedidas]
+
+
+def executar(args: argparse.Namespace) -> int:
+    """
+    Executa as etapas pedidas sobre um único carregamento dos dados.
+
+    Args:
+        args (argparse.Namespace): Argumentos de ``criar_parser``
+
+    Returns:
+        int: Código de saída (0 = sucesso)
+    """
+    if not args.trace:
+        return _executar_etapas(args)
+
+    from .instrumentacao import ativar, desativar
+
+    ativar(memoria=args.trace_memory)
+    try:
+        codigo = _executar_etapas(args)
+    finally:
+        coletor = desativar()
+    # Resumo fora da saída padrão quando ela carrega o relatório em JSON
+    destino = sys.stdout if args.format == 'text' else sys.stderr
+    coletor.imprimir_resumo(destino)
+    print(f"Trace gravado em: {coletor.exportar_chrome(args.trace)}", file=destino)
+    return codigo
+
+
+def _executar_etapas(args: argparse.Namespace) -> int:
+    """Corpo de ``executar`` (etapas medidas quando a instrumentação está ativa)."""
+    # Importações adiadas: ``--help`` não carrega as bibliotecas de análise
+    from .analise_transporte import AnaliseTransporte
+    from .cache import CacheResultados
+    from .dados import DadosTransporte
+    from .instrumentacao import etapa as medir
+    from .pesquisa import carregar_pesquisa
+    from .renderizacao import renderizar
+    from .resultados import Relatorio, _pyarrow
+    from .testes_hipoteses import TestesHipoteses
+    from .visualizacoes_executivas import VisualizacoesExecutivas
+
+    texto = args.format == 'text'
+    for arquivo in (args.data, args.survey):
+        if arquivo and not Path(arquivo).exists():
+            print(f"Erro: Arquivo {arquivo} não encontrado!", file=sys.stderr)
+            return 1
+    if args.format in ('parquet', 'arrow'):
+        try:
+            _pyarrow()
+        except ImportError as erro:
+            print(f"Erro: {erro}", file=sys.stderr)
+            return 1
+
+    etapas = _resolver_etapas(args.etapas, args.no_plots)
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    cache = None
+    if not args.no_cache:
+        cache = CacheResultados(args.cache_dir or output_dir / '.cache', forcar=args.force)
+    
+    # Dados carregados uma única vez e compartilhados pelas três classes
+    conjunto = DadosTransporte.carregar(args.data)
+    pesquisa = None
+    if args.survey:
+        with medir('pesquisa', 'cli'):
+            pesquisa = carregar_pesquisa(args.survey).por_app()
+    analise = AnaliseTransporte(conjunto, output_dir, pesquisa=pesquisa, verboso=texto,
+                                cache=cache)
+    relatorio = Relatorio()
+
+    secoes = [secao for etapa in etapas for secao in SECOES_ETAPA.get(etapa, ())]
+    if secoes:
+        with medir('analise', 'cli', secoes=','.join(secoes)):
+            relatorio_analise = analise.relatorio(secoes=secoes)
+            if texto:
+                analise.imprimir_relatorio(relatorio_analise)
+        relatorio.tabelas.update(relatorio_analise.tabelas)
+
+    if 'tests' in etapas:
+        with medir('tests', 'cli'):
+            testes = TestesHipoteses(conjunto, pesquisa=analise.pesquisa, cache=cache)
+            if texto:
+                print()
+                testes.executar_todos_testes()
+            else:
+                relatorio.tabelas.update(testes.relatorio().tabelas)
+
+    if 'plots' in etapas:
+        with medir('plots', 'cli'):
+            visualizacoes = VisualizacoesExecutivas(conjunto, output_dir, pesquisa=analise.pesquisa,
+                                                    cache=cache)
+            tarefas_analise = analise.tarefas_figuras()
+            tarefas_executivas = visualizacoes.tarefas_figuras()
+            tarefas = tarefas_analise + tarefas_executivas
+            chaves = None
+            if cache is not None:
+                chaves = (analise.chaves_figuras(tarefas_analise, args.profile)
+                          + visualizacoes.chaves_figuras(tarefas_executivas, args.profile))
+            if texto:
+                print("\nGerando figuras...")
+            caminhos = renderizar(
+                tarefas, output_dir, args.profile, args.jobs,
+                ao_concluir=(lambda tarefa, caminho: print(f"✓ {tarefa.nome} salvo em: {caminho}"))
+                if texto else None,
+                cache=cache, chaves=chaves
+            )
+        relatorio.adicionar('figuras', _tabela_figuras(tarefas, caminhos))
+
+    with medir('exportar', 'cli', formato=args.format):
+        if args.format == 'json':
+            relatorio.escrever_jsonl(sys.stdout)
+        elif not texto:
+            destino = relatorio.exportar(output_dir / 'resultados', args.format)
+            print(f"Resultados gravados em: {destino}/")
+    if texto and cache is not None:
+        print(f"\nCache ({cache.diretorio}): {cache.acertos} reaproveitado(s), "
+              f"{cache.falhas} recalculado(s)")
+    return 0
+
+
+def _tabela_figuras(tarefas: list, caminhos: list):
+    """Tabela (nome, caminho) das figuras geradas."""
+    import pandas as pd
+    return pd.DataFrame({'nome': [t.nome for t in tarefas],
+                         'caminho': [str(c) for c in caminhos]})
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv (sequence): Argumentos (default: ``sys.argv[1:]``)
+
+    Returns:
+        int: Código de saída
+    """
+    parser = criar_parser()
+    args = parser.parse_args(argv)
+    invalidas = [etapa for etapa in args.etapas if etapa not in (*ETAPAS, 'all')]
+    if invalidas:
+        parser.error(f"etapa inválida: {', '.join(invalidas)} "
+                     f"(use {', '.join(ETAPAS)} ou all)")
+    return executar(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
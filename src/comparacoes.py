@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Comparações Entre Todos os Pares de Aplicativos - Transporte Urbano
+
+Com muitos aplicativos, comparar apenas o de referência com os demais não
+basta: com 30 aplicativos há 435 pares por métrica, e testá-los um a um
+com ``scipy.stats.ttest_ind`` é lento e ignora a multiplicidade. Este
+módulo testa todos os pares de uma vez a partir das estatísticas
+suficientes de cada grupo:
+
+- teste t de Welch (estatística, graus de liberdade de Welch-Satterthwaite
+  e p-valor bilateral) a partir de (n, média, variância);
+- teste Z de diferença de proporções (proporção pooled, bilateral) a
+  partir de (aprovações, total);
+
+calculados por broadcast em matrizes grupo x grupo. Os p-valores do
+triângulo superior (cada par uma vez) são ajustados por Holm (controle
+da taxa de erro por família) ou Benjamini-Hochberg (controle da taxa de
+falsas descobertas), e o resultado é uma tabela longa com um par por
+linha, que ``matriz_pares`` converte em matriz aplicativo x aplicativo.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ._importacao import importar_sob_demanda
+
+pd = importar_sob_demanda('pandas')
+stats = importar_sob_demanda('scipy.stats')
+
+# Ajustes de multiplicidade (ver ``ajustar_p_valores``)
+AJUSTES = ('holm', 'bh', 'nenhum')
+
+# Colunas que trocam de sinal quando o par é invertido (y - x)
+_ANTISSIMETRICAS = ('diferenca', 'estatistica')
+
+
+def ajustar_p_valores(p_valores, metodo: str = 'holm') -> np.ndarray:
+    """
+    Ajusta p-valores para comparações múltiplas.
+
+    - holm: p(i) · (m - i + 1), com máximo acumulado (step-down);
+    - bh: p(i) · m / i, com mínimo acumulado a partir do maior (step-up);
+    - nenhum: p-valores originais.
+
+    P-valores ausentes (NaN) são mantidos e não contam no número de testes.
+
+    Args:
+        p_valores (array-like): P-valores (qualquer forma)
+        metodo (str): 'holm', 'bh' ou 'nenhum'
+
+    Returns:
+        np.ndarray: P-valores ajustados, na forma e ordem da entrada
+    """
+    if metodo not in AJUSTES:
+        raise ValueError(f"Ajuste inválido: {metodo!r} (use um de {list(AJUSTES)})")
+    p = np.asarray(p_valores, dtype=np.float64)
+    ajustados = p.ravel().copy()
+    validos = np.flatnonzero(~np.isnan(ajustados))
+    m = validos.size
+    if metodo == 'nenhum' or m == 0:
+        return ajustados.reshape(p.shape)
+    ordem = validos[np.argsort(ajustados[validos], kind='stable')]
+    ordenados = ajustados[ordem]
+    posto = np.arange(1, m + 1)
+    if metodo == 'holm':
+        corrigidos = np.maximum.accumulate(ordenados * (m - posto + 1))
+    else:
+        corrigidos = np.minimum.accumulate((ordenados * m / posto)[::-1])[::-1]
+    ajustados[ordem] = np.minimum(corrigidos, 1.0)
+    return ajustados.reshape(p.shape)
+
+
+def welch_pares(n, media, variancia) -> dict:
+    """
+    Teste t de Welch para todos os pares (x, y), por broadcast.
+
+    Args:
+        n, media, variancia (array-like): Estatísticas de cada grupo
+            (variância amostral, ddof=1)
+
+    Returns:
+        dict: Matrizes (G, G) diferenca (x - y), se, estatistica, df e
+        p_valor; a diagonal é NaN
+    """
+    n = np.asarray(n, dtype=np.float64)
+    media = np.asarray(media, dtype=np.float64)
+    termo = np.asarray(variancia, dtype=np.float64) / n
+    se2 = termo[:, None] + termo[None, :]
+    df = se2 ** 2 / ((termo ** 2 / (n - 1))[:, None] + (termo ** 2 / (n - 1))[None, :])
+    diferenca = media[:, None] - media[None, :]
+    se = np.sqrt(se2)
+    t = diferenca / se
+    resultado = {'diferenca': diferenca, 'se': se, 'estatistica': t, 'df': df,
+                 'p_valor': 2 * stats.t.sf(np.abs(t), df)}
+    for matriz in resultado.values():
+        np.fill_diagonal(matriz, np.nan)
+    return resultado
+
+
+def z_proporcoes_pares(x, n) -> dict:
+    """
+    Teste Z de diferença de proporções para todos os pares (x, y).
+
+    Mesma estatística de ``TestesHipoteses.teste_diferenca_proporcoes``
+    (proporção pooled do par, bilateral).
+
+    Args:
+        x, n (array-like): Aprovações e total de cada grupo
+
+    Returns:
+        dict: Matrizes (G, G) diferenca (p_x - p_y), se, estatistica e
+        p_valor; a diagonal é NaN
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    p = x / n
+    p_pool = (x[:, None] + x[None, :]) / (n[:, None] + n[None, :])
+    se = np.sqrt(p_pool * (1 - p_pool) * (1 / n[:, None] + 1 / n[None, :]))
+    diferenca = p[:, None] - p[None, :]
+    z = diferenca / se
+    resultado = {'diferenca': diferenca, 'se': se, 'estatistica': z,
+                 'p_valor': 2 * stats.norm.sf(np.abs(z))}
+    for matriz in resultado.values():
+        np.fill_diagonal(matriz, np.nan)
+    return resultado
+
+
+def _tabela_pares(teste: str, matrizes: dict, rotulos: Optional[Sequence],
+                  ajuste: str, alpha: float) -> pd.DataFrame:
+    """Tabela longa do triângulo superior (um par por linha), com p ajustado."""
+    g = matrizes['diferenca'].shape[0]
+    rotulos = list(range(g)) if rotulos is None else list(rotulos)
+    i, j = np.triu_indices(g, 1)
+    grupos = np.empty(i.size, dtype=object)
+    # Atribuição elemento a elemento: os rótulos dos pares são tuplas
+    for k, (a, b) in enumerate(zip(i, j)):
+        grupos[k] = (rotulos[a], rotulos[b])
+    tabela = {'teste': teste, 'grupo': grupos}
+    tabela.update({nome: matriz[i, j] for nome, matriz in matrizes.items()})
+    tabela['p_ajustado'] = ajustar_p_valores(tabela['p_valor'], ajuste)
+    tabela['alpha'] = alpha
+    tabela['significativo'] = tabela['p_ajustado'] < alpha
+    return pd.DataFrame(tabela)
+
+
+def comparar_medias_pares(n, media, variancia, rotulos: Optional[Sequence] = None,
+                          ajuste: str = 'holm', alpha: float = 0.05) -> pd.DataFrame:
+    """
+    Welch entre todos os pares de grupos, com ajuste de multiplicidade.
+
+    Args:
+        n, media, variancia (array-like): Estatísticas de cada grupo
+        rotulos (sequence): Rótulos dos grupos
+        ajuste (str): 'holm', 'bh' ou 'nenhum'
+        alpha (float): Nível de significância (sobre o p-valor ajustado)
+
+    Returns:
+        pd.DataFrame: Um par (x, y) por linha, com diferenca, se,
+        estatistica, df, p_valor, p_ajustado e significativo
+    """
+    return _tabela_pares('welch', welch_pares(n, media, variancia), rotulos, ajuste, alpha)
+
+
+def comparar_proporcoes_pares(x, n, rotulos: Optional[Sequence] = None,
+                              ajuste: str = 'holm', alpha: float = 0.05) -> pd.DataFrame:
+    """
+    Teste Z de proporções entre todos os pares, com ajuste de multiplicidade.
+
+    Args:
+        x, n (array-like): Aprovações e total de cada grupo
+        rotulos (sequence): Rótulos dos grupos
+        ajuste (str): 'holm', 'bh' ou 'nenhum'
+        alpha (float): Nível de significância (sobre o p-valor ajustado)
+
+    Returns:
+        pd.DataFrame: Um par (x, y) por linha, com diferenca, se,
+        estatistica, p_valor, p_ajustado e significativo
+    """
+    return _tabela_pares('z', z_proporcoes_pares(x, n), rotulos, ajuste, alpha)
+
+
+def matriz_pares(tabela: pd.DataFrame, coluna: str = 'p_ajustado') -> pd.DataFrame:
+    """
+    Matriz grupo x grupo de uma coluna da tabela de pares.
+
+    Diferenças e estatísticas trocam de sinal abaixo da diagonal (y - x);
+    p-valores e demais colunas são simétricos.
+
+    Args:
+        tabela (pd.DataFrame): Tabela de ``comparar_medias_pares`` ou
+            ``comparar_proporcoes_pares``
+        coluna (str): Coluna exibida
+
+    Returns:
+        pd.DataFrame: Matriz com os rótulos nas linhas e colunas (diagonal NaN)
+    """
+    x = [par[0] for par in tabela['grupo']]
+    y = [par[1] for par in tabela['grupo']]
+    rotulos = list(dict.fromkeys(x + y))
+    posicao = {rotulo: k for k, rotulo in enumerate(rotulos)}
+    i = np.array([posicao[r] for r in x], dtype=np.int64)
+    j = np.array([posicao[r] for r in y], dtype=np.int64)
+    valores = tabela[coluna].to_numpy(dtype=np.float64)
+    matriz = np.full((len(rotulos), len(rotulos)), np.nan)
+    matriz[i, j] = valores
+    matriz[j, i] = -valores if coluna in _ANTISSIMETRICAS else valores
+    return pd.DataFrame(matriz, index=rotulos, columns=rotulos)
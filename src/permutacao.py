@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Testes de Permutação com Parada Sequencial - Transporte Urbano
+
+Este módulo complementa os p-valores assintóticos de
+``TestesHipoteses.teste_diferenca_medias`` com testes de permutação
+(bilaterais) para a estatística t de Welch, a diferença de medianas e a
+estatística U de Mann-Whitney.
+
+As permutações são avaliadas em lotes vetorizados: cada lote é uma matriz
+(lote x n) de embaralhamentos cujo tamanho respeita um orçamento de
+memória, de modo que a matriz completa (n x B) nunca é construída. Para
+Welch e Mann-Whitney basta a soma (e a soma dos quadrados) do primeiro
+grupo em cada permutação; os postos de Mann-Whitney são calculados uma
+única vez sobre a amostra combinada.
+
+A execução para assim que o p-valor de Monte Carlo estiver claramente
+acima ou abaixo de alpha:
+
+- Besag e Clifford (1991): após ``h`` permutações com estatística tão ou
+  mais extrema que a observada, o p-valor é ``h / L`` (L = permutações
+  usadas); a parada só ocorre se o limite inferior de Clopper-Pearson
+  de ``h / L`` já estiver acima de alpha;
+- o intervalo de Clopper-Pearson do p-valor deixa de conter alpha.
+
+Assim, os 10^5 embaralhamentos só são gastos em casos limítrofes.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from ._importacao import importar_sob_demanda
+from .instrumentacao import instrumentado
+
+stats = importar_sob_demanda('scipy.stats')
+
+ESTATISTICAS = ('welch', 'mediana', 'mannwhitney')
+
+# Primeiro lote (pequeno, para parar cedo em casos claros); os seguintes dobram
+_LOTE_INICIAL = 1000
+
+# Tolerância relativa ao comparar estatísticas permutadas com a observada
+_TOLERANCIA = 1e-12
+
+
+def _intervalo_clopper_pearson(k: int, m: int, confianca: float) -> tuple:
+    """Intervalo exato (Clopper-Pearson) para uma proporção k/m."""
+    alpha = 1 - confianca
+    li = stats.beta.ppf(alpha / 2, k, m - k + 1) if k > 0 else 0.0
+    ls = stats.beta.ppf(1 - alpha / 2, k + 1, m - k) if k < m else 1.0
+    return float(li), float(ls)
+
+
+class _Estatistica:
+    """Estatística bilateral avaliada em lotes de permutações da amostra combinada."""
+
+    def __init__(self, nome: str, x: np.ndarray, y: np.ndarray):
+        self.nome = nome
+        self.n1, self.n2 = x.size, y.size
+        combinada = np.concatenate((x, y))
+        if nome == 'mannwhitney':
+            # Postos calculados uma única vez; permutar postos equivale a permutar dados
+            combinada = stats.rankdata(combinada)
+        else:
+            # Centralizar reduz o cancelamento em somas de quadrados
+            combinada = combinada - combinada.mean()
+        self.combinada = combinada
+        self.soma = combinada.sum()
+        self.soma_quad = np.dot(combinada, combinada)
+
+    def __call__(self, matriz: np.ndarray) -> np.ndarray:
+        """Estatística (em valor absoluto) de cada linha de permutações."""
+        n1, n2 = self.n1, self.n2
+        primeiro = matriz[:, :n1]
+        if self.nome == 'mediana':
+            return np.abs(np.median(primeiro, axis=1) - np.median(matriz[:, n1:], axis=1))
+        s1 = primeiro.sum(axis=1)
+        if self.nome == 'mannwhitney':
+            return np.abs(s1 - n1 * (n1 + 1) / 2 - n1 * n2 / 2)
+        q1 = np.einsum('ij,ij->i', primeiro, primeiro)
+        s2, q2 = self.soma - s1, self.soma_quad - q1
+        v1 = (q1 - s1 ** 2 / n1) / (n1 - 1)
+        v2 = (q2 - s2 ** 2 / n2) / (n2 - 1)
+        return np.abs(s1 / n1 - s2 / n2) / np.sqrt(v1 / n1 + v2 / n2)
+
+    def observada(self) -> float:
+        """Estatística (com sinal) na divisão original: t, diferença de medianas ou U."""
+        n1 = self.n1
+        primeiro, segundo = self.combinada[:n1], self.combinada[n1:]
+        if self.nome == 'mediana':
+            return float(np.median(primeiro) - np.median(segundo))
+        if self.nome == 'mannwhitney':
+            return float(primeiro.sum() - n1 * (n1 + 1) / 2)
+        return float(np.sign(primeiro.mean() - segundo.mean())
+                     * self(self.combinada[None, :])[0])
+
+
+@instrumentado('permutacao', 'teste')
+def teste_permutacao(x: np.ndarray, y: np.ndarray, estatistica: str = 'welch',
+                     alpha: float = 0.05, max_permutacoes: int = 100_000,
+                     h: int = 20, confianca_parada: float = 0.999,
+                     memoria_mb: float = 64, semente: Optional[int] = None) -> dict:
+    """
+    Teste de permutação bilateral com parada sequencial.
+
+    Args:
+        x, y (np.ndarray): Amostras dos dois aplicativos
+        estatistica (str): 'welch', 'mediana' ou 'mannwhitney'
+        alpha (float): Nível de significância usado na regra de parada
+        max_permutacoes (int): Número máximo de permutações
+        h (int): Excedências que encerram o teste (Besag-Clifford)
+        confianca_parada (float): Confiança do intervalo de Clopper-Pearson
+            usado para decidir que p está abaixo (ou acima) de alpha
+        memoria_mb (float): Orçamento de memória por lote (MB)
+        semente (int): Semente para reprodutibilidade
+
+    Returns:
+        dict: Estatística observada, p-valor, permutações usadas e motivo
+        da parada ('besag_clifford', 'abaixo_alpha', 'acima_alpha' ou 'maximo')
+    """
+    if estatistica not in ESTATISTICAS:
+        raise ValueError(f"Estatística inválida: {estatistica!r} "
+                         f"(use uma de {list(ESTATISTICAS)})")
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    funcao = _Estatistica(estatistica, x, y)
+    observada = funcao.observada()
+    limiar = funcao(funcao.combinada[None, :])[0] * (1 - _TOLERANCIA)
+
+    rng = np.random.default_rng(semente)
+    n_total = funcao.combinada.size
+    lote_maximo = max(1, int(memoria_mb * 2**20 // (8 * n_total)))
+    lote = min(_LOTE_INICIAL, lote_maximo)
+
+    m = k = 0
+    parada = 'maximo'
+    while m < max_permutacoes:
+        tamanho = min(lote, max_permutacoes - m)
+        matriz = np.tile(funcao.combinada, (tamanho, 1))
+        rng.permuted(matriz, axis=1, out=matriz)
+        excede = funcao(matriz) >= limiar
+        del matriz
+
+        acumulado = k + np.cumsum(excede)
+        if acumulado[-1] >= h:
+            # Posição exata da h-ésima excedência dentro do lote
+            posicao = m + int(np.argmax(acumulado >= h)) + 1
+            if _intervalo_clopper_pearson(h, posicao, confianca_parada)[0] > alpha:
+                m, k = posicao, h
+                parada = 'besag_clifford'
+                break
+        m += tamanho
+        k = int(acumulado[-1])
+
+        li, ls = _intervalo_clopper_pearson(k, m, confianca_parada)
+        if ls < alpha:
+            parada = 'abaixo_alpha'
+            break
+        if li > alpha:
+            parada = 'acima_alpha'
+            break
+        lote = min(2 * lote, lote_maximo)
+
+    if parada == 'besag_clifford':
+        p_valor = k / m
+    else:
+        # Estimador que inclui a divisão observada (nunca retorna zero)
+        p_valor = (k + 1) / (m + 1)
+    li, ls = _intervalo_clopper_pearson(k, m, 0.95)
+
+    return {
+        'estatistica': estatistica,
+        'observada': observada,
+        'p_valor': p_valor,
+        'n_permutacoes': m,
+        'excedencias': k,
+        'parada': parada,
+        'p_li': li,
+        'p_ls': ls
+    }
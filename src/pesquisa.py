@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Microdados da Pesquisa de Satisfação - Transporte Urbano
+
+As classes de análise recebem a pesquisa como contagens por aplicativo
+({app: {'aprovacoes': x, 'total': n}}). Este módulo obtém essas contagens
+dos microdados: um arquivo com uma linha por respondente (colunas ``app``,
+``aprova`` e, opcionalmente, segmentos como cidade, região ou data, como
+os respondentes de ``gerador``), lido em blocos.
+
+Cada bloco é agregado sem laços por linha: os rótulos de cada coluna viram
+códigos inteiros (globais entre blocos), a combinação (app, segmentos) é
+codificada em uma única chave (``np.ravel_multi_index``) e aprovações e
+totais saem de duas chamadas a ``np.bincount``. O resultado é uma tabela
+de contingência app x segmentos (``PesquisaAgregada``), com intervalos de
+Wald e testes Z vetorizados sobre todas as células.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from . import intervalos
+from ._importacao import importar_sob_demanda
+from .dados import PESQUISA_PADRAO
+from .intervalos import NIVEIS_PADRAO
+
+pd = importar_sob_demanda('pandas')
+stats = importar_sob_demanda('scipy.stats')
+
+# Respostas da coluna ``aprova`` entendidas como aprovação
+VERDADEIROS = frozenset({'1', 'true', 'sim', 's', 'yes', 'y'})
+
+
+class PesquisaAgregada:
+    """
+    Aprovações e totais por aplicativo e segmento (tabela de contingência).
+
+    Attributes:
+        apps (list): Rótulos dos aplicativos (primeiro eixo)
+        segmentos (dict): {coluna: rótulos}, um eixo por coluna de segmento
+        aprovacoes (np.ndarray): Aprovações, forma (apps, *segmentos)
+        totais (np.ndarray): Respondentes, mesma forma
+    """
+
+    def __init__(self, apps: Sequence, segmentos: dict, aprovacoes: np.ndarray,
+                 totais: np.ndarray):
+        """
+        Args:
+            apps (sequence): Rótulos dos aplicativos
+            segmentos (dict): {coluna: rótulos} dos demais eixos
+            aprovacoes (np.ndarray): Aprovações por célula
+            totais (np.ndarray): Respondentes por célula
+        """
+        self.apps = [str(app) for app in apps]
+        self.segmentos = {coluna: [str(r) for r in rotulos] for coluna, rotulos in segmentos.items()}
+        self.aprovacoes = np.asarray(aprovacoes, dtype=np.int64)
+        self.totais = np.asarray(totais, dtype=np.int64)
+
+    @classmethod
+    def de_dicionario(cls, pesquisa: dict) -> "PesquisaAgregada":
+        """Tabela sem segmentos a partir de {app: {'aprovacoes', 'total'}}."""
+        return cls(list(pesquisa), {},
+                   [p['aprovacoes'] for p in pesquisa.values()],
+                   [p['total'] for p in pesquisa.values()])
+
+    def __len__(self) -> int:
+        return int(self.totais.sum())
+
+    def __repr__(self) -> str:
+        eixos = ", ".join(f"{coluna}: {len(r)}" for coluna, r in self.segmentos.items())
+        return (f"PesquisaAgregada({len(self)} respondentes, {len(self.apps)} apps"
+                + (f", {eixos})" if eixos else ")"))
+
+    def marginal(self, *colunas: str) -> "PesquisaAgregada":
+        """
+        Soma sobre os segmentos não pedidos.
+
+        Args:
+            *colunas (str): Segmentos mantidos (nenhum = apenas por app)
+
+        Returns:
+            PesquisaAgregada: Tabela com os eixos (app, *colunas)
+        """
+        nomes = list(self.segmentos)
+        invalidas = set(colunas) - set(nomes)
+        if invalidas:
+            raise ValueError(f"Segmentos inválidos: {sorted(invalidas)} (use {nomes})")
+        somados = tuple(1 + i for i, nome in enumerate(nomes) if nome not in colunas)
+        mantidos = [1 + nomes.index(c) for c in colunas]
+        # Eixos mantidos, na ordem pedida (os somados ficam com tamanho 1 no fim)
+        ordem = [0, *mantidos, *somados]
+        forma = [len(self.apps)] + [len(self.segmentos[c]) for c in colunas]
+
+        def somar(contagens: np.ndarray) -> np.ndarray:
+            return contagens.sum(axis=somados, keepdims=True).transpose(ordem).reshape(forma)
+
+        return PesquisaAgregada(self.apps, {c: self.segmentos[c] for c in colunas},
+                                somar(self.aprovacoes), somar(self.totais))
+
+    def segmento(self, **filtros) -> dict:
+        """
+        Contagens por aplicativo de um segmento, no formato das classes.
+
+        Segmentos não filtrados são somados. Exemplo:
+        ``pesquisa.segmento(cidade='Recife')``.
+
+        Args:
+            **filtros: {coluna: rótulo} do segmento
+
+        Returns:
+            dict: {app: {'aprovacoes': x, 'total': n}} (apps com respondentes)
+        """
+        tabela = self.marginal(*filtros)
+        indices = tuple(tabela.segmentos[c].index(str(v)) for c, v in filtros.items())
+        x = tabela.aprovacoes[(slice(None), *indices)]
+        n = tabela.totais[(slice(None), *indices)]
+        return {app: {'aprovacoes': int(xi), 'total': int(ni)}
+                for app, xi, ni in zip(self.apps, x, n) if ni}
+
+    def por_app(self) -> dict:
+        """Contagens por aplicativo (todos os segmentos somados)."""
+        return self.segmento()
+
+    def _celulas(self) -> tuple:
+        """Índices das células com respondentes e seus rótulos (app, *segmentos)."""
+        indices = np.nonzero(self.totais)
+        eixos = [self.apps] + list(self.segmentos.values())
+        rotulos = list(zip(*(np.asarray(r, dtype=object)[i] for r, i in zip(eixos, indices))))
+        return indices, [r[0] if len(r) == 1 else r for r in rotulos]
+
+    def tabela(self) -> pd.DataFrame:
+        """
+        Células com respondentes em formato longo.
+
+        Returns:
+            pd.DataFrame: Colunas app, segmentos, aprovacoes, total, proporcao
+        """
+        indices = np.nonzero(self.totais)
+        eixos = [self.apps] + list(self.segmentos.values())
+        colunas = {nome: np.asarray(r, dtype=object)[i]
+                   for nome, r, i in zip(['app', *self.segmentos], eixos, indices)}
+        x, n = self.aprovacoes[indices], self.totais[indices]
+        return pd.DataFrame({**colunas, 'aprovacoes': x, 'total': n, 'proporcao': x / n})
+
+    def ic_proporcao(self, niveis=NIVEIS_PADRAO, metodo: str = 'wald') -> pd.DataFrame:
+        """
+        IC da aprovação de todas as células (app, segmentos).
+
+        Em segmentos pequenos com aprovação alta, prefira 'wilson' ou
+        'clopper_pearson' (ver ``intervalos.limites_proporcao``).
+
+        Args:
+            niveis (sequence): Níveis de confiança
+            metodo (str): 'wald' (com se e margem_erro), 'wilson',
+                'agresti_coull' ou 'clopper_pearson'
+
+        Returns:
+            pd.DataFrame: Uma linha por (célula, nível); ``grupo`` é o app ou
+            a tupla (app, *segmentos)
+        """
+        indices, rotulos = self._celulas()
+        x, n = self.aprovacoes[indices], self.totais[indices]
+        if metodo == 'wald':
+            return intervalos.ic_proporcao_wald(x, n, niveis, rotulos)
+        return intervalos.ic_proporcao(x, n, niveis, rotulos, metodo)
+
+    def _pares(self, app_x: Optional[str], app_y: Optional[str]) -> tuple:
+        """Par (x, y) e suas contagens (eixos de segmento preservados)."""
+        app_x = app_x or self.apps[0]
+        app_y = app_y or self.apps[1]
+        i, j = self.apps.index(app_x), self.apps.index(app_y)
+        return (app_x, app_y, self.aprovacoes[i], self.totais[i],
+                self.aprovacoes[j], self.totais[j])
+
+    def _rotulos_segmentos(self, mascara: np.ndarray) -> tuple:
+        """Índices e rótulos das células de segmento selecionadas."""
+        indices = np.nonzero(mascara)
+        rotulos = list(zip(*(np.asarray(r, dtype=object)[i]
+                             for r, i in zip(self.segmentos.values(), indices))))
+        return indices, [r[0] if len(r) == 1 else r for r in rotulos]
+
+    def ic_diferenca_proporcoes(self, app_x: Optional[str] = None,
+                                app_y: Optional[str] = None,
+                                niveis=NIVEIS_PADRAO) -> pd.DataFrame:
+        """
+        IC de Wald da diferença de aprovação (x - y) em cada segmento.
+
+        Args:
+            app_x, app_y (str): Aplicativos comparados (default: os dois primeiros)
+            niveis (sequence): Níveis de confiança
+
+        Returns:
+            pd.DataFrame: Uma linha por (segmento, nível) com ambos os apps
+            presentes; sem segmentos, ``grupo`` é o par (x, y)
+        """
+        app_x, app_y, x1, n1, x2, n2 = self._pares(app_x, app_y)
+        if not self.segmentos:
+            return intervalos.ic_diferenca_proporcoes_wald(x1, n1, x2, n2, niveis,
+                                                           [(app_x, app_y)])
+        indices, rotulos = self._rotulos_segmentos((n1 > 0) & (n2 > 0))
+        return intervalos.ic_diferenca_proporcoes_wald(x1[indices], n1[indices], x2[indices],
+                                                       n2[indices], niveis, rotulos)
+
+    def teste_diferenca_proporcoes(self, app_x: Optional[str] = None,
+                                   app_y: Optional[str] = None) -> pd.DataFrame:
+        """
+        Teste Z (proporção pooled, bilateral) de x vs y em cada segmento.
+
+        Mesma estatística de ``TestesHipoteses.teste_diferenca_proporcoes``,
+        calculada para todos os segmentos de uma vez.
+
+        Args:
+            app_x, app_y (str): Aplicativos comparados (default: os dois primeiros)
+
+        Returns:
+            pd.DataFrame: Colunas grupo (segmento), x1, n1, x2, n2, p1, p2,
+            diferenca, z e p_valor
+        """
+        app_x, app_y, x1, n1, x2, n2 = self._pares(app_x, app_y)
+        if self.segmentos:
+            indices, rotulos = self._rotulos_segmentos((n1 > 0) & (n2 > 0))
+            x1, n1, x2, n2 = x1[indices], n1[indices], x2[indices], n2[indices]
+        else:
+            x1, n1, x2, n2 = (np.atleast_1d(v) for v in (x1, n1, x2, n2))
+            rotulos = [(app_x, app_y)]
+        p1, p2 = x1 / n1, x2 / n2
+        p_pool = (x1 + x2) / (n1 + n2)
+        z = (p1 - p2) / np.sqrt(p_pool * (1 - p_pool) * (1 / n1 + 1 / n2))
+        grupos = np.empty(len(rotulos), dtype=object)
+        grupos[:] = rotulos
+        return pd.DataFrame({'grupo': grupos, 'x1': x1, 'n1': n1, 'x2': x2, 'n2': n2,
+                             'p1': p1, 'p2': p2, 'diferenca': p1 - p2, 'z': z,
+                             'p_valor': 2 * stats.norm.sf(np.abs(z))})
+
+
+def _codigos_globais(categorias, rotulos: dict) -> np.ndarray:
+    """Mapa código local -> código global, registrando rótulos novos."""
+    return np.array([rotulos.setdefault(str(r), len(rotulos)) for r in categorias],
+                    dtype=np.int64)
+
+
+def _ampliar(contagens: np.ndarray, forma: tuple) -> np.ndarray:
+    """Completa a tabela com zeros até a forma (rótulos novos no fim dos eixos)."""
+    if contagens.shape == forma:
+        return contagens
+    return np.pad(contagens, [(0, f - s) for s, f in zip(contagens.shape, forma)])
+
+
+def carregar_pesquisa(caminho: Union[str, Path], segmentos: Sequence[str] = (),
+                      chunksize: int = 1_000_000) -> PesquisaAgregada:
+    """
+    Lê os microdados da pesquisa em blocos e agrega por app e segmento.
+
+    Args:
+        caminho (str | Path): CSV com uma linha por respondente e as colunas
+            ``app``, ``aprova`` (1/0, true/false, sim/não) e os segmentos
+        segmentos (sequence): Colunas de segmento (ex.: ['cidade', 'data'])
+        chunksize (int): Linhas lidas por bloco
+
+    Returns:
+        PesquisaAgregada: Tabela de contingência app x segmentos, com os
+        rótulos de cada eixo em ordem crescente
+    """
+    colunas = ['app', *segmentos]
+    rotulos = {coluna: {} for coluna in colunas}
+    aprovacoes = totais = np.zeros((0,) * len(colunas), dtype=np.int64)
+    leitor = pd.read_csv(caminho, usecols=[*colunas, 'aprova'],
+                         dtype={coluna: 'category' for coluna in [*colunas, 'aprova']},
+                         chunksize=chunksize)
+    for bloco in leitor:
+        aprova = bloco['aprova'].cat.categories.str.strip().str.lower().isin(VERDADEIROS)
+        codigos_aprova = bloco['aprova'].cat.codes.to_numpy()
+        validos = codigos_aprova >= 0
+        codigos = []
+        for coluna in colunas:
+            serie = bloco[coluna]
+            locais = serie.cat.codes.to_numpy()
+            validos &= locais >= 0
+            codigos.append(_codigos_globais(serie.cat.categories, rotulos[coluna])[locais])
+        forma = tuple(len(rotulos[coluna]) for coluna in colunas)
+        chaves = np.ravel_multi_index([c[validos] for c in codigos], forma)
+        sim = np.asarray(aprova)[codigos_aprova[validos]]
+        celulas = int(np.prod(forma))
+        aprovacoes = _ampliar(aprovacoes, forma) + np.bincount(
+            chaves[sim], minlength=celulas).reshape(forma)
+        totais = _ampliar(totais, forma) + np.bincount(chaves, minlength=celulas).reshape(forma)
+
+    # Eixos em ordem crescente dos rótulos (como as categorias do CSV)
+    eixos = []
+    for eixo, coluna in enumerate(colunas):
+        nomes = list(rotulos[coluna])
+        ordem = np.argsort(nomes, kind='stable')
+        aprovacoes = np.take(aprovacoes, ordem, axis=eixo)
+        totais = np.take(totais, ordem, axis=eixo)
+        eixos.append([nomes[i] for i in ordem])
+    return PesquisaAgregada(eixos[0], dict(zip(segmentos, eixos[1:])), aprovacoes, totais)
+
+
+# Fontes aceitas pelo parâmetro ``pesquisa`` das classes de análise
+FontePesquisa = Union[None, dict, str, Path, PesquisaAgregada]
+
+
+def obter_pesquisa(fonte: FontePesquisa) -> dict:
+    """
+    Contagens por aplicativo ({app: {'aprovacoes', 'total'}}) de qualquer fonte.
+
+    Args:
+        fonte: None (pesquisa padrão), dicionário de contagens,
+            ``PesquisaAgregada`` ou caminho dos microdados
+
+    Returns:
+        dict: Contagens por aplicativo
+    """
+    if fonte is None:
+        return PESQUISA_PADRAO
+    if isinstance(fonte, PesquisaAgregada):
+        return fonte.por_app()
+    if isinstance(fonte, (str, Path)):
+        return carregar_pesquisa(fonte).por_app()
+    return fonte
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Poder Estatístico e Tamanho Amostral - Transporte Urbano
+
+Este módulo estima o poder dos testes usados em ``TestesHipoteses``
+(Welch, Mann-Whitney e z para duas proporções) sobre grades de tamanhos
+de efeito e tamanhos de amostra, e procura o menor n (por grupo, amostras
+balanceadas) que atinge um poder alvo.
+
+Fórmulas fechadas são usadas onde existem: t não central para Welch
+(variâncias iguais, dados normais) e aproximação normal para o teste z de
+proporções. Para os demais casos (Mann-Whitney, dados não normais), o
+``SimuladorPoder`` usa Monte Carlo vetorizado com números aleatórios
+comuns: um único bloco (simulações x n_max) de sorteios é gerado e as
+amostras de tamanho n são seus prefixos, de modo que somas acumuladas dão
+as estatísticas de todos os n de uma vez e a busca por bisseção reaproveita
+os mesmos sorteios em todas as iterações.
+
+A simulação é limitada a ``N_MAX_SIMULACAO`` observações por grupo (o
+bloco de sorteios cresce com n_sim x n) e o Mann-Whitney processa as
+simulações em lotes dentro de ``memoria_mb``. Acima do limite, o poder vem
+das aproximações normais (t não central para Welch, fórmula de Noether
+para Mann-Whitney e teste z para proporções), que já são precisas nesses
+tamanhos.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from ._importacao import importar_sob_demanda
+from .valores_criticos import cache_criticos
+
+stats = importar_sob_demanda('scipy.stats')
+
+TESTES = ('welch', 'mannwhitney', 'proporcoes')
+
+# Maior n por grupo simulado; acima dele o poder é aproximado
+N_MAX_SIMULACAO = 2_000
+
+# Colunas usadas para estimar P(Y + d > X) na aproximação de Noether
+_COLUNAS_NOETHER = 1_000
+
+
+def _grade(efeitos, tamanhos) -> tuple:
+    """Efeitos como (1, D) e tamanhos como (N, 1), prontos para broadcast."""
+    efeitos = np.asarray(efeitos, dtype=np.float64).reshape(1, -1)
+    tamanhos = np.asarray(tamanhos, dtype=np.float64).reshape(-1, 1)
+    return efeitos, tamanhos
+
+
+def poder_welch_analitico(efeitos, tamanhos, alpha: float = 0.05) -> np.ndarray:
+    """
+    Poder do teste t bilateral (t não central) para efeitos de Cohen d.
+
+    Args:
+        efeitos (array-like): Tamanhos de efeito (Cohen's d)
+        tamanhos (array-like): Tamanhos de amostra por grupo
+        alpha (float): Nível de significância
+
+    Returns:
+        np.ndarray: Matriz (tamanhos x efeitos) de poder
+    """
+    d, n = _grade(efeitos, tamanhos)
+    df = 2 * n - 2
+    ncp = d * np.sqrt(n / 2)
+    t_crit = cache_criticos.t(1 - alpha / 2, df)
+    return stats.nct.sf(t_crit, df, ncp) + stats.nct.cdf(-t_crit, df, ncp)
+
+
+def poder_proporcoes_analitico(p1: float, p2, tamanhos,
+                               alpha: float = 0.05) -> np.ndarray:
+    """
+    Poder do teste z bilateral para duas proporções (aproximação normal).
+
+    Args:
+        p1 (float): Proporção do grupo de referência
+        p2 (array-like): Proporções alternativas do outro grupo
+        tamanhos (array-like): Tamanhos de amostra por grupo
+        alpha (float): Nível de significância
+
+    Returns:
+        np.ndarray: Matriz (tamanhos x proporções) de poder
+    """
+    p2, n = _grade(p2, tamanhos)
+    z_crit = cache_criticos.norm(1 - alpha / 2)
+    p_comb = (p1 + p2) / 2
+    se_h0 = np.sqrt(2 * p_comb * (1 - p_comb) / n)
+    se_h1 = np.sqrt((p1 * (1 - p1) + p2 * (1 - p2)) / n)
+    diff = np.abs(p1 - p2)
+    return (stats.norm.cdf((diff - z_crit * se_h0) / se_h1)
+            + stats.norm.cdf((-diff - z_crit * se_h0) / se_h1))
+
+
+class SimuladorPoder:
+    """
+    Poder por Monte Carlo com números aleatórios comuns.
+
+    Os sorteios de cada grupo formam matrizes (n_sim x n_max) estendidas sob
+    demanda; uma amostra de tamanho n é o prefixo das n primeiras colunas.
+    O efeito é um deslocamento (em desvios padrão) somado ao segundo grupo.
+
+    Attributes:
+        n_sim (int): Número de conjuntos de dados simulados
+        alpha (float): Nível de significância
+    """
+
+    def __init__(self, n_sim: int = 2000, alpha: float = 0.05,
+                 amostra_base: Optional[np.ndarray] = None,
+                 semente: Optional[int] = None,
+                 n_max_simulacao: int = N_MAX_SIMULACAO, memoria_mb: float = 256):
+        """
+        Inicializa o simulador.
+
+        Args:
+            n_sim (int): Número de conjuntos de dados simulados
+            alpha (float): Nível de significância
+            amostra_base (np.ndarray): Se informada, os dados são reamostrados
+                dela (padronizada) em vez de sorteados da normal
+            semente (int): Semente para reprodutibilidade
+            n_max_simulacao (int): Maior n por grupo simulado (acima dele, o
+                poder vem da aproximação normal de cada teste)
+            memoria_mb (float): Orçamento de memória por lote do Mann-Whitney (MB)
+        """
+        self.n_sim = n_sim
+        self.alpha = alpha
+        self.n_max_simulacao = n_max_simulacao
+        self.memoria_mb = memoria_mb
+        self._rng = np.random.default_rng(semente)
+        if amostra_base is None:
+            self._sortear = lambda tamanho: self._rng.standard_normal(tamanho)
+        else:
+            base = np.asarray(amostra_base, dtype=np.float64)
+            base = (base - base.mean()) / base.std(ddof=1)
+            self._sortear = lambda tamanho: self._rng.choice(base, size=tamanho)
+        self._x = np.empty((n_sim, 0))
+        self._y = np.empty((n_sim, 0))
+        self._u = (np.empty((n_sim, 0)), np.empty((n_sim, 0)))
+        self._somas = None
+
+    def _garantir(self, n_max: int) -> None:
+        """Estende os sorteios contínuos até n_max colunas."""
+        faltam = n_max - self._x.shape[1]
+        if faltam <= 0:
+            return
+        # Crescimento geométrico, sem passar do limite de simulação
+        faltam = max(faltam, min(self._x.shape[1], self.n_max_simulacao - self._x.shape[1]))
+        self._x = np.hstack((self._x, self._sortear((self.n_sim, faltam))))
+        self._y = np.hstack((self._y, self._sortear((self.n_sim, faltam))))
+        self._somas = None
+
+    def _somas_acumuladas(self) -> tuple:
+        """Somas e somas de quadrados acumuladas por prefixo (calculadas uma vez)."""
+        if self._somas is None:
+            self._somas = (np.cumsum(self._x, axis=1), np.cumsum(self._x ** 2, axis=1),
+                           np.cumsum(self._y, axis=1), np.cumsum(self._y ** 2, axis=1))
+        return self._somas
+
+    def poder_welch(self, efeitos, tamanhos) -> np.ndarray:
+        """
+        Poder simulado do teste de Welch bilateral.
+
+        Args:
+            efeitos (array-like): Deslocamentos em desvios padrão
+            tamanhos (array-like): Tamanhos de amostra por grupo
+
+        Returns:
+            np.ndarray: Matriz (tamanhos x efeitos) de poder
+        """
+        return self._por_faixa(efeitos, tamanhos, self._simular_welch,
+                               lambda d, n: poder_welch_analitico(d, n, self.alpha))
+
+    def _por_faixa(self, efeitos, tamanhos, simular: Callable, aproximar: Callable) -> np.ndarray:
+        """Simula os tamanhos até ``n_max_simulacao`` e aproxima os demais."""
+        d, n = _grade(efeitos, tamanhos)
+        n = n.ravel()
+        simulados = n <= self.n_max_simulacao
+        poder = np.empty((n.size, d.size))
+        if simulados.any():
+            poder[simulados] = simular(d.ravel(), n[simulados])
+        if not simulados.all():
+            poder[~simulados] = aproximar(d.ravel(), n[~simulados])
+        return poder
+
+    def _simular_welch(self, efeitos, tamanhos) -> np.ndarray:
+        d, n = _grade(efeitos, tamanhos)
+        n_int = n.astype(np.int64).ravel()
+        self._garantir(int(n_int.max()))
+        sx, qx, sy, qy = (s[:, n_int - 1] for s in self._somas_acumuladas())
+        # Matrizes (n_sim, N); o deslocamento não altera a variância
+        mx, my = sx / n_int, sy / n_int
+        a = (qx - sx * mx) / (n_int - 1) / n_int
+        b = (qy - sy * my) / (n_int - 1) / n_int
+        df = (a + b) ** 2 / (a ** 2 / (n_int - 1) + b ** 2 / (n_int - 1))
+        t = (mx - my)[:, :, None] - d[None, :, :]
+        t = t / np.sqrt(a + b)[:, :, None]
+        p = 2 * stats.t.sf(np.abs(t), df[:, :, None])
+        return np.mean(p < self.alpha, axis=0)
+
+    def poder_mannwhitney(self, efeitos, tamanhos) -> np.ndarray:
+        """
+        Poder simulado do teste de Mann-Whitney bilateral (aproximação normal).
+
+        Args:
+            efeitos (array-like): Deslocamentos em desvios padrão
+            tamanhos (array-like): Tamanhos de amostra por grupo
+
+        Returns:
+            np.ndarray: Matriz (tamanhos x efeitos) de poder
+        """
+        return self._por_faixa(efeitos, tamanhos, self._simular_mannwhitney,
+                               self._aproximar_mannwhitney)
+
+    def _simular_mannwhitney(self, efeitos, tamanhos) -> np.ndarray:
+        d, n = _grade(efeitos, tamanhos)
+        self._garantir(int(n.max()))
+        z_crit = cache_criticos.norm(1 - self.alpha / 2)
+        poder = np.empty((n.size, d.size))
+        for i, tamanho in enumerate(n.astype(np.int64).ravel()):
+            # Lotes de simulações: amostra combinada e dois argsort (int64)
+            bytes_por_simulacao = 3 * 8 * d.size * 2 * tamanho
+            lote = int(max(1, self.memoria_mb * 2**20 // bytes_por_simulacao))
+            rejeicoes = np.zeros(d.size)
+            for inicio in range(0, self.n_sim, lote):
+                x = self._x[inicio:inicio + lote, None, :tamanho]
+                y = self._y[inicio:inicio + lote, None, :tamanho] + d.reshape(1, -1, 1)
+                combinada = np.concatenate(np.broadcast_arrays(x, y), axis=2)
+                postos = combinada.argsort(axis=2).argsort(axis=2) + 1
+                u = postos[:, :, :tamanho].sum(axis=2) - tamanho * (tamanho + 1) / 2
+                z = (u - tamanho ** 2 / 2) / np.sqrt(tamanho ** 2 * (2 * tamanho + 1) / 12)
+                rejeicoes += np.sum(np.abs(z) > z_crit, axis=0)
+            poder[i] = rejeicoes / self.n_sim
+        return poder
+
+    def _aproximar_mannwhitney(self, efeitos, tamanhos) -> np.ndarray:
+        """Poder pela fórmula de Noether, com P(Y + d > X) estimado dos sorteios."""
+        d, n = _grade(efeitos, tamanhos)
+        colunas = min(_COLUNAS_NOETHER, self.n_max_simulacao)
+        self._garantir(colunas)
+        x, y = self._x[:, :colunas].ravel(), self._y[:, :colunas].ravel()
+        prob = np.array([np.mean(y + efeito > x) for efeito in d.ravel()])[None, :]
+        z_crit = cache_criticos.norm(1 - self.alpha / 2)
+        return stats.norm.cdf(np.sqrt(6 * n) * np.abs(prob - 0.5) - z_crit)
+
+    def poder_proporcoes(self, p1: float, p2, tamanhos) -> np.ndarray:
+        """
+        Poder simulado do teste z bilateral para duas proporções.
+
+        Args:
+            p1 (float): Proporção do grupo de referência
+            p2 (array-like): Proporções alternativas do outro grupo
+            tamanhos (array-like): Tamanhos de amostra por grupo
+
+        Returns:
+            np.ndarray: Matriz (tamanhos x proporções) de poder
+        """
+        return self._por_faixa(
+            p2, tamanhos, lambda q, n: self._simular_proporcoes(p1, q, n),
+            lambda q, n: poder_proporcoes_analitico(p1, q, n, self.alpha))
+
+    def _simular_proporcoes(self, p1: float, p2, tamanhos) -> np.ndarray:
+        p2, n = _grade(p2, tamanhos)
+        n_int = n.astype(np.int64).ravel()
+        n_max = int(n_int.max())
+        faltam = n_max - self._u[0].shape[1]
+        if faltam > 0:
+            faltam = max(faltam, min(self._u[0].shape[1],
+                                     self.n_max_simulacao - self._u[0].shape[1]))
+            self._u = tuple(np.hstack((u, self._rng.random((self.n_sim, faltam))))
+                            for u in self._u)
+        ux, uy = self._u
+        z_crit = cache_criticos.norm(1 - self.alpha / 2)
+        # Sucessos por prefixo: contagens acumuladas de uniformes abaixo de p
+        x1 = np.cumsum(ux[:, :n_max] < p1, axis=1)[:, n_int - 1][:, :, None]
+        x2 = np.stack([np.cumsum(uy[:, :n_max] < q, axis=1)[:, n_int - 1]
+                       for q in p2.ravel()], axis=2)
+        n3 = n_int[None, :, None]
+        p_comb = (x1 + x2) / (2 * n3)
+        se = np.sqrt(2 * p_comb * (1 - p_comb) / n3)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = np.where(se > 0, (x1 - x2) / n3 / se, 0.0)
+        return np.mean(np.abs(z) > z_crit, axis=0)
+
+    def tamanho_amostral(self, teste: str, efeito: float, poder_alvo: float = 0.8,
+                         p1: Optional[float] = None, n_min: int = 5,
+                         n_max: int = 100_000) -> int:
+        """
+        Menor n por grupo com poder simulado >= poder_alvo (bisseção).
+
+        Os sorteios são estendidos apenas até o limite superior da busca (e
+        no máximo até ``n_max_simulacao``) e reaproveitados em todas as
+        iterações; acima desse limite, a busca usa a aproximação normal.
+
+        Args:
+            teste (str): 'welch', 'mannwhitney' ou 'proporcoes'
+            efeito (float): Deslocamento em desvios padrão (ou p2, para
+                'proporcoes')
+            poder_alvo (float): Poder desejado
+            p1 (float): Proporção de referência (apenas para 'proporcoes')
+            n_min, n_max (int): Faixa de busca
+
+        Returns:
+            int: Tamanho de amostra por grupo (n_max se o alvo não for atingido)
+        """
+        poder = {
+            'welch': lambda n: self.poder_welch([efeito], [n])[0, 0],
+            'mannwhitney': lambda n: self.poder_mannwhitney([efeito], [n])[0, 0],
+            'proporcoes': lambda n: self.poder_proporcoes(p1, [efeito], [n])[0, 0],
+        }[teste]
+        return _bissecao(poder, poder_alvo, n_min, n_max)
+
+
+def _bissecao(poder: Callable[[int], float], poder_alvo: float,
+              n_min: int, n_max: int) -> int:
+    """Busca o menor n com poder(n) >= alvo: dobra o limite e depois bisseciona."""
+    baixo, alto = n_min, n_min
+    while poder(alto) < poder_alvo:
+        if alto >= n_max:
+            return n_max
+        baixo, alto = alto, min(2 * alto, n_max)
+    while alto - baixo > 1:
+        meio = (baixo + alto) // 2
+        if poder(meio) >= poder_alvo:
+            alto = meio
+        else:
+            baixo = meio
+    return alto
+
+
+def tamanho_amostral_analitico(teste: str, efeito: float, poder_alvo: float = 0.8,
+                               alpha: float = 0.05, p1: Optional[float] = None,
+                               n_min: int = 2, n_max: int = 10_000_000) -> int:
+    """
+    Menor n por grupo com poder (fórmula fechada) >= poder_alvo.
+
+    Args:
+        teste (str): 'welch' ou 'proporcoes'
+        efeito (float): Cohen's d (ou p2, para 'proporcoes')
+        poder_alvo (float): Poder desejado
+        alpha (float): Nível de significância
+        p1 (float): Proporção de referência (apenas para 'proporcoes')
+        n_min, n_max (int): Faixa de busca
+
+    Returns:
+        int: Tamanho de amostra por grupo
+    """
+    if teste == 'welch':
+        poder = lambda n: poder_welch_analitico([efeito], [n], alpha)[0, 0]
+    elif teste == 'proporcoes':
+        poder = lambda n: poder_proporcoes_analitico(p1, [efeito], [n], alpha)[0, 0]
+    else:
+        raise ValueError(f"Sem fórmula fechada para o teste {teste!r}")
+    return _bissecao(poder, poder_alvo, n_min, n_max)
+
+
+def grade_poder(teste: str, efeitos: Sequence[float], tamanhos: Sequence[int],
+                alpha: float = 0.05, metodo: str = 'analitico', p1: Optional[float] = None,
+                n_sim: int = 2000, amostra_base: Optional[np.ndarray] = None,
+                semente: Optional[int] = None) -> np.ndarray:
+    """
+    Poder sobre a grade (tamanhos x efeitos) para um teste.
+
+    Args:
+        teste (str): 'welch', 'mannwhitney' ou 'proporcoes'
+        efeitos (sequence): Cohen's d / deslocamentos (ou p2, para 'proporcoes')
+        tamanhos (sequence): Tamanhos de amostra por grupo
+        alpha (float): Nível de significância
+        metodo (str): 'analitico' (quando houver fórmula) ou 'simulacao'
+        p1 (float): Proporção de referência (apenas para 'proporcoes')
+        n_sim (int): Número de simulações
+        amostra_base (np.ndarray): Distribuição de onde reamostrar (simulação)
+        semente (int): Semente para reprodutibilidade
+
+    Returns:
+        np.ndarray: Matriz (tamanhos x efeitos) de poder
+    """
+    if teste not in TESTES:
+        raise ValueError(f"Teste inválido: {teste!r} (use um de {list(TESTES)})")
+    if metodo == 'analitico' and teste != 'mannwhitney':
+        if teste == 'welch':
+            return poder_welch_analitico(efeitos, tamanhos, alpha)
+        return poder_proporcoes_analitico(p1, efeitos, tamanhos, alpha)
+
+    simulador = SimuladorPoder(n_sim, alpha, amostra_base, semente)
+    if teste == 'welch':
+        return simulador.poder_welch(efeitos, tamanhos)
+    if teste == 'mannwhitney':
+        return simulador.poder_mannwhitney(efeitos, tamanhos)
+    return simulador.poder_proporcoes(p1, efeitos, tamanhos)
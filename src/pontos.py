@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Camada de Pontos Agregada para Gráficos por Grupo - Transporte Urbano
+
+Desenhar cada observação como um marcador (com deslocamento horizontal
+aleatório, o "jitter") só é viável para amostras pequenas: com milhões de
+corridas, o matplotlib cria milhões de marcadores, consome muita memória e
+grava arquivos enormes. Acima de um limite configurável de pontos por
+grupo, a camada passa a ser agregada, em um de dois modos:
+
+- ``subamostra``: subamostra estratificada que preserva as caudas (os
+  valores além dos bigodes do boxplot entram exatamente, até um pequeno
+  número fixo por lado; o restante é dividido em estratos de mesmo
+  tamanho na ordem dos valores, com um sorteio por estrato), de modo que
+  quantis e valores extremos continuam visíveis sem inflar as caudas;
+- ``faixa``: faixa de densidade (histograma dos valores desenhado como uma
+  única imagem vertical por grupo, com intensidade crescente com a
+  contagem), de custo constante no tamanho da amostra.
+
+Todo sorteio (jitter e subamostra) usa o gerador recebido, criado a partir
+de uma semente a cada desenho: a mesma figura é gerada byte a byte em
+qualquer execução ou processo.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+import numpy as np
+
+MODOS = ('auto', 'pontos', 'subamostra', 'faixa')
+
+# Pontos por grupo acima dos quais o modo 'auto' agrega a camada
+LIMITE_PONTOS_PADRAO = 5_000
+
+# Máximo de valores além dos bigodes mantidos exatamente em cada lado
+N_EXTREMOS = 5
+
+# Alcance dos bigodes do boxplot, em intervalos interquartis
+_BIGODE = 1.5
+
+# Número de classes da faixa de densidade
+_CLASSES_FAIXA = 200
+
+
+def subamostra_estratificada(ordenados: np.ndarray, n_max: int, rng: np.random.Generator,
+                             n_extremos: int = N_EXTREMOS) -> np.ndarray:
+    """
+    Subamostra estratificada de valores ordenados, preservando as caudas.
+
+    Os valores além dos bigodes do boxplot (Q1 - 1,5 IQR e Q3 + 1,5 IQR)
+    são mantidos exatamente, até os ``n_extremos`` mais extremos de cada
+    lado; o restante do orçamento é distribuído pelas demais observações
+    em estratos consecutivos de mesmo tamanho, com uma observação sorteada
+    por estrato. A subamostra é, assim, proporcional à distribuição (cada
+    quantil fica representado com erro de posto de no máximo um estrato,
+    mais os ``2 * n_extremos`` pontos exatos).
+
+    Args:
+        ordenados (np.ndarray): Valores do grupo, em ordem crescente
+        n_max (int): Tamanho máximo da subamostra
+        rng (np.random.Generator): Gerador dos sorteios
+        n_extremos (int): Máximo de valores exatos além de cada bigode
+
+    Returns:
+        np.ndarray: Subamostra ordenada (os próprios valores se n <= n_max)
+    """
+    n = len(ordenados)
+    if n <= n_max:
+        return ordenados
+    # Quartis por interpolação linear nas posições (os valores já estão
+    # ordenados; np.quantile copiaria o grupo inteiro)
+    posicoes = np.array([0.25, 0.75]) * (n - 1)
+    base = posicoes.astype(np.int64)
+    q1, q3 = ordenados[base] + (posicoes - base) * (ordenados[base + 1] - ordenados[base])
+    iqr = q3 - q1
+    n_extremos = max(0, min(n_extremos, (n_max - 1) // 2))
+    n_baixo = min(int(np.searchsorted(ordenados, q1 - _BIGODE * iqr, 'left')), n_extremos)
+    n_alto = min(n - int(np.searchsorted(ordenados, q3 + _BIGODE * iqr, 'right')), n_extremos)
+    n_miolo = n_max - n_baixo - n_alto
+    limites = np.linspace(n_baixo, n - n_alto, n_miolo + 1)
+    indices = (limites[:-1] + rng.random(n_miolo) * np.diff(limites)).astype(np.int64)
+    return np.concatenate([ordenados[:n_baixo], ordenados[indices], ordenados[n - n_alto:]])
+
+
+def resolver_modo(n: int, modo: str = 'auto', limite: int = LIMITE_PONTOS_PADRAO) -> str:
+    """
+    Modo efetivo da camada de pontos para um grupo de tamanho ``n``.
+
+    Args:
+        n (int): Número de observações do grupo
+        modo (str): 'auto', 'pontos', 'subamostra' ou 'faixa'
+        limite (int): Tamanho acima do qual 'auto' usa a subamostra
+
+    Returns:
+        str: 'pontos', 'subamostra' ou 'faixa'
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo inválido: {modo!r} (use um de {list(MODOS)})")
+    if modo == 'auto':
+        return 'pontos' if n <= limite else 'subamostra'
+    return modo
+
+
+def desenhar_pontos(ax, ordenados: np.ndarray, posicao: float, cor: str,
+                    rng: np.random.Generator, modo: str = 'auto',
+                    limite: int = LIMITE_PONTOS_PADRAO, dispersao: float = 0.04) -> str:
+    """
+    Desenha a camada de pontos de um grupo centrada em ``posicao``.
+
+    Args:
+        ax (matplotlib.axes.Axes): Eixos de destino
+        ordenados (np.ndarray): Valores do grupo, em ordem crescente
+        posicao (float): Posição horizontal do grupo
+        cor (str): Cor do grupo
+        rng (np.random.Generator): Gerador do jitter e da subamostra
+        modo (str): 'auto', 'pontos', 'subamostra' ou 'faixa'
+        limite (int): Máximo de marcadores por grupo (e limite do 'auto')
+        dispersao (float): Desvio padrão do jitter horizontal
+
+    Returns:
+        str: Modo efetivamente usado
+    """
+    modo = resolver_modo(len(ordenados), modo, limite)
+
+    if modo == 'faixa':
+        from matplotlib.colors import LinearSegmentedColormap, to_rgba
+
+        contagens, bordas = np.histogram(ordenados, bins=_CLASSES_FAIXA)
+        mapa = LinearSegmentedColormap.from_list('faixa', [to_rgba(cor, 0.0), to_rgba(cor, 0.8)])
+        largura = 3 * dispersao
+        # Raiz da contagem relativa: classes raras (caudas) continuam visíveis
+        ax.imshow(np.sqrt(contagens[:, None] / contagens.max()), cmap=mapa, vmin=0, vmax=1,
+                  extent=(posicao - largura, posicao + largura, bordas[0], bordas[-1]),
+                  origin='lower', aspect='auto', interpolation='nearest', zorder=3)
+        # imshow fixa os limites na extensão da imagem; volta a abranger
+        # todos os artistas dos eixos
+        ax.autoscale_view()
+        return modo
+
+    y = subamostra_estratificada(ordenados, limite, rng) if modo == 'subamostra' else ordenados
+    x = rng.normal(posicao, dispersao, size=len(y))
+    ax.scatter(x, y, alpha=0.4, color=cor, s=20)
+    return modo
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Renderização de Figuras sem Estado Global - Transporte Urbano
+
+As figuras do projeto são construídas com a API orientada a objetos do
+matplotlib (``matplotlib.figure.Figure`` renderizada pelo backend Agg),
+sem a máquina de estados do pyplot. Cada figura é descrita por uma
+``TarefaFigura``: o nome do arquivo, o tamanho, o estilo (aplicado com
+``rc_context`` apenas durante a construção e a gravação) e uma função que
+desenha na figura recebida. Figuras independentes podem então ser
+renderizadas em paralelo em um pool de processos; onde há ``fork``, os
+processos herdam as tarefas e recebem apenas o índice de cada uma, de
+modo que os dados desenhados (inclusive armazéns mapeados em memória e
+caches já calculados) não são serializados nem copiados.
+
+A resolução e o formato vêm de um perfil de qualidade:
+
+- ``rascunho``: 72 dpi, PNG, sem recorte justo (execuções de CI);
+- ``tela``: 110 dpi, PNG (pré-visualização);
+- ``impressao``: 300 dpi, PNG com recorte justo (padrão, relatórios);
+- ``vetorial``: SVG com recorte justo.
+
+A gravação é determinística: o SVG sai sem data e com identificadores
+internos de semente fixa, de modo que os mesmos dados geram o mesmo
+arquivo byte a byte (o PNG do Agg já não carrega data).
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional, Sequence, Union
+
+from .instrumentacao import etapa
+
+PerfilQualidade = namedtuple('PerfilQualidade', ['nome', 'dpi', 'formato', 'recorte_justo'])
+
+PERFIS = {
+    'rascunho': PerfilQualidade('rascunho', 72, 'png', False),
+    'tela': PerfilQualidade('tela', 110, 'png', True),
+    'impressao': PerfilQualidade('impressao', 300, 'png', True),
+    'vetorial': PerfilQualidade('vetorial', 300, 'svg', True),
+}
+
+PERFIL_PADRAO = 'impressao'
+
+# Semente dos identificadores internos do SVG (arquivos reproduzíveis)
+_SEMENTE_SVG = 'transporte-urbano'
+
+TarefaFigura = namedtuple('TarefaFigura',
+                          ['nome', 'desenhar', 'tamanho', 'estilo', 'opcoes', 'preparar'],
+                          defaults=((12, 8), (), {}, None))
+TarefaFigura.__doc__ = """
+Descrição de uma figura independente.
+
+Attributes:
+    nome (str): Nome do arquivo, sem extensão
+    desenhar (callable): Função ``desenhar(fig)`` que constrói a figura
+        (serializada para o pool apenas onde não há ``fork``)
+    tamanho (tuple): Tamanho da figura em polegadas
+    estilo (sequence): Estilos e dicionários de rcParams aplicados
+        durante a construção (como em ``matplotlib.style.context``)
+    opcoes (dict): Argumentos extras de ``savefig`` (ex.: facecolor)
+    preparar (callable): Cálculo sem argumentos executado no processo
+        principal antes do pool, compartilhado pelos trabalhadores (ex.:
+        grade de KDE usada por mais de uma figura); opcional
+"""
+
+
+def obter_perfil(perfil: Union[str, PerfilQualidade] = PERFIL_PADRAO,
+                 formato: Optional[str] = None) -> PerfilQualidade:
+    """
+    Resolve um perfil de qualidade, opcionalmente trocando o formato.
+
+    Args:
+        perfil (str | PerfilQualidade): Nome do perfil ou perfil pronto
+        formato (str): 'png' ou 'svg' (default: o do perfil)
+
+    Returns:
+        PerfilQualidade: Perfil resolvido
+    """
+    if not isinstance(perfil, PerfilQualidade):
+        if perfil not in PERFIS:
+            raise ValueError(f"Perfil inválido: {perfil!r} (use um de {list(PERFIS)})")
+        perfil = PERFIS[perfil]
+    if formato is not None:
+        perfil = perfil._replace(formato=formato)
+    return perfil
+
+
+def renderizar_figura(tarefa: TarefaFigura, output_dir: Union[str, Path],
+                      perfil: Union[str, PerfilQualidade] = PERFIL_PADRAO) -> Path:
+    """
+    Constrói e grava uma figura com o backend Agg, sem usar o pyplot.
+
+    Args:
+        tarefa (TarefaFigura): Figura a renderizar
+        output_dir (str | Path): Diretório de saída
+        perfil (str | PerfilQualidade): Perfil de qualidade
+
+    Returns:
+        Path: Caminho do arquivo gravado
+    """
+    from matplotlib import style
+    from matplotlib.figure import Figure
+
+    perfil = obter_perfil(perfil)
+    caminho = Path(output_dir) / f"{tarefa.nome}.{perfil.formato}"
+    opcoes = dict(tarefa.opcoes)
+    if perfil.formato == 'svg':
+        opcoes.setdefault('metadata', {'Date': None})
+    with etapa(tarefa.nome, 'figura', perfil=perfil.nome), \
+            style.context([*tarefa.estilo, {'svg.hashsalt': _SEMENTE_SVG}]):
+        fig = Figure(figsize=tarefa.tamanho)
+        with etapa('desenhar', 'figura', figura=tarefa.nome):
+            tarefa.desenhar(fig)
+        with etapa('savefig', 'figura', figura=tarefa.nome):
+            fig.savefig(caminho, dpi=perfil.dpi, format=perfil.formato,
+                        bbox_inches='tight' if perfil.recorte_justo else None,
+                        **opcoes)
+    return caminho
+
+
+def _inicializar_trabalhador() -> None:
+    """Garante o backend não interativo nos processos do pool."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _renderizar_em_trabalhador(argumentos: tuple) -> Path:
+    return renderizar_figura(*argumentos)
+
+
+# Argumentos das figuras pendentes, herdados pelos processos do pool
+# criados por fork (que recebem só o índice)
+_HERDADOS = []
+
+
+def _renderizar_herdada(indice: int) -> Path:
+    return renderizar_figura(*_HERDADOS[indice])
+
+
+def _renderizar_em_pool(argumentos: list, n_processos: int) -> list:
+    """
+    Renderiza as figuras em um pool de processos.
+
+    Com ``fork``, os processos herdam ``argumentos`` e recebem apenas
+    índices; sem ele (Windows, por exemplo), as tarefas são serializadas.
+    """
+    global _HERDADOS
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=n_processos,
+                                 initializer=_inicializar_trabalhador) as pool:
+            return list(pool.map(_renderizar_em_trabalhador, argumentos))
+    _HERDADOS = argumentos
+    try:
+        with ProcessPoolExecutor(max_workers=n_processos,
+                                 mp_context=multiprocessing.get_context('fork'),
+                                 initializer=_inicializar_trabalhador) as pool:
+            return list(pool.map(_renderizar_herdada, range(len(argumentos))))
+    finally:
+        _HERDADOS = []
+
+
+def renderizar(tarefas: Sequence[TarefaFigura], output_dir: Union[str, Path],
+               perfil: Union[str, PerfilQualidade] = PERFIL_PADRAO,
+               n_jobs: int = 1,
+               ao_concluir: Optional[Callable[[TarefaFigura, Path], None]] = None,
+               cache=None, chaves: Optional[Sequence[str]] = None) -> list:
+    """
+    Renderiza figuras independentes, em paralelo quando ``n_jobs > 1``.
+
+    Com um cache (``CacheResultados``) e uma chave por tarefa, figuras já
+    renderizadas são restauradas do cache e apenas as demais são
+    desenhadas (e então guardadas). Em paralelo, o ``preparar`` de cada
+    tarefa pendente roda antes no processo principal.
+
+    Args:
+        tarefas (sequence): Figuras a renderizar
+        output_dir (str | Path): Diretório de saída
+        perfil (str | PerfilQualidade): Perfil de qualidade
+        n_jobs (int): Número de processos (1 = no próprio processo)
+        ao_concluir (callable): Chamada com (tarefa, caminho) após cada
+            figura, na ordem das tarefas
+        cache (CacheResultados): Cache de artefatos (opcional)
+        chaves (sequence): Chave de cada tarefa no cache
+
+    Returns:
+        list: Caminhos gravados, na ordem das tarefas
+    """
+    perfil = obter_perfil(perfil)
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    caminhos = [None] * len(tarefas)
+
+    if cache is not None:
+        for i, (tarefa, chave) in enumerate(zip(tarefas, chaves)):
+            destino = Path(output_dir) / f"{tarefa.nome}.{perfil.formato}"
+            if cache.restaurar_arquivo(chave, destino):
+                caminhos[i] = destino
+    pendentes = [i for i, caminho in enumerate(caminhos) if caminho is None]
+    argumentos = [(tarefas[i], output_dir, perfil) for i in pendentes]
+
+    if n_jobs == 1 or len(pendentes) <= 1:
+        gerados = [renderizar_figura(*args) for args in argumentos]
+    else:
+        for i in pendentes:
+            if tarefas[i].preparar is not None:
+                tarefas[i].preparar()
+        gerados = _renderizar_em_pool(argumentos, min(n_jobs, len(pendentes)))
+
+    for i, caminho in zip(pendentes, gerados):
+        caminhos[i] = caminho
+        if cache is not None:
+            cache.guardar_arquivo(chaves[i], caminho)
+    if ao_concluir is not None:
+        for tarefa, caminho in zip(tarefas, caminhos):
+            ao_concluir(tarefa, caminho)
+    return caminhos
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Modelo de Resultados e Exportação - Transporte Urbano
+
+Os resultados das análises deixam de existir apenas como texto impresso:
+
+- cada teste de hipóteses é um ``ResultadoTeste`` (dataclass com
+  ``__slots__``, imutável), e listas de testes viram uma tabela colunar;
+- cada análise de intervalos já é uma tabela colunar (ver ``intervalos``);
+- um ``Relatorio`` reúne as tabelas de uma execução, na ordem das seções.
+
+Um relatório pode ser exportado em JSON Lines (um objeto por linha, com a
+coluna ``analise`` identificando a tabela), Parquet ou Arrow IPC (um
+arquivo por tabela). Relatórios de muitos segmentos (por exemplo, um por
+cidade ou por dia) são combinados com ``Relatorio.combinar`` e gravados de
+uma só vez, coluna a coluna, sem um dicionário por resultado.
+
+Parquet e Arrow exigem o pacote opcional ``pyarrow``, importado apenas na
+exportação; JSON Lines não tem dependências além do pandas.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, TextIO, Union
+
+import numpy as np
+
+from ._importacao import importar_sob_demanda
+
+pd = importar_sob_demanda('pandas')
+
+FORMATOS = ('jsonl', 'parquet', 'arrow')
+
+
+@dataclass(frozen=True, slots=True)
+class ResultadoTeste:
+    """
+    Resultado de um teste de hipóteses.
+
+    Attributes:
+        teste (str): Identificador do teste (ex.: 'welch', 'shapiro')
+        grupo (str): Aplicativo ou par comparado (ex.: 'A' ou 'A-B')
+        estatistica (float): Estatística do teste
+        p_valor (float): p-valor
+        alpha (float): Nível de significância usado na decisão
+    """
+
+    teste: str
+    grupo: str
+    estatistica: float
+    p_valor: float
+    alpha: float = 0.05
+
+    @property
+    def significativo(self) -> bool:
+        """Se H0 é rejeitada ao nível ``alpha``."""
+        return bool(self.p_valor < self.alpha)
+
+    def como_tupla(self) -> tuple:
+        """(estatística, p-valor), no formato dos retornos de scipy.stats."""
+        return self.estatistica, self.p_valor
+
+
+def rotulo_par(app_x: str, app_y: str) -> str:
+    """Rótulo textual de um par de aplicativos ('A-B')."""
+    return f"{app_x}-{app_y}"
+
+
+def tabela_testes(resultados: Iterable[ResultadoTeste]) -> pd.DataFrame:
+    """
+    Converte resultados de testes em uma tabela colunar.
+
+    Args:
+        resultados (iterable): Resultados de testes
+
+    Returns:
+        pd.DataFrame: Uma coluna por campo, mais ``significativo``
+    """
+    resultados = list(resultados)
+    colunas = {campo.name: [getattr(r, campo.name) for r in resultados]
+               for campo in fields(ResultadoTeste)}
+    tabela = pd.DataFrame(colunas)
+    tabela['significativo'] = tabela['p_valor'].to_numpy() < tabela['alpha'].to_numpy()
+    return tabela
+
+
+def _grupos_como_texto(tabela: pd.DataFrame) -> pd.DataFrame:
+    """Troca rótulos de pares (tuplas) por texto ('A-B') para exportação."""
+    if 'grupo' not in tabela or tabela['grupo'].dtype != object:
+        return tabela
+    tabela = tabela.copy()
+    tabela['grupo'] = [rotulo_par(*g) if isinstance(g, tuple) else g
+                       for g in tabela['grupo']]
+    return tabela
+
+
+def _pyarrow(alternativa: str = "use formato='jsonl' para exportar sem ele"):
+    """Importa pyarrow, com mensagem clara quando não estiver instalado."""
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401 (registra o submódulo)
+    except ImportError as erro:
+        raise ImportError(
+            "Os formatos Parquet/Arrow requerem o pacote opcional 'pyarrow' "
+            f"(pip install pyarrow); {alternativa}."
+        ) from erro
+    return pyarrow
+
+
+class Relatorio:
+    """
+    Conjunto ordenado de tabelas colunares de uma execução.
+
+    Attributes:
+        tabelas (dict): {nome da análise: pd.DataFrame}, na ordem das seções
+    """
+
+    def __init__(self, tabelas: Optional[dict] = None):
+        """
+        Args:
+            tabelas (dict): Tabelas iniciais {nome: DataFrame}
+        """
+        self.tabelas = dict(tabelas or {})
+
+    def adicionar(self, nome: str, tabela: Union[pd.DataFrame, Sequence[ResultadoTeste]]) -> None:
+        """
+        Adiciona (ou substitui) uma tabela.
+
+        Args:
+            nome (str): Nome da análise
+            tabela (pd.DataFrame | sequence): Tabela pronta ou lista de
+                ``ResultadoTeste``
+        """
+        if not isinstance(tabela, pd.DataFrame):
+            tabela = tabela_testes(tabela)
+        self.tabelas[nome] = tabela
+
+    def __getitem__(self, nome: str) -> pd.DataFrame:
+        return self.tabelas[nome]
+
+    def __contains__(self, nome: str) -> bool:
+        return nome in self.tabelas
+
+    def __iter__(self):
+        return iter(self.tabelas)
+
+    def __len__(self) -> int:
+        return len(self.tabelas)
+
+    def __repr__(self) -> str:
+        partes = ", ".join(f"{nome}: {len(t)}" for nome, t in self.tabelas.items())
+        return f"Relatorio({partes})"
+
+    def testes(self, nome: str) -> list:
+        """
+        Reconstrói os ``ResultadoTeste`` de uma tabela de testes.
+
+        Args:
+            nome (str): Nome da análise
+
+        Returns:
+            list: Resultados, na ordem da tabela
+        """
+        tabela = self.tabelas[nome]
+        colunas = [tabela[campo.name].tolist() for campo in fields(ResultadoTeste)]
+        return [ResultadoTeste(*valores) for valores in zip(*colunas)]
+
+    @classmethod
+    def combinar(cls, relatorios: dict, coluna: str = 'segmento') -> "Relatorio":
+        """
+        Empilha relatórios de vários segmentos, tabela a tabela.
+
+        Args:
+            relatorios (dict): {rótulo do segmento: Relatorio}
+            coluna (str): Nome da coluna que identifica o segmento
+
+        Returns:
+            Relatorio: Uma tabela por análise, com a coluna do segmento à
+            esquerda
+        """
+        nomes = []
+        for relatorio in relatorios.values():
+            nomes.extend(nome for nome in relatorio if nome not in nomes)
+        combinado = cls()
+        for nome in nomes:
+            partes = [(segmento, r[nome]) for segmento, r in relatorios.items() if nome in r]
+            tabela = pd.concat([t for _, t in partes], ignore_index=True)
+            tabela.insert(0, coluna, np.repeat([s for s, _ in partes], [len(t) for _, t in partes]))
+            combinado.tabelas[nome] = tabela
+        return combinado
+
+    def escrever_jsonl(self, arquivo: TextIO) -> None:
+        """
+        Escreve todas as tabelas em JSON Lines em um arquivo aberto.
+
+        Cada linha é um registro com a coluna ``analise`` (nome da tabela)
+        seguida das colunas da tabela; pares de aplicativos viram 'A-B'.
+
+        Args:
+            arquivo (TextIO): Destino (ex.: arquivo aberto ou ``sys.stdout``)
+        """
+        for nome, tabela in self.tabelas.items():
+            if not len(tabela):
+                continue
+            tabela = _grupos_como_texto(tabela)
+            tabela = tabela.assign(analise=nome)[['analise', *tabela.columns]]
+            linhas = tabela.to_json(orient='records', lines=True,
+                                    force_ascii=False, double_precision=15)
+            arquivo.write(linhas if linhas.endswith('\n') else linhas + '\n')
+
+    def exportar(self, destino: Union[str, Path], formato: str = 'jsonl') -> Path:
+        """
+        Grava o relatório em JSON Lines, Parquet ou Arrow IPC.
+
+        Args:
+            destino (str | Path): Arquivo (jsonl) ou diretório (parquet,
+                arrow; um arquivo ``<analise>.<formato>`` por tabela)
+            formato (str): 'jsonl', 'parquet' ou 'arrow'
+
+        Returns:
+            Path: Caminho gravado
+        """
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato inválido: {formato!r} (use um de {list(FORMATOS)})")
+        destino = Path(destino)
+
+        if formato == 'jsonl':
+            destino.parent.mkdir(parents=True, exist_ok=True)
+            with open(destino, 'w', encoding='utf-8') as arquivo:
+                self.escrever_jsonl(arquivo)
+            return destino
+
+        pa = _pyarrow()
+        destino.mkdir(parents=True, exist_ok=True)
+        for nome, tabela in self.tabelas.items():
+            tabela_arrow = pa.Table.from_pandas(_grupos_como_texto(tabela), preserve_index=False)
+            caminho = destino / f"{nome}.{formato}"
+            if formato == 'parquet':
+                pa.parquet.write_table(tabela_arrow, caminho)
+            else:
+                with pa.OSFile(str(caminho), 'wb') as arquivo, \
+                        pa.ipc.new_file(arquivo, tabela_arrow.schema) as escritor:
+                    escritor.write_table(tabela_arrow)
+        return destino
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Testes A/B Sequenciais com p-valores Sempre Válidos - Transporte Urbano
+
+Reexecutar ``TestesHipoteses.executar_todos_testes`` a cada novo lote de
+dados infla a taxa de falsos positivos (cada olhada é uma nova chance de
+p < alpha) e reprocessa todo o histórico. Este módulo implementa o teste
+sequencial por razão de verossimilhança com mistura (mSPRT, Johari et al.,
+2017) para a diferença de médias de espera e a diferença de proporções de
+aprovação.
+
+Com prior de mistura N(0, tau^2) sobre a diferença theta, a estatística é
+
+    Lambda_n = sqrt(V / (V + tau^2)) * exp(theta_hat^2 tau^2 / (2 V (V + tau^2)))
+
+em que V é a variância estimada de theta_hat. O p-valor sempre válido é
+``min(1, 1 / max Lambda)``, e o intervalo (sequência de confiança) é a
+interseção acumulada das regiões em que Lambda < 1 / alpha. Ambos podem ser
+consultados a qualquer momento sem inflar o erro tipo I (assintoticamente,
+pois V é estimada).
+
+O estado de cada grupo é formado por estatísticas suficientes (momentos de
+Welford ou contagens), e cada atualização custa O(1) por lote, sem
+reprocessar o histórico.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
+
+from .streaming import MomentosWelford
+
+
+class _TesteSequencial(ABC):
+    """
+    Base do mSPRT: acumula p-valor e sequência de confiança a cada atualização.
+
+    Subclasses implementam ``_estimativa``, que retorna (theta_hat, V) a
+    partir do estado atual, ou None enquanto não houver dados suficientes.
+
+    Attributes:
+        alpha (float): Nível de significância
+        tau (float): Desvio padrão do prior de mistura (escala do efeito)
+        p_valor (float): p-valor sempre válido
+        li, ls (float): Limites da sequência de confiança
+        n_atualizacoes (int): Número de atualizações recebidas
+    """
+
+    def __init__(self, alpha: float = 0.05, tau: float = 1.0):
+        self.alpha = alpha
+        self.tau = tau
+        self.p_valor = 1.0
+        self.li = -np.inf
+        self.ls = np.inf
+        self.n_atualizacoes = 0
+
+    @abstractmethod
+    def _estimativa(self) -> Optional[tuple]:
+        """(theta_hat, V) do estado atual, ou None sem dados suficientes."""
+
+    def _registrar(self) -> None:
+        """Atualiza p-valor e intervalo com o estado atual (O(1))."""
+        self.n_atualizacoes += 1
+        estimativa = self._estimativa()
+        if estimativa is None:
+            return
+        theta, v = estimativa
+        if not v > 0:
+            return
+        tau2 = self.tau ** 2
+        log_razao = (0.5 * np.log(v / (v + tau2))
+                     + theta ** 2 * tau2 / (2 * v * (v + tau2)))
+        self.p_valor = min(self.p_valor, float(np.exp(-log_razao)))
+        # Região {theta0 : Lambda(theta0) < 1/alpha}, centrada em theta_hat
+        meia_largura = np.sqrt(2 * v * (v + tau2) / tau2
+                               * (np.log(1 / self.alpha) + 0.5 * np.log((v + tau2) / v)))
+        self.li = max(self.li, theta - meia_largura)
+        self.ls = min(self.ls, theta + meia_largura)
+
+    def estado(self) -> dict:
+        """
+        Resultado do teste no momento atual.
+
+        Returns:
+            dict: diferença estimada, p-valor sempre válido, limites do
+            intervalo e se H0 (diferença nula) já pode ser rejeitada
+        """
+        estimativa = self._estimativa()
+        return {
+            'diferenca': float(estimativa[0]) if estimativa else np.nan,
+            'p_valor': self.p_valor,
+            'li': float(self.li),
+            'ls': float(self.ls),
+            'rejeita_h0': self.p_valor < self.alpha,
+            'n_atualizacoes': self.n_atualizacoes
+        }
+
+
+class SequencialMedias(_TesteSequencial):
+    """
+    mSPRT para a diferença de médias (x - y) com variâncias estimadas.
+
+    Attributes:
+        momentos_x, momentos_y (MomentosWelford): Momentos de cada grupo
+    """
+
+    def __init__(self, alpha: float = 0.05, tau: float = 1.0):
+        """
+        Args:
+            alpha (float): Nível de significância
+            tau (float): Escala do prior de mistura, em minutos (diferenças
+                de média desta ordem são detectadas mais rapidamente)
+        """
+        super().__init__(alpha, tau)
+        self.momentos_x = MomentosWelford()
+        self.momentos_y = MomentosWelford()
+
+    def atualizar(self, x=None, y=None) -> dict:
+        """
+        Incorpora novas corridas de um ou dos dois aplicativos.
+
+        Args:
+            x, y (float | array-like): Novos tempos de espera de cada app
+
+        Returns:
+            dict: Estado do teste após a atualização
+        """
+        if x is not None:
+            self.momentos_x.atualizar(np.atleast_1d(x))
+        if y is not None:
+            self.momentos_y.atualizar(np.atleast_1d(y))
+        self._registrar()
+        return self.estado()
+
+    def _estimativa(self):
+        mx, my = self.momentos_x, self.momentos_y
+        if mx.n < 2 or my.n < 2:
+            return None
+        return mx.media - my.media, mx.variancia / mx.n + my.variancia / my.n
+
+
+class SequencialProporcoes(_TesteSequencial):
+    """
+    mSPRT para a diferença de proporções (p_x - p_y).
+
+    Attributes:
+        sucessos (list): Aprovações acumuladas [x, y]
+        totais (list): Respostas acumuladas [x, y]
+    """
+
+    def __init__(self, alpha: float = 0.05, tau: float = 0.1):
+        """
+        Args:
+            alpha (float): Nível de significância
+            tau (float): Escala do prior de mistura (em pontos de proporção)
+        """
+        super().__init__(alpha, tau)
+        self.sucessos = [0, 0]
+        self.totais = [0, 0]
+
+    def atualizar(self, aprovacoes_x: int = 0, total_x: int = 0,
+                  aprovacoes_y: int = 0, total_y: int = 0) -> dict:
+        """
+        Incorpora novas respostas da pesquisa (contagens do lote).
+
+        Args:
+            aprovacoes_x, total_x (int): Aprovações e respostas do app x
+            aprovacoes_y, total_y (int): Aprovações e respostas do app y
+
+        Returns:
+            dict: Estado do teste após a atualização
+        """
+        self.sucessos[0] += aprovacoes_x
+        self.totais[0] += total_x
+        self.sucessos[1] += aprovacoes_y
+        self.totais[1] += total_y
+        self._registrar()
+        return self.estado()
+
+    def _estimativa(self):
+        (sx, sy), (nx, ny) = self.sucessos, self.totais
+        if nx == 0 or ny == 0:
+            return None
+        px, py = sx / nx, sy / ny
+        return px - py, px * (1 - px) / nx + py * (1 - py) / ny
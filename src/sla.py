@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Curvas de SLA por Função de Distribuição Empírica - Transporte Urbano
+
+O SLA em um limite L é a proporção de atendimentos com espera <= L, isto
+é, a função de distribuição empírica (ECDF) avaliada em L. Com as esperas
+de cada aplicativo ordenadas uma única vez, qualquer vetor de k limites é
+respondido por ``np.searchsorted`` em O(k log n), em vez de uma varredura
+completa dos dados por limite. Os grupos de ``DadosTransporte`` já são
+mantidos ordenados, então o índice é construído sem nenhuma ordenação
+adicional.
+
+As bandas de confiança são simultâneas (válidas para a curva inteira),
+pela desigualdade de Dvoretzky-Kiefer-Wolfowitz:
+``P(sup |F_n - F| > eps) <= 2 exp(-2 n eps^2)``. Para a diferença entre
+dois aplicativos, cada curva recebe metade do alpha e as margens somam.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ._importacao import importar_sob_demanda
+
+pd = importar_sob_demanda('pandas')
+
+# Limites padrão da curva completa: 0 a 60 min com resolução de 0,1 min
+GRADE_PADRAO = np.round(np.arange(0, 600 + 1) * 0.1, 1)
+
+
+def margem_dkw(n, confianca: float = 0.95):
+    """
+    Margem da banda simultânea DKW para uma ECDF com n observações.
+
+    Args:
+        n (int | array-like): Tamanho(s) da amostra
+        confianca (float): Nível de confiança
+
+    Returns:
+        float | np.ndarray: Margem eps (em proporção)
+    """
+    return np.sqrt(np.log(2 / (1 - confianca)) / (2 * np.asarray(n, dtype=np.float64)))
+
+
+class _CurvaECDF(ABC):
+    """
+    Bandas DKW, diferenças e tabelas de curvas de SLA por aplicativo.
+
+    Subclasses definem ``apps``, ``n`` (observações por aplicativo) e a
+    proporção acumulada ``sla``; o restante depende apenas delas.
+
+    Attributes:
+        apps (list): Rótulos dos aplicativos
+        n (np.ndarray): Observações de cada aplicativo
+    """
+
+    def _indice(self, app: str) -> int:
+        return self.apps.index(app)
+
+    @abstractmethod
+    def sla(self, limites, app: Optional[str] = None) -> np.ndarray:
+        """
+        Proporção de atendimentos com espera <= limite.
+
+        Args:
+            limites (float | array-like): Limites em minutos
+            app (str): Aplicativo; se None, todos
+
+        Returns:
+            np.ndarray: (k,) para um app ou (apps x k) para todos
+        """
+
+    def bandas(self, limites, confianca: float = 0.95,
+               app: Optional[str] = None) -> tuple:
+        """
+        Curva de SLA com banda simultânea DKW.
+
+        Args:
+            limites (array-like): Limites em minutos
+            confianca (float): Nível de confiança da banda (curva inteira)
+            app (str): Aplicativo; se None, todos
+
+        Returns:
+            tuple: (sla, li, ls), no formato de ``sla``
+        """
+        sla = self.sla(limites, app)
+        n = self.n[self._indice(app)] if app is not None else self.n[:, None]
+        eps = margem_dkw(n, confianca)
+        return sla, np.clip(sla - eps, 0, 1), np.clip(sla + eps, 0, 1)
+
+    def diferenca(self, app_x: str, app_y: str, limites,
+                  confianca: float = 0.95) -> tuple:
+        """
+        Diferença de curvas (x - y) com banda simultânea.
+
+        Cada curva usa banda DKW com alpha/2, de modo que a banda da
+        diferença (soma das margens) cobre a curva inteira com a confiança
+        pedida.
+
+        Args:
+            app_x, app_y (str): Aplicativos comparados
+            limites (array-like): Limites em minutos
+            confianca (float): Nível de confiança conjunto
+
+        Returns:
+            tuple: (diferenca, li, ls)
+        """
+        confianca_cada = 1 - (1 - confianca) / 2
+        eps = (margem_dkw(self.n[self._indice(app_x)], confianca_cada)
+               + margem_dkw(self.n[self._indice(app_y)], confianca_cada))
+        diff = self.sla(limites, app_x) - self.sla(limites, app_y)
+        return diff, np.clip(diff - eps, -1, 1), np.clip(diff + eps, -1, 1)
+
+    def tabela(self, limites: Sequence[float] = GRADE_PADRAO,
+               confianca: float = 0.95) -> pd.DataFrame:
+        """
+        Curvas de todos os aplicativos em formato longo.
+
+        Returns:
+            pd.DataFrame: Colunas grupo, limite, sla, li, ls
+        """
+        limites = np.asarray(limites, dtype=np.float64)
+        sla, li, ls = self.bandas(limites, confianca)
+        return pd.DataFrame({
+            'grupo': np.repeat(self.apps, limites.size),
+            'limite': np.tile(limites, len(self.apps)),
+            'sla': sla.ravel(),
+            'li': li.ravel(),
+            'ls': ls.ravel()
+        })
+
+    def tabela_diferencas(self, pares: Sequence[tuple],
+                          limites: Sequence[float] = GRADE_PADRAO,
+                          confianca: float = 0.95) -> pd.DataFrame:
+        """
+        Diferenças de curvas de vários pares em formato longo.
+
+        Returns:
+            pd.DataFrame: Colunas grupo (par), limite, diferenca, li, ls
+        """
+        limites = np.asarray(limites, dtype=np.float64)
+        partes = []
+        for x, y in pares:
+            diff, li, ls = self.diferenca(x, y, limites, confianca)
+            partes.append(pd.DataFrame({'grupo': pd.Series([(x, y)] * limites.size,
+                                                            dtype=object),
+                                        'limite': limites,
+                                        'diferenca': diff, 'li': li, 'ls': ls}))
+        if not partes:
+            # Menos de dois aplicativos: não há pares a comparar
+            return pd.DataFrame(columns=['grupo', 'limite', 'diferenca', 'li', 'ls'])
+        return pd.concat(partes, ignore_index=True)
+
+
+class CurvaSLA(_CurvaECDF):
+    """
+    Índice de ECDF por aplicativo para consultas vetorizadas de SLA.
+
+    Attributes:
+        apps (list): Rótulos dos aplicativos
+        ordenados (np.ndarray): Esperas agrupadas e ordenadas dentro do grupo
+        offsets (np.ndarray): Início de cada grupo (+ total)
+        n (np.ndarray): Observações de cada aplicativo
+    """
+
+    def __init__(self, apps: list, ordenados: np.ndarray, offsets: np.ndarray):
+        """
+        Inicializa o índice a partir de grupos já ordenados.
+
+        Args:
+            apps (list): Rótulos dos aplicativos
+            ordenados (np.ndarray): Esperas agrupadas e ordenadas por grupo
+            offsets (np.ndarray): Início de cada grupo (+ total)
+        """
+        self.apps = list(apps)
+        self.ordenados = ordenados
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.n = np.diff(self.offsets)
+
+    @classmethod
+    def de_conjunto(cls, conjunto) -> "CurvaSLA":
+        """Índice sobre um ``DadosTransporte`` (grupos já ordenados, sem cópia)."""
+        return cls(conjunto.apps, conjunto.espera, conjunto.offsets)
+
+    @classmethod
+    def de_amostras(cls, amostras: dict) -> "CurvaSLA":
+        """
+        Índice a partir de {app: esperas}, com uma ordenação por grupo.
+
+        Args:
+            amostras (dict): Tempos de espera de cada aplicativo
+
+        Returns:
+            CurvaSLA: Índice construído
+        """
+        grupos = [np.sort(np.asarray(valores)) for valores in amostras.values()]
+        offsets = np.concatenate(([0], np.cumsum([g.size for g in grupos])))
+        return cls(list(amostras), np.concatenate(grupos), offsets)
+
+    def grupo(self, app: str) -> np.ndarray:
+        """Esperas ordenadas de um aplicativo (visão sem cópia)."""
+        i = self._indice(app)
+        return self.ordenados[self.offsets[i]:self.offsets[i + 1]]
+
+    def sla(self, limites, app: Optional[str] = None) -> np.ndarray:
+        """
+        Proporção de atendimentos com espera <= limite.
+
+        Args:
+            limites (float | array-like): Limites em minutos
+            app (str): Aplicativo; se None, todos
+
+        Returns:
+            np.ndarray: (k,) para um app ou (apps x k) para todos
+        """
+        limites = np.asarray(limites)
+        if app is not None:
+            grupo = self.grupo(app)
+            # Limites na precisão dos dados (como em ``dados <= limite``)
+            limites = limites.astype(np.result_type(grupo.dtype, np.float16), copy=False)
+            return np.searchsorted(grupo, limites, side='right') / grupo.size
+        return np.stack([self.sla(limites, a) for a in self.apps])
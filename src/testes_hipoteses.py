@@ -12,49 +12,190 @@ Matrícula: 20240045381
 Data: 23/09/2025
 """
 
-import pandas as pd
+from __future__ import annotations
+
 import numpy as np
-from scipy import stats
-from scipy.stats import (normaltest, shapiro, levene, mannwhitneyu, 
-                        chi2_contingency, ttest_ind)
 import warnings
+from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Optional, Union
+
+if __package__ in (None, ''):
+    # Execução direta (python src/testes_hipoteses.py): as importações relativas
+    # exigem o pacote, então a raiz do repositório entra no path
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    import src  # noqa: F401
+    __package__ = 'src'
+
+from ._importacao import importar_sob_demanda
+from .cache import CacheResultados
+from .comparacoes import comparar_medias_pares, comparar_proporcoes_pares
+from .dados import DadosTransporte, estatisticas_agrupadas
+from .instrumentacao import etapa, instrumentado
+from .permutacao import teste_permutacao
+from .pesquisa import FontePesquisa, obter_pesquisa
+from .resultados import Relatorio, ResultadoTeste, rotulo_par
+from .poder import (SimuladorPoder, poder_proporcoes_analitico, poder_welch_analitico,
+                    tamanho_amostral_analitico)
+from .sequencial import SequencialMedias, SequencialProporcoes
+from .streaming import MomentosWelford
+
+# pandas e scipy.stats são carregados no primeiro uso
+pd = importar_sob_demanda('pandas')
+stats = importar_sob_demanda('scipy.stats')
 
 warnings.filterwarnings('ignore')
 
 
-class TestesHipoteses:
+class _TestesResumos(ABC):
     """
-    Classe para execução de testes de hipóteses estatísticas.
+    Testes de hipóteses e relatórios impressos a partir de resumos por aplicativo.
     
-    Esta classe implementa diversos testes estatísticos para validar
-    pressupostos e comparar grupos de dados de aplicativos de transporte.
+    Subclasses fornecem os testes básicos (``_normalidade``, ``_medias``,
+    ...) e os momentos de cada aplicativo; os métodos públicos dependem
+    apenas deles. Somente os testes de permutação usam as observações.
     
     Attributes:
-        dados (pd.DataFrame): DataFrame com os dados de tempo de espera
-        app_a (np.array): Dados do aplicativo A
-        app_b (np.array): Dados do aplicativo B
+        apps (list): Rótulos dos aplicativos
         pesquisa (dict): Dados da pesquisa de satisfação
+        cache (CacheResultados): Cache de resultados (ou None)
     """
     
-    def __init__(self, dados_path: str):
+    def _exigir_dois_apps(self, teste: str) -> None:
+        """Falha com mensagem clara quando não há grupos a comparar."""
+        if len(self.apps) < 2:
+            raise ValueError(f"{teste} exige ao menos dois aplicativos; "
+                             f"os dados têm {len(self.apps)} ({', '.join(self.apps)})")
+    
+    def _par_padrao(self, app_x: Optional[str], app_y: Optional[str]) -> tuple:
+        """Completa o par comparado com o par de referência (dois primeiros apps)."""
+        self._exigir_dois_apps("A comparação entre pares")
+        return (app_x or self.apps[0], app_y or self.apps[1])
+    
+    def _sufixo_par(self, app_x: str, app_y: str) -> str:
+        """Sufixo de título identificando o par quando há mais de dois apps."""
+        return f" ({app_x} vs {app_y})" if len(self.apps) > 2 else ""
+    
+    def _executar_teste(self, teste: str, grupo: str, funcao, *args, **kwargs) -> ResultadoTeste:
+        """Executa um teste de scipy.stats (estatística, p-valor) como etapa medida."""
+        with etapa(teste, 'teste', grupo=grupo):
+            return ResultadoTeste(teste, grupo, *map(float, funcao(*args, **kwargs)[:2]))
+    
+    @abstractmethod
+    def _normalidade(self) -> list:
+        """Shapiro-Wilk e D'Agostino-Pearson de cada aplicativo."""
+    
+    @abstractmethod
+    def _homogeneidade(self) -> ResultadoTeste:
+        """Levene entre todos os aplicativos."""
+    
+    @abstractmethod
+    def _medias(self, app_x: str, app_y: str) -> list:
+        """Welch, Student e Mann-Whitney para o par (x, y)."""
+    
+    @abstractmethod
+    def _variancias(self, app_x: str, app_y: str) -> ResultadoTeste:
+        """Teste F bilateral, com a maior variância no numerador."""
+    
+    @abstractmethod
+    def _suficientes(self) -> tuple:
+        """(n, média, variância) de cada aplicativo, na ordem de ``self.apps``."""
+    
+    @abstractmethod
+    def _momentos_app(self, app: str) -> MomentosWelford:
+        """Momentos (n, média, M2, ...) das esperas de um aplicativo."""
+    
+    @abstractmethod
+    def _residuos(self, app: str) -> np.ndarray:
+        """Esperas (ou amostra delas) de um aplicativo centradas na média."""
+    
+    def _observacoes(self, app: str) -> np.ndarray:
+        """Todas as esperas de um aplicativo (testes de permutação)."""
+        raise ValueError(f"{type(self).__name__} não mantém as observações; "
+                         "os testes de permutação exigem TestesHipoteses")
+    
+    def _proporcoes(self, app_x: str, app_y: str) -> list:
+        """Teste Z (proporção pooled) e qui-quadrado de independência."""
+        x1, n1 = self.pesquisa[app_x]['aprovacoes'], self.pesquisa[app_x]['total']
+        x2, n2 = self.pesquisa[app_y]['aprovacoes'], self.pesquisa[app_y]['total']
+        par = rotulo_par(app_x, app_y)
+        
+        with etapa('z', 'teste', grupo=par):
+            p_pool = (x1 + x2) / (n1 + n2)
+            se_pool = np.sqrt(p_pool * (1 - p_pool) * (1/n1 + 1/n2))
+            z_stat = (x1/n1 - x2/n2) / se_pool
+            p_valor = 2 * (1 - stats.norm.cdf(abs(z_stat)))
+        
+        tabela = np.array([[x1, n1-x1], [x2, n2-x2]])
+        return [ResultadoTeste('z', par, float(z_stat), float(p_valor)),
+                self._executar_teste('chi2', par, stats.chi2_contingency, tabela)]
+    
+    def relatorio(self) -> Relatorio:
         """
-        Inicializa os testes com os dados de transporte.
+        Executa os testes, sem imprimir, como tabelas colunares.
         
-        Args:
-            dados_path (str): Caminho para o arquivo CSV com os dados
+        Os testes entre pares comparam o aplicativo de referência (o
+        primeiro) com cada um dos demais. Tabelas: normalidade,
+        homogeneidade, medias, variancias e proporcoes (esta apenas para
+        pares presentes na pesquisa); com um único aplicativo, apenas
+        normalidade.
+        
+        Returns:
+            Relatorio: Uma linha por (teste, grupo ou par)
+        """
+        if self.cache is not None:
+            chave = self.cache.chave(self.conjunto, 'TestesHipoteses.relatorio',
+                                     pesquisa=self.pesquisa)
+            relatorio = self.cache.obter_relatorio(chave)
+            if relatorio is not None:
+                return relatorio
+        
+        pares = [(self.apps[0], app_y) for app_y in self.apps[1:]]
+        relatorio = Relatorio()
+        relatorio.adicionar('normalidade', self._normalidade())
+        if pares:
+            relatorio.adicionar('homogeneidade', [self._homogeneidade()])
+            relatorio.adicionar('medias', [r for par in pares for r in self._medias(*par)])
+            relatorio.adicionar('variancias', [self._variancias(*par) for par in pares])
+        pares_pesquisa = [par for par in pares if all(app in self.pesquisa for app in par)]
+        if pares_pesquisa:
+            relatorio.adicionar('proporcoes', [r for par in pares_pesquisa
+                                               for r in self._proporcoes(*par)])
+        if self.cache is not None:
+            self.cache.guardar_relatorio(chave, relatorio)
+        return relatorio
+    
+    def comparar_pares(self, ajuste: str = 'holm', alpha: float = 0.05) -> Relatorio:
         """
-        self.dados = pd.read_csv(dados_path)
-        self.dados.columns = ['app', 'espera_min']
+        Compara todos os pares de aplicativos, com ajuste de multiplicidade.
         
-        self.app_a = self.dados[self.dados['app'] == 'A']['espera_min'].values
-        self.app_b = self.dados[self.dados['app'] == 'B']['espera_min'].values
+        Welch (a partir de n, média e variância de cada aplicativo) e teste Z
+        de proporções (aplicativos presentes na pesquisa) são calculados para
+        os k(k-1)/2 pares em uma única operação vetorizada (ver
+        ``comparacoes``); a decisão usa o p-valor ajustado. Use
+        ``comparacoes.matriz_pares`` para ver uma coluna como matriz.
         
-        # Dados da pesquisa de satisfação
-        self.pesquisa = {
-            'A': {'aprovacoes': 132, 'total': 150},
-            'B': {'aprovacoes': 120, 'total': 150}
-        }
+        Args:
+            ajuste (str): 'holm' (erro por família), 'bh' (Benjamini-Hochberg,
+                taxa de falsas descobertas) ou 'nenhum'
+            alpha (float): Nível de significância
+        
+        Returns:
+            Relatorio: Tabelas pares_medias e pares_proporcoes, um par por linha
+        """
+        relatorio = Relatorio()
+        with etapa('pares_medias', 'teste', pares=len(self.apps) * (len(self.apps) - 1) // 2):
+            relatorio.adicionar('pares_medias', comparar_medias_pares(
+                *self._suficientes(), self.apps, ajuste, alpha))
+        apps_pesquisa = [app for app in self.apps if app in self.pesquisa]
+        if len(apps_pesquisa) > 1:
+            with etapa('pares_proporcoes', 'teste'):
+                relatorio.adicionar('pares_proporcoes', comparar_proporcoes_pares(
+                    [self.pesquisa[app]['aprovacoes'] for app in apps_pesquisa],
+                    [self.pesquisa[app]['total'] for app in apps_pesquisa],
+                    apps_pesquisa, ajuste, alpha))
+        return relatorio
     
     def teste_normalidade(self) -> dict:
         """
@@ -66,30 +207,26 @@ class TestesHipoteses:
         print("TESTES DE NORMALIDADE")
         print("-" * 60)
         
-        # Shapiro-Wilk (recomendado para n < 50)
-        stat_a_sw, p_a_sw = shapiro(self.app_a)
-        stat_b_sw, p_b_sw = shapiro(self.app_b)
-        
-        # D'Agostino-Pearson (recomendado para n >= 20)
-        stat_a_da, p_a_da = normaltest(self.app_a)
-        stat_b_da, p_b_da = normaltest(self.app_b)
+        resultados = self._normalidade()
+        shapiro_res = {r.grupo: r.como_tupla() for r in resultados if r.teste == 'shapiro'}
+        dagostino_res = {r.grupo: r.como_tupla() for r in resultados if r.teste == 'dagostino'}
         
-        print(f"{'Teste':<20} {'App A':<15} {'App B':<15}")
+        print(f"{'Teste':<20}" + "".join(f" {'App ' + app:<15}" for app in self.apps))
         print("-" * 60)
-        print(f"{'Shapiro-Wilk':<20}")
-        print(f"  Estatística      {stat_a_sw:>12.4f}   {stat_b_sw:>12.4f}")
-        print(f"  p-valor          {p_a_sw:>12.4f}   {p_b_sw:>12.4f}")
-        print(f"  Normal (α=0.05)  {'Sim' if p_a_sw > 0.05 else 'Não':>12}   {'Sim' if p_b_sw > 0.05 else 'Não':>12}")
-        
-        dagostino_name = "D'Agostino-Pearson"
-        print(f"\n{dagostino_name:<20}")
-        print(f"  Estatística      {stat_a_da:>12.4f}   {stat_b_da:>12.4f}")
-        print(f"  p-valor          {p_a_da:>12.4f}   {p_b_da:>12.4f}")
-        print(f"  Normal (α=0.05)  {'Sim' if p_a_da > 0.05 else 'Não':>12}   {'Sim' if p_b_da > 0.05 else 'Não':>12}")
+        for nome, resultados in [('Shapiro-Wilk', shapiro_res),
+                                 ("D'Agostino-Pearson", dagostino_res)]:
+            print(f"{nome:<20}" if nome == 'Shapiro-Wilk' else f"\n{nome:<20}")
+            print(("  Estatística     " + "".join(
+                f" {resultados[app][0]:>12.4f}  " for app in self.apps)).rstrip())
+            print(("  p-valor         " + "".join(
+                f" {resultados[app][1]:>12.4f}  " for app in self.apps)).rstrip())
+            print(("  Normal (α=0.05) " + "".join(
+                f" {'Sim' if resultados[app][1] > 0.05 else 'Não':>12}  "
+                for app in self.apps)).rstrip())
         
         return {
-            'shapiro': {'A': (stat_a_sw, p_a_sw), 'B': (stat_b_sw, p_b_sw)},
-            'dagostino': {'A': (stat_a_da, p_a_da), 'B': (stat_b_da, p_b_da)}
+            'shapiro': shapiro_res,
+            'dagostino': dagostino_res
         }
     
     def teste_homogeneidade_variancias(self) -> tuple:
@@ -99,10 +236,11 @@ class TestesHipoteses:
         Returns:
             tuple: (estatística, p-valor) do teste de Levene
         """
+        self._exigir_dois_apps("O teste de Levene")
         print("\n\nTESTE DE HOMOGENEIDADE DE VARIÂNCIAS (LEVENE)")
         print("-" * 60)
         
-        stat, p_valor = levene(self.app_a, self.app_b)
+        stat, p_valor = self._homogeneidade().como_tupla()
         
         print(f"Estatística de Levene: {stat:.4f}")
         print(f"p-valor: {p_valor:.4f}")
@@ -115,24 +253,34 @@ class TestesHipoteses:
         
         return stat, p_valor
     
-    def teste_diferenca_medias(self) -> dict:
+    def teste_diferenca_medias(self, app_x: Optional[str] = None,
+                               app_y: Optional[str] = None,
+                               permutacao: bool = False,
+                               semente: Optional[int] = None) -> dict:
         """
         Testa diferença de médias usando múltiplos métodos.
         
+        Args:
+            app_x, app_y (str): Aplicativos comparados (default: os dois primeiros)
+            permutacao (bool): Se True, inclui testes de permutação (Welch,
+                mediana e Mann-Whitney) com parada sequencial
+            semente (int): Semente das permutações
+        
         Returns:
             dict: Resultados dos testes de diferença de médias
         """
-        print("\n\nTESTE DE DIFERENÇA DE MÉDIAS")
-        print("-" * 60)
+        app_x, app_y = self._par_padrao(app_x, app_y)
+        # As permutações reamostram as observações (ver ``_observacoes``)
+        if permutacao:
+            x, y = self._observacoes(app_x), self._observacoes(app_y)
         
-        # Teste t de Welch (não assume variâncias iguais)
-        stat_welch, p_welch = ttest_ind(self.app_a, self.app_b, equal_var=False)
-        
-        # Teste t de Student (assume variâncias iguais)
-        stat_student, p_student = ttest_ind(self.app_a, self.app_b, equal_var=True)
+        print(f"\n\nTESTE DE DIFERENÇA DE MÉDIAS{self._sufixo_par(app_x, app_y)}")
+        print("-" * 60)
         
-        # Mann-Whitney U (não paramétrico)
-        stat_mw, p_mw = mannwhitneyu(self.app_a, self.app_b, alternative='two-sided')
+        welch, student, mannwhitney = self._medias(app_x, app_y)
+        stat_welch, p_welch = welch.como_tupla()
+        stat_student, p_student = student.como_tupla()
+        stat_mw, p_mw = mannwhitney.como_tupla()
         
         print(f"{'Teste':<20} {'Estatística':<12} {'p-valor':<12} {'Significativo':<12}")
         print("-" * 60)
@@ -140,49 +288,63 @@ class TestesHipoteses:
         print(f"{'Student t-test':<20} {stat_student:>10.4f}   {p_student:>10.4f}   {'Sim' if p_student < 0.05 else 'Não':>10}")
         print(f"{'Mann-Whitney U':<20} {stat_mw:>10.0f}   {p_mw:>10.4f}   {'Sim' if p_mw < 0.05 else 'Não':>10}")
         
+        resultados_perm = None
+        if permutacao:
+            resultados_perm = {nome: teste_permutacao(x, y, nome, semente=semente)
+                               for nome in ('welch', 'mediana', 'mannwhitney')}
+            rotulos = {'welch': 'Welch (perm.)', 'mediana': 'Mediana (perm.)',
+                       'mannwhitney': 'Mann-Whitney (perm.)'}
+            for nome, res in resultados_perm.items():
+                print(f"{rotulos[nome]:<20} {res['observada']:>10.4f}   {res['p_valor']:>10.4f}   "
+                      f"{'Sim' if res['p_valor'] < 0.05 else 'Não':>10}"
+                      f"   ({res['n_permutacoes']} permutações)")
+        
         # Interpretação
         print(f"\nInterpretação:")
         if p_welch < 0.05:
-            diff_media = np.mean(self.app_a) - np.mean(self.app_b)
+            diff_media = self._momentos_app(app_x).media - self._momentos_app(app_y).media
             print(f"• Há evidência significativa de diferença entre as médias (p = {p_welch:.4f})")
-            print(f"• App A tem tempo médio {diff_media:+.3f} min em relação ao App B")
+            print(f"• App {app_x} tem tempo médio {diff_media:+.3f} min em relação ao App {app_y}")
         else:
             print(f"• Não há evidência significativa de diferença entre as médias (p = {p_welch:.4f})")
         
-        return {
+        resultados = {
             'welch': (stat_welch, p_welch),
             'student': (stat_student, p_student),
             'mannwhitney': (stat_mw, p_mw)
         }
+        if resultados_perm is not None:
+            resultados['permutacao'] = resultados_perm
+        return resultados
     
-    def teste_diferenca_variancias(self) -> tuple:
+    def teste_diferenca_variancias(self, app_x: Optional[str] = None,
+                                   app_y: Optional[str] = None) -> tuple:
         """
         Testa diferença de variâncias usando teste F.
         
+        Args:
+            app_x, app_y (str): Aplicativos comparados (default: os dois primeiros)
+        
         Returns:
             tuple: (estatística F, p-valor)
         """
-        print("\n\nTESTE F PARA RAZÃO DE VARIÂNCIAS")
+        app_x, app_y = self._par_padrao(app_x, app_y)
+        mx, my = self._momentos_app(app_x), self._momentos_app(app_y)
+        
+        print(f"\n\nTESTE F PARA RAZÃO DE VARIÂNCIAS{self._sufixo_par(app_x, app_y)}")
         print("-" * 60)
         
-        var_a = np.var(self.app_a, ddof=1)
-        var_b = np.var(self.app_b, ddof=1)
+        var_x, var_y = mx.variancia, my.variancia
         
         # F-statistic (sempre colocar maior variância no numerador)
-        if var_a > var_b:
-            f_stat = var_a / var_b
-            df1, df2 = len(self.app_a) - 1, len(self.app_b) - 1
-            maior_var = "A"
+        f_stat, p_valor = self._variancias(app_x, app_y).como_tupla()
+        if var_x > var_y:
+            df1, df2, maior_var = mx.n - 1, my.n - 1, app_x
         else:
-            f_stat = var_b / var_a
-            df1, df2 = len(self.app_b) - 1, len(self.app_a) - 1
-            maior_var = "B"
-        
-        # p-valor bilateral
-        p_valor = 2 * (1 - stats.f.cdf(f_stat, df1, df2))
+            df1, df2, maior_var = my.n - 1, mx.n - 1, app_y
         
-        print(f"Variância App A: {var_a:.4f}")
-        print(f"Variância App B: {var_b:.4f}")
+        print(f"Variância App {app_x}: {var_x:.4f}")
+        print(f"Variância App {app_y}: {var_y:.4f}")
         print(f"Razão F: {f_stat:.4f}")
         print(f"Graus de liberdade: ({df1}, {df2})")
         print(f"p-valor: {p_valor:.4f}")
@@ -191,40 +353,41 @@ class TestesHipoteses:
         
         return f_stat, p_valor
     
-    def teste_diferenca_proporcoes(self) -> dict:
+    def teste_diferenca_proporcoes(self, app_x: Optional[str] = None,
+                                   app_y: Optional[str] = None) -> dict:
         """
         Testa diferença de proporções usando teste Z e qui-quadrado.
         
+        Args:
+            app_x, app_y (str): Aplicativos comparados (default: os dois primeiros)
+        
         Returns:
             dict: Resultados dos testes de proporções
         """
-        print("\n\nTESTE Z PARA DIFERENÇA DE PROPORÇÕES")
+        app_x, app_y = self._par_padrao(app_x, app_y)
+        
+        print(f"\n\nTESTE Z PARA DIFERENÇA DE PROPORÇÕES{self._sufixo_par(app_x, app_y)}")
         print("-" * 60)
         
-        x1, n1 = self.pesquisa['A']['aprovacoes'], self.pesquisa['A']['total']
-        x2, n2 = self.pesquisa['B']['aprovacoes'], self.pesquisa['B']['total']
+        x1, n1 = self.pesquisa[app_x]['aprovacoes'], self.pesquisa[app_x]['total']
+        x2, n2 = self.pesquisa[app_y]['aprovacoes'], self.pesquisa[app_y]['total']
         
         p1, p2 = x1/n1, x2/n2
         p_pool = (x1 + x2) / (n1 + n2)
         
-        # Estatística Z para diferença de proporções
-        se_pool = np.sqrt(p_pool * (1 - p_pool) * (1/n1 + 1/n2))
-        z_stat = (p1 - p2) / se_pool
-        
-        # p-valor bilateral
-        p_valor = 2 * (1 - stats.norm.cdf(abs(z_stat)))
+        # Estatística Z (bilateral) e qui-quadrado de independência
+        teste_z, teste_chi2 = self._proporcoes(app_x, app_y)
+        z_stat, p_valor = teste_z.como_tupla()
         
-        print(f"Proporção App A: {p1:.3f} ({x1}/{n1})")
-        print(f"Proporção App B: {p2:.3f} ({x2}/{n2})")
-        print(f"Diferença (A-B): {p1-p2:+.3f}")
+        print(f"Proporção App {app_x}: {p1:.3f} ({x1}/{n1})")
+        print(f"Proporção App {app_y}: {p2:.3f} ({x2}/{n2})")
+        print(f"Diferença ({app_x}-{app_y}): {p1-p2:+.3f}")
         print(f"Proporção pooled: {p_pool:.3f}")
         print(f"Estatística Z: {z_stat:.4f}")
         print(f"p-valor: {p_valor:.4f}")
         print(f"Diferença significativa (α=0.05): {'Sim' if p_valor < 0.05 else 'Não'}")
         
-        # Teste qui-quadrado de independência
-        tabela = np.array([[x1, n1-x1], [x2, n2-x2]])
-        chi2_stat, p_chi2, dof, expected = chi2_contingency(tabela)
+        chi2_stat, p_chi2 = teste_chi2.como_tupla()
         
         print(f"\nTeste Qui-quadrado de independência:")
         print(f"Estatística χ²: {chi2_stat:.4f}")
@@ -236,61 +399,175 @@ class TestesHipoteses:
             'chi2_test': (chi2_stat, p_chi2)
         }
     
-    def poder_estatistico(self) -> tuple:
+    @staticmethod
+    def _classificar_efeito(efeito: float) -> str:
+        """Interpretação do tamanho de efeito (Cohen's d ou h)."""
+        if abs(efeito) < 0.2:
+            return "Pequeno"
+        elif abs(efeito) < 0.5:
+            return "Pequeno a Médio"
+        elif abs(efeito) < 0.8:
+            return "Médio a Grande"
+        return "Grande"
+    
+    @staticmethod
+    def _cohens_d(x: MomentosWelford, y: MomentosWelford) -> float:
+        """Cohen's d com desvio padrão combinado, a partir dos momentos."""
+        pooled_std = np.sqrt((x.m2 + y.m2) / (x.n + y.n - 2))
+        return (x.media - y.media) / pooled_std
+    
+    @instrumentado(categoria='teste')
+    def poder_estatistico(self, app_x: Optional[str] = None,
+                          app_y: Optional[str] = None,
+                          poder_alvo: Optional[float] = None) -> tuple:
         """
         Calcula tamanho de efeito (Cohen's d e Cohen's h).
         
+        Args:
+            app_x, app_y (str): Aplicativos comparados (default: os dois primeiros)
+            poder_alvo (float): Se informado, também executa ``planejar_amostra``
+        
         Returns:
             tuple: (Cohen's d, Cohen's h)
         """
-        print("\n\nANÁLISE DE TAMANHO DE EFEITO")
+        app_x, app_y = self._par_padrao(app_x, app_y)
+        
+        print(f"\n\nANÁLISE DE TAMANHO DE EFEITO{self._sufixo_par(app_x, app_y)}")
         print("-" * 60)
         
         # Cohen's d para diferença de médias
-        mean_diff = np.mean(self.app_a) - np.mean(self.app_b)
-        pooled_std = np.sqrt(((len(self.app_a)-1)*np.var(self.app_a, ddof=1) + 
-                             (len(self.app_b)-1)*np.var(self.app_b, ddof=1)) / 
-                            (len(self.app_a) + len(self.app_b) - 2))
-        cohens_d = mean_diff / pooled_std
-        
-        # Interpretação do tamanho de efeito para Cohen's d
-        if abs(cohens_d) < 0.2:
-            efeito_d = "Pequeno"
-        elif abs(cohens_d) < 0.5:
-            efeito_d = "Pequeno a Médio"
-        elif abs(cohens_d) < 0.8:
-            efeito_d = "Médio a Grande"
-        else:
-            efeito_d = "Grande"
+        cohens_d = self._cohens_d(self._momentos_app(app_x), self._momentos_app(app_y))
         
         print(f"Cohen's d (diferença de médias): {cohens_d:.3f}")
-        print(f"Tamanho do efeito: {efeito_d}")
+        print(f"Tamanho do efeito: {self._classificar_efeito(cohens_d)}")
         
         # Cohen's h para diferença de proporções
-        p1 = self.pesquisa['A']['aprovacoes'] / self.pesquisa['A']['total']
-        p2 = self.pesquisa['B']['aprovacoes'] / self.pesquisa['B']['total']
+        p1 = self.pesquisa[app_x]['aprovacoes'] / self.pesquisa[app_x]['total']
+        p2 = self.pesquisa[app_y]['aprovacoes'] / self.pesquisa[app_y]['total']
         
         cohens_h = 2 * (np.arcsin(np.sqrt(p1)) - np.arcsin(np.sqrt(p2)))
         
-        # Interpretação do tamanho de efeito para Cohen's h
-        if abs(cohens_h) < 0.2:
-            efeito_h = "Pequeno"
-        elif abs(cohens_h) < 0.5:
-            efeito_h = "Pequeno a Médio"
-        elif abs(cohens_h) < 0.8:
-            efeito_h = "Médio a Grande"
-        else:
-            efeito_h = "Grande"
-        
         print(f"\nCohen's h (diferença de proporções): {cohens_h:.3f}")
-        print(f"Tamanho do efeito: {efeito_h}")
+        print(f"Tamanho do efeito: {self._classificar_efeito(cohens_h)}")
+        
+        if poder_alvo is not None:
+            self.planejar_amostra(app_x, app_y, poder_alvo=poder_alvo)
         
         return cohens_d, cohens_h
     
+    @instrumentado(categoria='teste')
+    def planejar_amostra(self, app_x: Optional[str] = None,
+                         app_y: Optional[str] = None, poder_alvo: float = 0.8,
+                         alpha: float = 0.05, n_sim: int = 2000,
+                         semente: Optional[int] = None) -> dict:
+        """
+        Poder atual e tamanho amostral necessário para os efeitos observados.
+        
+        Welch e proporções usam fórmulas fechadas; Mann-Whitney é simulado
+        reamostrando os resíduos padronizados dos dados (preservando a
+        assimetria dos tempos de espera).
+        
+        Args:
+            app_x, app_y (str): Aplicativos comparados (default: os dois primeiros)
+            poder_alvo (float): Poder desejado
+            alpha (float): Nível de significância
+            n_sim (int): Número de simulações (Mann-Whitney)
+            semente (int): Semente das simulações
+        
+        Returns:
+            dict: {teste: {'efeito', 'n_atual', 'poder_atual', 'n_necessario'}}
+        """
+        app_x, app_y = self._par_padrao(app_x, app_y)
+        mx, my = self._momentos_app(app_x), self._momentos_app(app_y)
+        cohens_d = abs(self._cohens_d(mx, my))
+        p1 = self.pesquisa[app_x]['aprovacoes'] / self.pesquisa[app_x]['total']
+        p2 = self.pesquisa[app_y]['aprovacoes'] / self.pesquisa[app_y]['total']
+        n_corridas = min(mx.n, my.n)
+        n_pesquisa = min(self.pesquisa[app_x]['total'], self.pesquisa[app_y]['total'])
+        
+        residuos = np.concatenate((self._residuos(app_x), self._residuos(app_y)))
+        simulador = SimuladorPoder(n_sim, alpha, amostra_base=residuos, semente=semente)
+        
+        resultados = {
+            'welch': {
+                'efeito': cohens_d,
+                'n_atual': n_corridas,
+                'poder_atual': poder_welch_analitico([cohens_d], [n_corridas], alpha)[0, 0],
+                'n_necessario': tamanho_amostral_analitico('welch', cohens_d, poder_alvo, alpha)
+            },
+            'mannwhitney': {
+                'efeito': cohens_d,
+                'n_atual': n_corridas,
+                'poder_atual': simulador.poder_mannwhitney([cohens_d], [n_corridas])[0, 0],
+                'n_necessario': simulador.tamanho_amostral('mannwhitney', cohens_d, poder_alvo)
+            },
+            'proporcoes': {
+                'efeito': p1 - p2,
+                'n_atual': n_pesquisa,
+                'poder_atual': poder_proporcoes_analitico(p1, [p2], [n_pesquisa], alpha)[0, 0],
+                'n_necessario': tamanho_amostral_analitico('proporcoes', p2, poder_alvo,
+                                                           alpha, p1=p1)
+            }
+        }
+        
+        print(f"\n\nPLANEJAMENTO AMOSTRAL (poder alvo = {poder_alvo:.0%}){self._sufixo_par(app_x, app_y)}")
+        print("-" * 60)
+        print(f"{'Teste':<20} {'n atual':>8} {'Poder atual':>12} {'n necessário':>14}")
+        print("-" * 60)
+        rotulos = {'welch': 'Welch t-test', 'mannwhitney': 'Mann-Whitney U',
+                   'proporcoes': 'Proporções (z)'}
+        for teste, res in resultados.items():
+            print(f"{rotulos[teste]:<20} {res['n_atual']:>8} {res['poder_atual']:>12.1%} "
+                  f"{res['n_necessario']:>14}")
+        print("(n por grupo; corridas para Welch/Mann-Whitney, respostas para proporções)")
+        
+        return resultados
+    
+    def monitor_sequencial(self, app_x: Optional[str] = None,
+                           app_y: Optional[str] = None, alpha: float = 0.05,
+                           tau_media: float = 1.0, tau_proporcao: float = 0.1,
+                           incluir_historico: bool = True) -> dict:
+        """
+        Cria testes sequenciais (mSPRT) para monitorar o par continuamente.
+        
+        Os testes retornados são atualizados com ``atualizar`` a cada nova
+        corrida ou lote e fornecem p-valores e intervalos sempre válidos,
+        sem reprocessar os dados anteriores.
+        
+        Args:
+            app_x, app_y (str): Aplicativos comparados (default: os dois primeiros)
+            alpha (float): Nível de significância
+            tau_media (float): Escala do prior para a diferença de médias (min)
+            tau_proporcao (float): Escala do prior para a diferença de proporções
+            incluir_historico (bool): Se True, os dados atuais entram como
+                primeiro lote
+        
+        Returns:
+            dict: {'medias': SequencialMedias, 'proporcoes': SequencialProporcoes}
+        """
+        app_x, app_y = self._par_padrao(app_x, app_y)
+        medias = SequencialMedias(alpha, tau_media)
+        proporcoes = SequencialProporcoes(alpha, tau_proporcao)
+        if incluir_historico:
+            medias.momentos_x.combinar(self._momentos_app(app_x))
+            medias.momentos_y.combinar(self._momentos_app(app_y))
+            medias.atualizar()
+            px, py = self.pesquisa[app_x], self.pesquisa[app_y]
+            proporcoes.atualizar(px['aprovacoes'], px['total'],
+                                 py['aprovacoes'], py['total'])
+        return {'medias': medias, 'proporcoes': proporcoes}
+    
+    @instrumentado(categoria='pipeline')
     def executar_todos_testes(self) -> dict:
         """
         Executa todos os testes de hipóteses e retorna resumo.
         
+        Os testes entre pares comparam o aplicativo de referência (o
+        primeiro) com cada um dos demais; os resultados do primeiro par
+        ficam nas chaves de sempre e os de todos os pares em ``'pares'``.
+        Com um único aplicativo, apenas a normalidade é testada (as demais
+        chaves ficam None).
+        
         Returns:
             dict: Dicionário com todos os resultados dos testes
         """
@@ -300,37 +577,56 @@ class TestesHipoteses:
         
         # Executar todos os testes
         norm_results = self.teste_normalidade()
+        if len(self.apps) < 2:
+            print(f"\nApenas o App {self.apps[0]} nos dados: "
+                  "testes entre aplicativos não se aplicam.")
+            return {'normalidade': norm_results, 'levene': None, 'medias': None,
+                    'variancias': None, 'proporcoes': None, 'poder': None, 'pares': {}}
         levene_results = self.teste_homogeneidade_variancias()
-        media_results = self.teste_diferenca_medias()
-        var_results = self.teste_diferenca_variancias()
-        prop_results = self.teste_diferenca_proporcoes()
-        poder_results = self.poder_estatistico()
+        
+        pares = {}
+        for app_y in self.apps[1:]:
+            par = (self.apps[0], app_y)
+            pares[par] = {
+                'medias': self.teste_diferenca_medias(*par),
+                'variancias': self.teste_diferenca_variancias(*par),
+            }
+            if app_y in self.pesquisa and self.apps[0] in self.pesquisa:
+                pares[par]['proporcoes'] = self.teste_diferenca_proporcoes(*par)
+                pares[par]['poder'] = self.poder_estatistico(*par)
+        
+        primeiro = pares[(self.apps[0], self.apps[1])]
         
         # Resumo das conclusões
         self._imprimir_resumo_conclusoes(norm_results, levene_results, 
-                                       media_results, var_results, prop_results)
+                                       primeiro['medias'], primeiro['variancias'],
+                                       primeiro.get('proporcoes'))
         
         return {
             'normalidade': norm_results,
             'levene': levene_results,
-            'medias': media_results,
-            'variancias': var_results,
-            'proporcoes': prop_results,
-            'poder': poder_results
+            'medias': primeiro['medias'],
+            'variancias': primeiro['variancias'],
+            'proporcoes': primeiro.get('proporcoes'),
+            'poder': primeiro.get('poder'),
+            'pares': pares
         }
     
     def _imprimir_resumo_conclusoes(self, norm_results: dict, levene_results: tuple,
                                   media_results: dict, var_results: tuple, 
-                                  prop_results: dict) -> None:
-        """Imprime resumo das conclusões dos testes."""
+                                  prop_results: Optional[dict]) -> None:
+        """Imprime resumo das conclusões dos testes (par de referência)."""
+        app_x, app_y = self.apps[0], self.apps[1]
+        mx, my = self._momentos_app(app_x), self._momentos_app(app_y)
+        
         print("\n\n" + "="*80)
         print("RESUMO DAS CONCLUSÕES DOS TESTES")
         print("="*80)
         
         print("\n1. NORMALIDADE DOS DADOS:")
-        if (norm_results['shapiro']['A'][1] > 0.05 and 
-            norm_results['shapiro']['B'][1] > 0.05):
-            print("   ✓ Ambos os grupos seguem distribuição normal")
+        if all(p > 0.05 for _, p in norm_results['shapiro'].values()):
+            print("   ✓ Ambos os grupos seguem distribuição normal" if len(self.apps) == 2
+                  else "   ✓ Todos os grupos seguem distribuição normal")
             print("   → Recomendação: Usar testes paramétricos")
         else:
             print("   ✗ Pelo menos um grupo não segue distribuição normal")
@@ -344,36 +640,149 @@ class TestesHipoteses:
             print("   ✗ Variâncias heterogêneas entre grupos")
             print("   → Recomendação: Usar teste de Welch")
         
-        print("\n3. DIFERENÇA DE MÉDIAS:")
+        print(f"\n3. DIFERENÇA DE MÉDIAS:{self._sufixo_par(app_x, app_y)}")
         if media_results['welch'][1] < 0.05:
-            diff_media = np.mean(self.app_a) - np.mean(self.app_b)
+            diff_media = mx.media - my.media
             print("   ✓ Diferença significativa entre médias (p < 0.05)")
-            print(f"   → App A tem tempo médio {diff_media:+.2f} min em relação ao App B")
+            print(f"   → App {app_x} tem tempo médio {diff_media:+.2f} min em relação ao App {app_y}")
         else:
             print("   ✗ Não há diferença significativa entre médias (p ≥ 0.05)")
         
-        print("\n4. DIFERENÇA DE VARIÂNCIAS:")
+        print(f"\n4. DIFERENÇA DE VARIÂNCIAS:{self._sufixo_par(app_x, app_y)}")
         if var_results[1] < 0.05:
-            var_a = np.var(self.app_a, ddof=1)
-            var_b = np.var(self.app_b, ddof=1)
+            var_x, var_y = mx.variancia, my.variancia
             print("   ✓ Diferença significativa entre variâncias (p < 0.05)")
-            if var_a > var_b:
-                print("   → App A é mais variável que App B")
+            if var_x > var_y:
+                print(f"   → App {app_x} é mais variável que App {app_y}")
             else:
-                print("   → App B é mais variável que App A")
+                print(f"   → App {app_y} é mais variável que App {app_x}")
         else:
             print("   ✗ Não há diferença significativa entre variâncias (p ≥ 0.05)")
         
-        print("\n5. DIFERENÇA DE PROPORÇÕES:")
+        if prop_results is None:
+            return
+        
+        print(f"\n5. DIFERENÇA DE PROPORÇÕES:{self._sufixo_par(app_x, app_y)}")
         if prop_results['z_test'][1] < 0.05:
-            p1 = self.pesquisa['A']['aprovacoes'] / self.pesquisa['A']['total']
-            p2 = self.pesquisa['B']['aprovacoes'] / self.pesquisa['B']['total']
+            p1 = self.pesquisa[app_x]['aprovacoes'] / self.pesquisa[app_x]['total']
+            p2 = self.pesquisa[app_y]['aprovacoes'] / self.pesquisa[app_y]['total']
             print("   ✓ Diferença significativa entre proporções (p < 0.05)")
-            print(f"   → App A tem {(p1-p2)*100:+.1f} pontos percentuais a mais de aprovação")
+            print(f"   → App {app_x} tem {(p1-p2)*100:+.1f} pontos percentuais a mais de aprovação")
         else:
             print("   ✗ Não há diferença significativa entre proporções (p ≥ 0.05)")
 
 
+class TestesHipoteses(_TestesResumos):
+    """
+    Classe para execução de testes de hipóteses estatísticas.
+    
+    Esta classe implementa diversos testes estatísticos para validar
+    pressupostos e comparar grupos de dados de aplicativos de transporte.
+    Os testes públicos estão em ``_TestesResumos``; aqui ficam os testes
+    básicos sobre as observações de cada aplicativo.
+    
+    Attributes:
+        dados (pd.DataFrame): DataFrame com os dados de tempo de espera
+        apps (list): Rótulos dos aplicativos
+        grupos (dict): Dados de cada aplicativo {app: np.array}
+        app_a (np.array): Dados do aplicativo A
+        app_b (np.array): Dados do aplicativo B
+        pesquisa (dict): Dados da pesquisa de satisfação
+    """
+    
+    def __init__(self, dados_path: Union[str, DadosTransporte],
+                 pesquisa: FontePesquisa = None,
+                 cache: Optional[CacheResultados] = None):
+        """
+        Inicializa os testes com os dados de transporte.
+        
+        Args:
+            dados_path (str | DadosTransporte): Caminho para o arquivo CSV com
+                os dados ou conjunto de dados já carregado
+            pesquisa (dict | str | PesquisaAgregada): Aprovações e totais por
+                aplicativo ({app: {'aprovacoes': x, 'total': n}}), microdados
+                agregados ou caminho do CSV de respondentes; default: pesquisa A/B
+            cache (CacheResultados): Cache de resultados (opcional)
+        """
+        self.conjunto = DadosTransporte.obter(dados_path)
+        self.cache = cache
+        
+        self.apps = self.conjunto.apps
+        self.grupos = self.conjunto.grupos
+        self.app_a = self.conjunto.grupo('A')
+        self.app_b = self.conjunto.grupo('B')
+        
+        # Dados da pesquisa de satisfação
+        self.pesquisa = obter_pesquisa(pesquisa)
+    
+    @property
+    def dados(self) -> pd.DataFrame:
+        """DataFrame (app, espera_min), construído apenas quando usado."""
+        return self.conjunto.dados
+    
+    def _normalidade(self) -> list:
+        """Shapiro-Wilk e D'Agostino-Pearson de cada aplicativo."""
+        # Shapiro-Wilk (recomendado para n < 50)
+        resultados = [self._executar_teste('shapiro', app, stats.shapiro, dados)
+                      for app, dados in self.grupos.items()]
+        
+        # D'Agostino-Pearson (recomendado para n >= 20)
+        resultados += [self._executar_teste('dagostino', app, stats.normaltest, dados)
+                       for app, dados in self.grupos.items()]
+        return resultados
+    
+    def _homogeneidade(self) -> ResultadoTeste:
+        """Levene entre todos os aplicativos."""
+        return self._executar_teste('levene', '-'.join(self.apps), stats.levene,
+                                    *self.grupos.values())
+    
+    def _medias(self, app_x: str, app_y: str) -> list:
+        """Welch, Student e Mann-Whitney para o par (x, y)."""
+        x, y = self.grupos[app_x], self.grupos[app_y]
+        par = rotulo_par(app_x, app_y)
+        return [
+            # Teste t de Welch (não assume variâncias iguais)
+            self._executar_teste('welch', par, stats.ttest_ind, x, y, equal_var=False),
+            # Teste t de Student (assume variâncias iguais)
+            self._executar_teste('student', par, stats.ttest_ind, x, y, equal_var=True),
+            # Mann-Whitney U (não paramétrico)
+            self._executar_teste('mannwhitney', par, stats.mannwhitneyu, x, y,
+                                 alternative='two-sided')
+        ]
+    
+    def _variancias(self, app_x: str, app_y: str) -> ResultadoTeste:
+        """Teste F bilateral, com a maior variância no numerador."""
+        x, y = self.grupos[app_x], self.grupos[app_y]
+        par = rotulo_par(app_x, app_y)
+        with etapa('f', 'teste', grupo=par):
+            var_x, var_y = np.var(x, ddof=1), np.var(y, ddof=1)
+            if var_x > var_y:
+                f_stat, df1, df2 = var_x / var_y, len(x) - 1, len(y) - 1
+            else:
+                f_stat, df1, df2 = var_y / var_x, len(y) - 1, len(x) - 1
+            p_valor = 2 * (1 - stats.f.cdf(f_stat, df1, df2))
+        return ResultadoTeste('f', par, float(f_stat), float(p_valor))
+    
+    def _suficientes(self) -> tuple:
+        """(n, média, variância) de cada aplicativo, na ordem de ``self.apps``."""
+        tabela = estatisticas_agrupadas(self.conjunto.espera, self.conjunto.offsets)
+        return tabela['n'], tabela['media'], tabela['variancia']
+    
+    def _momentos_app(self, app: str) -> MomentosWelford:
+        """Momentos das esperas de um aplicativo."""
+        momentos = MomentosWelford()
+        momentos.atualizar(self.grupos[app])
+        return momentos
+    
+    def _residuos(self, app: str) -> np.ndarray:
+        """Esperas de um aplicativo centradas na média."""
+        return self.grupos[app] - np.mean(self.grupos[app])
+    
+    def _observacoes(self, app: str) -> np.ndarray:
+        """Todas as esperas de um aplicativo."""
+        return self.grupos[app]
+
+
 def main():
     """Função principal para execução dos testes."""
     dados_path = "data/transp_dados.csv"
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Cache de Valores Críticos - Transporte Urbano
+
+Os intervalos de confiança usam repetidamente os mesmos quantis das
+distribuições t, qui-quadrado, F e normal (por exemplo, ``t.ppf(0.975,
+df=34)``). Como cada chamada a ``ppf`` do scipy tem custo fixo alto, este
+módulo mantém um cache LRU limitado, indexado por (distribuição,
+probabilidade, graus de liberdade), com contadores de acertos e falhas.
+
+Opcionalmente, ``precomputar`` monta tabelas para graus de liberdade
+inteiros (t e qui-quadrado) em uma faixa; consultas dentro da faixa são
+atendidas por indexação direta e as demais recorrem ao scipy.
+
+Autor: Diogo Da Silva Rego
+Disciplina: Inferência Estatística I - UFPB CCEN
+Matrícula: 20240045381
+Data: 23/09/2025
+"""
+
+from collections import OrderedDict, namedtuple
+from typing import Sequence
+
+import numpy as np
+
+from ._importacao import importar_sob_demanda
+
+# scipy.stats é carregado apenas na primeira consulta fora do cache
+stats = importar_sob_demanda('scipy.stats')
+
+# Funções quantil por distribuição (argumentos: probabilidade, parâmetros)
+_PPF = {
+    't': lambda p, df: stats.t.ppf(p, df),
+    'chi2': lambda p, df: stats.chi2.ppf(p, df),
+    'f': lambda p, dfn, dfd: stats.f.ppf(p, dfn, dfd),
+    'norm': lambda p: stats.norm.ppf(p),
+}
+
+# Casas decimais usadas para normalizar as chaves (evita ruído de ponto flutuante)
+_CASAS_CHAVE = 12
+
+InfoCache = namedtuple('InfoCache', ['acertos', 'falhas', 'acertos_tabela',
+                                     'tamanho', 'max_itens'])
+
+
+class CacheValoresCriticos:
+    """
+    Cache LRU de quantis das distribuições usadas nos intervalos.
+
+    Attributes:
+        max_itens (int): Número máximo de quantis mantidos no cache
+        acertos (int): Consultas atendidas pelo cache
+        falhas (int): Consultas que exigiram chamada ao scipy
+        acertos_tabela (int): Consultas atendidas pelas tabelas pré-calculadas
+    """
+
+    def __init__(self, max_itens: int = 4096):
+        """
+        Inicializa um cache vazio.
+
+        Args:
+            max_itens (int): Número máximo de quantis mantidos (default: 4096)
+        """
+        self.max_itens = max_itens
+        self._itens = OrderedDict()
+        self._tabelas = {}
+        self.acertos = 0
+        self.falhas = 0
+        self.acertos_tabela = 0
+
+    def t(self, prob, df):
+        """Quantil da distribuição t de Student."""
+        return self.quantil('t', prob, df)
+
+    def chi2(self, prob, df):
+        """Quantil da distribuição qui-quadrado."""
+        return self.quantil('chi2', prob, df)
+
+    def f(self, prob, dfn, dfd):
+        """Quantil da distribuição F de Snedecor."""
+        return self.quantil('f', prob, dfn, dfd)
+
+    def norm(self, prob):
+        """Quantil da distribuição normal padrão."""
+        return self.quantil('norm', prob)
+
+    def quantil(self, dist: str, prob, *params):
+        """
+        Retorna quantis, consultando tabelas e cache antes do scipy.
+
+        Aceita escalares ou arrays (com broadcast entre probabilidade e
+        parâmetros); os quantis ausentes do cache são calculados em uma
+        única chamada vetorizada.
+
+        Args:
+            dist (str): 't', 'chi2', 'f' ou 'norm'
+            prob (float | array-like): Probabilidade acumulada
+            *params: Graus de liberdade da distribuição
+
+        Returns:
+            float | np.ndarray: Quantis, no formato do broadcast dos argumentos
+        """
+        if np.ndim(prob) == 0 and all(np.ndim(p) == 0 for p in params):
+            return self._quantil_escalar(dist, float(prob), *map(float, params))
+
+        arrays = np.broadcast_arrays(np.asarray(prob, dtype=np.float64),
+                                     *(np.asarray(p, dtype=np.float64) for p in params))
+        forma = arrays[0].shape
+        colunas = [a.ravel() for a in arrays]
+        resultado = np.full(colunas[0].size, np.nan)
+
+        pendentes = np.ones(colunas[0].size, dtype=bool)
+        if dist in ('t', 'chi2') and self._tabelas:
+            pendentes = ~self._consultar_tabela(dist, colunas[0], colunas[1], resultado)
+
+        if pendentes.any():
+            chaves = np.round(np.stack([c[pendentes] for c in colunas], axis=1), _CASAS_CHAVE)
+            # Linhas vistas como bytes: np.unique 1-D é bem mais rápido que axis=0
+            linhas = np.ascontiguousarray(chaves).view(
+                np.dtype((np.void, chaves.dtype.itemsize * chaves.shape[1]))).ravel()
+            unicas, inversa = np.unique(linhas, return_inverse=True)
+            unicas = unicas.view(chaves.dtype).reshape(-1, chaves.shape[1])
+            valores = np.empty(len(unicas))
+            faltantes = []
+            for k, linha in enumerate(unicas.tolist()):
+                chave = (dist, *linha)
+                if chave in self._itens:
+                    self._itens.move_to_end(chave)
+                    valores[k] = self._itens[chave]
+                    self.acertos += 1
+                else:
+                    faltantes.append(k)
+            if faltantes:
+                self.falhas += len(faltantes)
+                calculados = _PPF[dist](*unicas[faltantes].T)
+                valores[faltantes] = calculados
+                for k, valor in zip(faltantes, np.atleast_1d(calculados)):
+                    self._guardar((dist, *unicas[k].tolist()), float(valor))
+            resultado[pendentes] = valores[inversa.ravel()]
+
+        return resultado.reshape(forma)
+
+    def _quantil_escalar(self, dist: str, prob: float, *params: float) -> float:
+        if dist in ('t', 'chi2') and self._tabelas:
+            saida = np.full(1, np.nan)
+            if self._consultar_tabela(dist, np.array([prob]), np.array(params), saida)[0]:
+                return float(saida[0])
+        chave = (dist, round(prob, _CASAS_CHAVE), *(round(p, _CASAS_CHAVE) for p in params))
+        if chave in self._itens:
+            self._itens.move_to_end(chave)
+            self.acertos += 1
+            return self._itens[chave]
+        self.falhas += 1
+        valor = float(_PPF[dist](prob, *params))
+        self._guardar(chave, valor)
+        return valor
+
+    def _guardar(self, chave: tuple, valor: float) -> None:
+        self._itens[chave] = valor
+        if len(self._itens) > self.max_itens:
+            self._itens.popitem(last=False)
+
+    def _consultar_tabela(self, dist: str, prob: np.ndarray, df: np.ndarray,
+                          saida: np.ndarray) -> np.ndarray:
+        """Preenche ``saida`` com valores tabelados; retorna máscara dos atendidos."""
+        atendidos = np.zeros(prob.size, dtype=bool)
+        for (dist_tab, prob_tab), tabela in self._tabelas.items():
+            if dist_tab != dist:
+                continue
+            mascara = ((np.abs(prob - prob_tab) < 10.0 ** -_CASAS_CHAVE)
+                       & (df == np.floor(df)) & (df >= 1) & (df < tabela.size))
+            if mascara.any():
+                saida[mascara] = tabela[df[mascara].astype(np.int64)]
+                atendidos |= mascara
+        self.acertos_tabela += int(atendidos.sum())
+        return atendidos
+
+    def precomputar(self, dist: str = 't', probs: Sequence[float] = (0.95, 0.975, 0.995),
+                    df_max: int = 1000) -> None:
+        """
+        Pré-calcula quantis para graus de liberdade inteiros 1..df_max.
+
+        Args:
+            dist (str): 't' ou 'chi2'
+            probs (sequence): Probabilidades acumuladas a tabelar
+            df_max (int): Maior grau de liberdade tabelado
+        """
+        if dist not in ('t', 'chi2'):
+            raise ValueError("Tabelas disponíveis apenas para 't' e 'chi2'")
+        df = np.arange(df_max + 1, dtype=np.float64)
+        for prob in probs:
+            tabela = np.full(df_max + 1, np.nan)
+            tabela[1:] = _PPF[dist](prob, df[1:])
+            self._tabelas[(dist, round(float(prob), _CASAS_CHAVE))] = tabela
+
+    def info(self) -> InfoCache:
+        """Contadores de uso do cache."""
+        return InfoCache(self.acertos, self.falhas, self.acertos_tabela,
+                         len(self._itens), self.max_itens)
+
+    def limpar(self) -> None:
+        """Esvazia cache e tabelas e zera os contadores."""
+        self._itens.clear()
+        self._tabelas.clear()
+        self.acertos = self.falhas = self.acertos_tabela = 0
+
+
+# Instância compartilhada pelos métodos de intervalo de confiança
+cache_criticos = CacheValoresCriticos()
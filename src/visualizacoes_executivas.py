@@ -12,19 +12,41 @@ Matrícula: 20240045381
 Data: 23/09/2025
 """
 
-import pandas as pd
+from __future__ import annotations
+
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy.stats import t, norm, gaussian_kde
 import warnings
 from pathlib import Path
+from typing import Optional, Union
+
+if __package__ in (None, ''):
+    # Execução direta (python src/visualizacoes_executivas.py): as importações relativas
+    # exigem o pacote, então a raiz do repositório entra no path
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    import src  # noqa: F401
+    __package__ = 'src'
+
+from ._importacao import importar_sob_demanda
+from .cache import CacheResultados
+from .dados import DadosTransporte, quantis_agrupados
+from .instrumentacao import instrumentado
+from .intervalos import limites_proporcao
+from .pesquisa import FontePesquisa, obter_pesquisa
+from .pontos import LIMITE_PONTOS_PADRAO, desenhar_pontos, resolver_modo
+from .renderizacao import (PERFIL_PADRAO, TarefaFigura, obter_perfil, renderizar,
+                           renderizar_figura)
+from .sla import CurvaSLA
+from .valores_criticos import cache_criticos
+
+# pandas é carregado apenas se ``dados`` for usado
+pd = importar_sob_demanda('pandas')
 
 warnings.filterwarnings('ignore')
 
-# Configuração para visualizações profissionais
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams.update({
+# Estilo das visualizações profissionais (aplicado a cada figura, sem
+# alterar os rcParams globais)
+ESTILO_EXECUTIVO = ('seaborn-v0_8-whitegrid', {
     'font.size': 12,
     'font.family': 'DejaVu Sans',
     'axes.titlesize': 14,
@@ -38,6 +60,13 @@ plt.rcParams.update({
     'grid.alpha': 0.3
 })
 
+# Opções de gravação das figuras executivas
+_OPCOES_SALVAR = {'facecolor': 'white', 'edgecolor': 'none'}
+
+# Cores para aplicativos além de A e B
+PALETA_COMPLEMENTAR = ['#3B8B5A', '#C73E1D', '#6C4F9E', '#8C6D31', '#1B998B',
+                       '#E86A92', '#5D737E', '#B5A33F', '#2F4858', '#D4804D']
+
 
 class VisualizacoesExecutivas:
     """
@@ -48,28 +77,54 @@ class VisualizacoesExecutivas:
     
     Attributes:
         dados (pd.DataFrame): DataFrame com os dados de tempo de espera
+        apps (list): Rótulos dos aplicativos
+        grupos (dict): Dados de cada aplicativo {app: np.array}
         app_a (np.array): Dados do aplicativo A
         app_b (np.array): Dados do aplicativo B
         cores (dict): Paleta de cores corporativas
         pesquisa (dict): Dados da pesquisa de satisfação
+        modo_pontos (str): Camada de pontos do boxplot ('auto', 'pontos',
+            'subamostra' ou 'faixa'; ver ``pontos``)
+        limite_pontos (int): Máximo de marcadores por aplicativo
+        semente (int): Semente do jitter e da subamostra dos pontos
     """
     
-    def __init__(self, dados_path: str, output_dir: str = "outputs"):
+    def __init__(self, dados_path: Union[str, DadosTransporte],
+                 output_dir: str = "outputs", pesquisa: FontePesquisa = None,
+                 cache: Optional[CacheResultados] = None, modo_pontos: str = 'auto',
+                 limite_pontos: int = LIMITE_PONTOS_PADRAO, semente: int = 42):
         """
         Inicializa com os dados de transporte.
         
         Args:
-            dados_path (str): Caminho para o arquivo CSV com os dados
+            dados_path (str | DadosTransporte): Caminho para o arquivo CSV com
+                os dados ou conjunto de dados já carregado
             output_dir (str): Diretório para salvar visualizações
+            pesquisa (dict | str | PesquisaAgregada): Aprovações e totais por
+                aplicativo ({app: {'aprovacoes': x, 'total': n}}), microdados
+                agregados ou caminho do CSV de respondentes; default: pesquisa A/B
+            cache (CacheResultados): Cache de figuras (opcional); sem cache,
+                todas as figuras são redesenhadas
+            modo_pontos (str): Camada de pontos do boxplot; 'auto' desenha
+                cada observação até ``limite_pontos`` por aplicativo e, acima
+                disso, uma subamostra estratificada que preserva as caudas
+            limite_pontos (int): Máximo de marcadores por aplicativo
+            semente (int): Semente do jitter e da subamostra (figura
+                reproduzível byte a byte)
         """
         self.output_dir = Path(output_dir)
+        self.cache = cache
+        self.modo_pontos = modo_pontos
+        self.limite_pontos = limite_pontos
+        self.semente = semente
         self.output_dir.mkdir(exist_ok=True)
         
-        self.dados = pd.read_csv(dados_path)
-        self.dados.columns = ['app', 'espera_min']
+        self.conjunto = DadosTransporte.obter(dados_path)
         
-        self.app_a = self.dados[self.dados['app'] == 'A']['espera_min'].values
-        self.app_b = self.dados[self.dados['app'] == 'B']['espera_min'].values
+        self.apps = self.conjunto.apps
+        self.grupos = self.conjunto.grupos
+        self.app_a = self.conjunto.grupo('A')
+        self.app_b = self.conjunto.grupo('B')
         
         # Paleta de cores corporativas
         self.cores = {
@@ -78,12 +133,18 @@ class VisualizacoesExecutivas:
             'destaque': '#F18F01', # Laranja para destaques
             'neutro': '#C5C3C6'   # Cinza neutro
         }
+        # Demais aplicativos recebem cores da paleta complementar
+        extras = [app for app in self.apps if app not in self.cores]
+        for app, cor in zip(extras, np.resize(PALETA_COMPLEMENTAR, len(extras))):
+            self.cores[app] = str(cor)
         
         # Dados da pesquisa de satisfação
-        self.pesquisa = {
-            'A': {'aprovacoes': 132, 'total': 150},
-            'B': {'aprovacoes': 120, 'total': 150}
-        }
+        self.pesquisa = obter_pesquisa(pesquisa)
+    
+    @property
+    def dados(self) -> pd.DataFrame:
+        """DataFrame (app, espera_min), construído apenas quando usado."""
+        return self.conjunto.dados
     
     def calcular_metricas_executivas(self) -> dict:
         """
@@ -94,36 +155,31 @@ class VisualizacoesExecutivas:
         """
         metricas = {}
         
-        # Métricas de tempo
+        # Métricas de tempo (todos os apps a partir de uma única ordenação)
+        estatisticas = self.conjunto.estatisticas_grupos()
         metricas['tempo'] = {
-            'A': {
-                'media': np.mean(self.app_a),
-                'mediana': np.median(self.app_a),
-                'p90': np.percentile(self.app_a, 90),
-                'dp': np.std(self.app_a, ddof=1),
-                'cv': np.std(self.app_a, ddof=1) / np.mean(self.app_a) * 100
-            },
-            'B': {
-                'media': np.mean(self.app_b),
-                'mediana': np.median(self.app_b),
-                'p90': np.percentile(self.app_b, 90),
-                'dp': np.std(self.app_b, ddof=1),
-                'cv': np.std(self.app_b, ddof=1) / np.mean(self.app_b) * 100
+            app: {
+                'media': st['media'],
+                'mediana': st['mediana'],
+                'p90': st['p90'],
+                'dp': st['dp'],
+                'cv': st['cv'] * 100
             }
+            for app, st in estatisticas.items()
         }
         
         # SLA (% atendimentos em até X minutos)
-        metricas['sla'] = {}
-        for limite in [5, 8, 10]:
-            metricas['sla'][f'{limite}min'] = {
-                'A': np.mean(self.app_a <= limite) * 100,
-                'B': np.mean(self.app_b <= limite) * 100
-            }
+        limites = [5, 8, 10]
+        tabela_sla = CurvaSLA.de_conjunto(self.conjunto).sla(limites) * 100
+        metricas['sla'] = {
+            f'{limite}min': {app: tabela_sla[i, k] for i, app in enumerate(self.apps)}
+            for k, limite in enumerate(limites)
+        }
         
         # Aprovação
         metricas['aprovacao'] = {
-            'A': self.pesquisa['A']['aprovacoes'] / self.pesquisa['A']['total'] * 100,
-            'B': self.pesquisa['B']['aprovacoes'] / self.pesquisa['B']['total'] * 100
+            app: p['aprovacoes'] / p['total'] * 100
+            for app, p in self.pesquisa.items()
         }
         
         return metricas
@@ -136,31 +192,69 @@ class VisualizacoesExecutivas:
         se = dp / np.sqrt(n)
         
         alpha = 1 - confianca
-        t_crit = t.ppf(1 - alpha/2, df=n-1)
+        t_crit = cache_criticos.t(1 - alpha/2, n-1)
         me = t_crit * se
         
         return {'media': media, 'margem_erro': me, 'li': media - me, 'ls': media + me}
     
-    def _calcular_ic_proporcao(self, x: int, n: int, confianca: float = 0.95) -> dict:
-        """Calcula IC para proporção."""
+    def _calcular_ic_proporcao(self, x: int, n: int, confianca: float = 0.95,
+                               metodo: str = 'wald') -> dict:
+        """Calcula IC para proporção (métodos de ``intervalos.limites_proporcao``)."""
+        li, ls = limites_proporcao(x, n, confianca, metodo)
+        # Margem de erro: maior distância da proporção a um dos limites
         p = x / n
-        alpha = 1 - confianca
-        z_crit = norm.ppf(1 - alpha/2)
-        se = np.sqrt(p * (1-p) / n)
-        me = z_crit * se
+        me = max(p - li, ls - p)
         
-        return {'proporcao': p, 'margem_erro': me, 'li': p - me, 'ls': p + me}
+        return {'proporcao': p, 'margem_erro': float(me), 'li': float(li), 'ls': float(ls)}
     
-    def dashboard_executivo(self) -> None:
-        """Cria dashboard executivo com métricas principais."""
-        fig = plt.figure(figsize=(16, 12))
+    def tarefas_figuras(self) -> list:
+        """
+        Figuras executivas como tarefas independentes de renderização.
+        
+        Returns:
+            list: [TarefaFigura do dashboard, TarefaFigura do boxplot]
+        """
+        return [
+            TarefaFigura('dashboard_executivo', self._desenhar_dashboard, (16, 12),
+                         ESTILO_EXECUTIVO, _OPCOES_SALVAR, self.conjunto.densidade.avaliar),
+            TarefaFigura('boxplot_executivo', self._desenhar_boxplot, (12, 8),
+                         ESTILO_EXECUTIVO, _OPCOES_SALVAR)
+        ]
+    
+    def chaves_figuras(self, tarefas: list, perfil: str = PERFIL_PADRAO) -> list:
+        """Chaves de cache das figuras (dados, pesquisa, pontos, tarefa e perfil)."""
+        perfil = obter_perfil(perfil)
+        return [self.cache.chave_figura(self.conjunto, tarefa, perfil, pesquisa=self.pesquisa,
+                                        pontos=(self.modo_pontos, self.limite_pontos,
+                                                self.semente))
+                for tarefa in tarefas]
+    
+    def dashboard_executivo(self, perfil: str = PERFIL_PADRAO) -> Path:
+        """
+        Cria dashboard executivo com métricas principais.
+        
+        Args:
+            perfil (str): Perfil de qualidade ('rascunho', 'tela',
+                'impressao' ou 'vetorial')
+        
+        Returns:
+            Path: Caminho do arquivo gerado
+        """
+        output_path = renderizar_figura(self.tarefas_figuras()[0], self.output_dir, perfil)
+        print(f"Dashboard executivo salvo em: {output_path}")
+        return output_path
+    
+    def _desenhar_dashboard(self, fig) -> None:
+        """Desenha o dashboard executivo na figura recebida."""
         gs = fig.add_gridspec(3, 4, hspace=0.3, wspace=0.3)
         
         metricas = self.calcular_metricas_executivas()
         
         # Título principal
+        total_pesquisa = sum(p['total'] for p in self.pesquisa.values())
         fig.suptitle('DASHBOARD EXECUTIVO - ANÁLISE COMPARATIVA DE APLICATIVOS DE TRANSPORTE\n' +
-                    'Apps A vs B | Dados: 90 observações | Pesquisa: 300 usuários',
+                    f"Apps {' vs '.join(self.apps)} | Dados: {len(self.conjunto)} observações | "
+                    f"Pesquisa: {total_pesquisa} usuários",
                     fontsize=18, fontweight='bold', y=0.95)
         
         # 1. Comparação de médias com IC
@@ -182,25 +276,16 @@ class VisualizacoesExecutivas:
         # 5. Resumo de KPIs
         ax5 = fig.add_subplot(gs[2, :])
         self._tabela_kpis(ax5, metricas)
-        
-        output_path = self.output_dir / 'dashboard_executivo.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        plt.close()
-        
-        print(f"Dashboard executivo salvo em: {output_path}")
     
     def _grafico_comparacao_medias(self, ax, metricas: dict) -> None:
         """Gráfico de comparação de médias com intervalos de confiança."""
-        apps = ['App A', 'App B']
-        medias = [metricas['tempo']['A']['media'], metricas['tempo']['B']['media']]
+        apps = [f'App {app}' for app in self.apps]
+        medias = [metricas['tempo'][app]['media'] for app in self.apps]
         
         # Calcular ICs 95%
-        ic_a = self._calcular_ic_media(self.app_a, 0.95)
-        ic_b = self._calcular_ic_media(self.app_b, 0.95)
-        
-        erros = [ic_a['margem_erro'], ic_b['margem_erro']]
-        cores = [self.cores['A'], self.cores['B']]
+        erros = [self._calcular_ic_media(self.grupos[app], 0.95)['margem_erro']
+                 for app in self.apps]
+        cores = [self.cores[app] for app in self.apps]
         
         bars = ax.bar(apps, medias, yerr=erros, capsize=8, color=cores, alpha=0.8,
                      edgecolor='black', linewidth=1)
@@ -215,36 +300,35 @@ class VisualizacoesExecutivas:
         ax.set_ylabel('Tempo (minutos)')
         ax.set_ylim(0, max(medias) + max(erros) + 1)
         
-        # Adicionar linha de diferença
+        # Adicionar linha de diferença (par de referência)
+        if len(medias) < 2:
+            return
         diff = medias[0] - medias[1]
         ax.text(0.5, max(medias) + max(erros) + 0.5, 
-               f'Diferença: {diff:+.2f} min\n(App A - App B)',
+               f'Diferença: {diff:+.2f} min\n(App {self.apps[0]} - App {self.apps[1]})',
                ha='center', va='center', fontsize=11, 
                bbox=dict(boxstyle="round,pad=0.3", facecolor=self.cores['destaque'], alpha=0.7))
     
     def _grafico_distribuicoes(self, ax) -> None:
         """Gráfico de distribuições sobrepostas."""
         # Histogramas
-        ax.hist(self.app_a, bins=15, alpha=0.6, color=self.cores['A'], 
-               label='App A', density=True, edgecolor='black', linewidth=0.5)
-        ax.hist(self.app_b, bins=15, alpha=0.6, color=self.cores['B'], 
-               label='App B', density=True, edgecolor='black', linewidth=0.5)
+        for app, dados in self.grupos.items():
+            ax.hist(dados, bins=15, alpha=0.6, color=self.cores[app], 
+                   label=f'App {app}', density=True, edgecolor='black', linewidth=0.5)
         
         # Curvas de densidade
-        x_range = np.linspace(min(min(self.app_a), min(self.app_b)), 
-                             max(max(self.app_a), max(self.app_b)), 100)
-        
-        kde_a = gaussian_kde(self.app_a)
-        kde_b = gaussian_kde(self.app_b)
+        # Grade padrão: a mesma das demais figuras (KDE calculado uma vez)
+        x_range = self.conjunto.densidade.grade_padrao()
         
-        ax.plot(x_range, kde_a(x_range), color=self.cores['A'], linewidth=3, alpha=0.8)
-        ax.plot(x_range, kde_b(x_range), color=self.cores['B'], linewidth=3, alpha=0.8)
+        densidades = self.conjunto.densidade.por_app(x_range)
+        for app, densidade in densidades.items():
+            ax.plot(x_range, densidade, color=self.cores[app], linewidth=3, alpha=0.8)
         
         # Linhas das médias
-        ax.axvline(np.mean(self.app_a), color=self.cores['A'], linestyle='--', 
-                  linewidth=2, alpha=0.8, label=f'Média A: {np.mean(self.app_a):.2f}')
-        ax.axvline(np.mean(self.app_b), color=self.cores['B'], linestyle='--', 
-                  linewidth=2, alpha=0.8, label=f'Média B: {np.mean(self.app_b):.2f}')
+        for app, dados in self.grupos.items():
+            media = np.mean(dados)
+            ax.axvline(media, color=self.cores[app], linestyle='--', 
+                      linewidth=2, alpha=0.8, label=f'Média {app}: {media:.2f}')
         
         ax.set_title('Distribuição dos Tempos de Espera', fontweight='bold')
         ax.set_xlabel('Tempo (minutos)')
@@ -254,17 +338,19 @@ class VisualizacoesExecutivas:
     def _grafico_sla(self, ax, metricas: dict) -> None:
         """Gráfico de SLA (Service Level Agreement)."""
         limites = ['5 min', '8 min', '10 min']
-        sla_a = [metricas['sla']['5min']['A'], metricas['sla']['8min']['A'], metricas['sla']['10min']['A']]
-        sla_b = [metricas['sla']['5min']['B'], metricas['sla']['8min']['B'], metricas['sla']['10min']['B']]
         
         x = np.arange(len(limites))
-        width = 0.35
+        width = 0.7 / len(self.apps)
         
-        bars1 = ax.bar(x - width/2, sla_a, width, label='App A', color=self.cores['A'], alpha=0.8)
-        bars2 = ax.bar(x + width/2, sla_b, width, label='App B', color=self.cores['B'], alpha=0.8)
+        grupos_barras = []
+        for i, app in enumerate(self.apps):
+            sla = [metricas['sla'][chave][app] for chave in ['5min', '8min', '10min']]
+            deslocamento = (i - (len(self.apps) - 1) / 2) * width
+            grupos_barras.append(ax.bar(x + deslocamento, sla, width, label=f'App {app}',
+                                        color=self.cores[app], alpha=0.8))
         
         # Adicionar valores nas barras
-        for bars in [bars1, bars2]:
+        for bars in grupos_barras:
             for bar in bars:
                 height = bar.get_height()
                 ax.text(bar.get_x() + bar.get_width()/2., height + 1,
@@ -280,15 +366,16 @@ class VisualizacoesExecutivas:
     
     def _grafico_aprovacao(self, ax, metricas: dict) -> None:
         """Gráfico de aprovação dos usuários."""
-        apps = ['App A', 'App B']
-        aprovacao = [metricas['aprovacao']['A'], metricas['aprovacao']['B']]
+        apps_pesquisa = list(self.pesquisa)
+        apps = [f'App {app}' for app in apps_pesquisa]
+        aprovacao = [metricas['aprovacao'][app] for app in apps_pesquisa]
         
         # Calcular ICs para proporções
-        ic_a = self._calcular_ic_proporcao(132, 150, 0.95)
-        ic_b = self._calcular_ic_proporcao(120, 150, 0.95)
-        
-        erros = [ic_a['margem_erro'] * 100, ic_b['margem_erro'] * 100]
-        cores = [self.cores['A'], self.cores['B']]
+        erros = [self._calcular_ic_proporcao(self.pesquisa[app]['aprovacoes'],
+                                             self.pesquisa[app]['total'],
+                                             0.95)['margem_erro'] * 100
+                 for app in apps_pesquisa]
+        cores = [self.cores.get(app, self.cores['neutro']) for app in apps_pesquisa]
         
         bars = ax.bar(apps, aprovacao, yerr=erros, capsize=8, color=cores, alpha=0.8,
                      edgecolor='black', linewidth=1)
@@ -304,6 +391,8 @@ class VisualizacoesExecutivas:
         ax.set_ylim(0, 100)
         
         # Adicionar diferença
+        if len(aprovacao) < 2:
+            return
         diff = aprovacao[0] - aprovacao[1]
         ax.text(0.5, 95, f'Diferença: {diff:+.1f} p.p.',
                ha='center', va='center', fontsize=11,
@@ -313,33 +402,35 @@ class VisualizacoesExecutivas:
         """Tabela resumo com KPIs principais."""
         ax.axis('off')
         
-        # Dados para a tabela
-        kpis = [
-            ['Métrica', 'App A', 'App B', 'Melhor', 'Diferença'],
-            ['Tempo Médio (min)', f"{metricas['tempo']['A']['media']:.2f}", 
-             f"{metricas['tempo']['B']['media']:.2f}", 'App B', 
-             f"{metricas['tempo']['A']['media'] - metricas['tempo']['B']['media']:+.2f}"],
-            ['Mediana (min)', f"{metricas['tempo']['A']['mediana']:.2f}", 
-             f"{metricas['tempo']['B']['mediana']:.2f}", 'App B', 
-             f"{metricas['tempo']['A']['mediana'] - metricas['tempo']['B']['mediana']:+.2f}"],
-            ['P90 (min)', f"{metricas['tempo']['A']['p90']:.2f}", 
-             f"{metricas['tempo']['B']['p90']:.2f}", 'App A', 
-             f"{metricas['tempo']['A']['p90'] - metricas['tempo']['B']['p90']:+.2f}"],
-            ['Coef. Variação (%)', f"{metricas['tempo']['A']['cv']:.1f}", 
-             f"{metricas['tempo']['B']['cv']:.1f}", 'App A', 
-             f"{metricas['tempo']['A']['cv'] - metricas['tempo']['B']['cv']:+.1f}"],
-            ['SLA 8min (%)', f"{metricas['sla']['8min']['A']:.1f}", 
-             f"{metricas['sla']['8min']['B']:.1f}", 'App B', 
-             f"{metricas['sla']['8min']['A'] - metricas['sla']['8min']['B']:+.1f}"],
-            ['Aprovação (%)', f"{metricas['aprovacao']['A']:.1f}", 
-             f"{metricas['aprovacao']['B']:.1f}", 'App A', 
-             f"{metricas['aprovacao']['A'] - metricas['aprovacao']['B']:+.1f}"]
+        # (rótulo, valores por app, formato, True se maior é melhor)
+        linhas = [
+            ('Tempo Médio (min)', {a: m['media'] for a, m in metricas['tempo'].items()}, '.2f', False),
+            ('Mediana (min)', {a: m['mediana'] for a, m in metricas['tempo'].items()}, '.2f', False),
+            ('P90 (min)', {a: m['p90'] for a, m in metricas['tempo'].items()}, '.2f', False),
+            ('Coef. Variação (%)', {a: m['cv'] for a, m in metricas['tempo'].items()}, '.1f', False),
+            ('SLA 8min (%)', metricas['sla']['8min'], '.1f', True),
+            ('Aprovação (%)', metricas['aprovacao'], '.1f', True)
         ]
         
+        # Dados para a tabela (diferença entre os dois primeiros apps)
+        app_x, app_y = (list(self.apps) + [None])[:2]
+        kpis = [['Métrica'] + [f'App {app}' for app in self.apps] + ['Melhor', 'Diferença']]
+        for rotulo, valores, fmt, maior_melhor in linhas:
+            # Apps sem valor (ex.: fora da pesquisa) aparecem como '-'
+            presentes = [app for app in self.apps if app in valores]
+            escolha = max if maior_melhor else min
+            melhor = f'App {escolha(presentes, key=valores.get)}' if presentes else '-'
+            diferenca = (f"{valores[app_x] - valores[app_y]:+{fmt}}"
+                         if app_x in valores and app_y in valores else '-')
+            kpis.append([rotulo]
+                        + [f"{valores[app]:{fmt}}" if app in valores else '-' for app in self.apps]
+                        + [melhor, diferenca])
+        
         # Criar tabela
+        largura_app = min(0.15, 0.6 / len(self.apps))
         table = ax.table(cellText=kpis[1:], colLabels=kpis[0], 
                         cellLoc='center', loc='center',
-                        colWidths=[0.25, 0.15, 0.15, 0.15, 0.15])
+                        colWidths=[0.25] + [largura_app] * len(self.apps) + [0.15, 0.15])
         
         # Formatação da tabela
         table.auto_set_font_size(False)
@@ -352,50 +443,76 @@ class VisualizacoesExecutivas:
             table[(0, i)].set_text_props(weight='bold', color='white')
         
         # Colorir coluna "Melhor"
+        col_melhor = len(self.apps) + 1
         for i in range(1, len(kpis)):
-            if 'App A' in kpis[i][3]:
-                table[(i, 3)].set_facecolor(self.cores['A'])
-                table[(i, 3)].set_text_props(color='white', weight='bold')
-            elif 'App B' in kpis[i][3]:
-                table[(i, 3)].set_facecolor(self.cores['B'])
-                table[(i, 3)].set_text_props(color='white', weight='bold')
+            melhor = kpis[i][col_melhor].removeprefix('App ')
+            if melhor == '-':
+                continue
+            table[(i, col_melhor)].set_facecolor(self.cores[melhor])
+            table[(i, col_melhor)].set_text_props(color='white', weight='bold')
         
         ax.set_title('RESUMO EXECUTIVO - INDICADORES-CHAVE DE PERFORMANCE (KPIs)', 
                     fontweight='bold', fontsize=14, pad=20)
     
-    def grafico_boxplot_executivo(self) -> None:
-        """Boxplot executivo com estatísticas."""
-        fig, ax = plt.subplots(figsize=(12, 8))
+    def grafico_boxplot_executivo(self, perfil: str = PERFIL_PADRAO) -> Path:
+        """
+        Boxplot executivo com estatísticas.
+        
+        Args:
+            perfil (str): Perfil de qualidade ('rascunho', 'tela',
+                'impressao' ou 'vetorial')
+        
+        Returns:
+            Path: Caminho do arquivo gerado
+        """
+        output_path = renderizar_figura(self.tarefas_figuras()[1], self.output_dir, perfil)
+        print(f"Boxplot executivo salvo em: {output_path}")
+        return output_path
+    
+    def _desenhar_boxplot(self, fig) -> None:
+        """Desenha o boxplot executivo na figura recebida."""
+        ax = fig.subplots()
         
         # Dados para boxplot
-        dados_plot = [self.app_a, self.app_b]
-        labels = ['App A', 'App B']
-        cores = [self.cores['A'], self.cores['B']]
+        dados_plot = list(self.grupos.values())
+        labels = [f'App {app}' for app in self.apps]
+        cores = [self.cores[app] for app in self.apps]
+        
+        # Camada de pontos de cada app; com pontos agregados, os outliers
+        # já aparecem nela (a subamostra preserva as caudas) e o boxplot
+        # não os desenha um a um
+        modos = [resolver_modo(len(dados), self.modo_pontos, self.limite_pontos)
+                 for dados in dados_plot]
         
         # Criar boxplot
-        bp = ax.boxplot(dados_plot, labels=labels, patch_artist=True, 
-                       notch=True, showmeans=True)
+        bp = ax.boxplot(dados_plot, patch_artist=True, 
+                       notch=True, showmeans=True,
+                       showfliers=all(modo == 'pontos' for modo in modos))
+        ax.set_xticks(range(1, len(labels) + 1), labels)
         
         # Colorir boxplots
         for patch, cor in zip(bp['boxes'], cores):
             patch.set_facecolor(cor)
             patch.set_alpha(0.7)
         
-        # Adicionar pontos individuais
-        for i, dados in enumerate(dados_plot):
-            y = dados
-            x = np.random.normal(i+1, 0.04, size=len(y))
-            ax.scatter(x, y, alpha=0.4, color=cores[i], s=20)
+        # Adicionar pontos individuais (agregados acima de limite_pontos;
+        # gerador novo a cada desenho para a figura ser reproduzível)
+        rng = np.random.default_rng(self.semente)
+        for i, (dados, modo) in enumerate(zip(dados_plot, modos)):
+            desenhar_pontos(ax, dados, i + 1, cores[i], rng, modo, self.limite_pontos)
         
-        # Adicionar estatísticas
+        # Adicionar estatísticas (quantis de todos os apps de uma vez)
+        quartis = quantis_agrupados(self.conjunto.espera, self.conjunto.offsets,
+                                    [0.25, 0.5, 0.75])
         stats_text = []
-        for i, (dados, label) in enumerate(zip(dados_plot, labels)):
+        for dados, label, (q1, mediana, q3), modo in zip(dados_plot, labels, quartis, modos):
             media = np.mean(dados)
-            mediana = np.median(dados)
-            q1 = np.percentile(dados, 25)
-            q3 = np.percentile(dados, 75)
             
             stats_text.append(f'{label}:\nMédia: {media:.2f}\nMediana: {mediana:.2f}\nQ1: {q1:.2f}\nQ3: {q3:.2f}')
+            if modo == 'subamostra':
+                stats_text[-1] += f'\nPontos: {self.limite_pontos} de {len(dados)}'
+            elif modo == 'faixa':
+                stats_text[-1] += f'\nPontos: densidade de {len(dados)}'
         
         # Adicionar texto com estatísticas
         ax.text(0.02, 0.98, '\n\n'.join(stats_text), transform=ax.transAxes,
@@ -408,27 +525,42 @@ class VisualizacoesExecutivas:
         ax.set_ylabel('Tempo de Espera (minutos)')
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        output_path = self.output_dir / 'boxplot_executivo.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        plt.close()
-        
-        print(f"Boxplot executivo salvo em: {output_path}")
+        fig.tight_layout()
     
-    def gerar_todas_visualizacoes(self) -> None:
-        """Gera todas as visualizações executivas."""
+    @instrumentado(categoria='pipeline')
+    def gerar_todas_visualizacoes(self, perfil: str = PERFIL_PADRAO,
+                                  n_jobs: int = 1) -> list:
+        """
+        Gera todas as visualizações executivas.
+        
+        Args:
+            perfil (str): Perfil de qualidade ('rascunho', 'tela',
+                'impressao' ou 'vetorial')
+            n_jobs (int): Processos usados para renderizar as figuras
+        
+        Returns:
+            list: Caminhos dos arquivos gerados
+        """
         print("Gerando visualizações executivas...")
         
-        # 1. Dashboard principal
-        self.dashboard_executivo()
-        print("✓ Dashboard executivo criado")
+        mensagens = {
+            'dashboard_executivo': ("Dashboard executivo", "✓ Dashboard executivo criado"),
+            'boxplot_executivo': ("Boxplot executivo", "✓ Boxplot executivo criado")
+        }
+        
+        def informar(tarefa, caminho):
+            salvo, criado = mensagens[tarefa.nome]
+            print(f"{salvo} salvo em: {caminho}")
+            print(criado)
         
-        # 2. Boxplot executivo
-        self.grafico_boxplot_executivo()
-        print("✓ Boxplot executivo criado")
+        # 1. Dashboard principal e 2. Boxplot executivo (figuras independentes)
+        tarefas = self.tarefas_figuras()
+        chaves = self.chaves_figuras(tarefas, perfil) if self.cache is not None else None
+        caminhos = renderizar(tarefas, self.output_dir, perfil, n_jobs,
+                              ao_concluir=informar, cache=self.cache, chaves=chaves)
         
         print(f"\nVisualizações salvas em: {self.output_dir}/")
+        return caminhos
 
 
 def main():